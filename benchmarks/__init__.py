@@ -0,0 +1 @@
+"""NASH Benchmarks - Latency and throughput measurements with local bittensor stand-ins."""
@@ -0,0 +1,119 @@
+"""
+NashMiner.forward latency and throughput at several concurrency levels.
+
+Each level keeps `concurrency` requests in flight on one event loop (as
+an axon would) and reports p50/p99 latency and requests per second.
+Requests are built like the validator's: ChallengeFactory challenges with
+the multi-party tensor attached, so the party path is what gets measured
+(`parties=False` sends flat intents only). Challenges are fresh, so the
+equilibrium cache only helps if a level deliberately repeats them
+(`repeat_fraction`).
+"""
+
+from benchmarks import stubs
+
+stubs.install()
+
+import asyncio
+import time
+from typing import Dict, Sequence
+
+import torch
+
+from nash.challenges import ChallengeBatch, ChallengeFactory
+from nash.miner import NashMiner
+from nash.protocol import NashSynapse
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """q-th percentile (0-100) of `samples`."""
+    return float(torch.quantile(torch.tensor(samples, dtype=torch.float64), q / 100.0))
+
+
+def _synapse(challenges: ChallengeBatch, index: int, trades: int, parties: bool) -> NashSynapse:
+    """The index-th request: `trades` consecutive challenges, as a validator sends them."""
+    rows = slice(index * trades, (index + 1) * trades)
+    synapse = NashSynapse(raw_intent=challenges.intents[rows])
+    mask = challenges.party_mask[rows]
+    if parties and bool((mask.sum(dim=1) > 1).any()):
+        synapse.set_parties(challenges.parties[rows], mask)
+    return synapse
+
+
+async def _run_level(
+    miner: NashMiner,
+    challenges: ChallengeBatch,
+    trades: int,
+    parties: bool,
+    concurrency: int,
+    requests: int,
+    timeout: float
+) -> Dict[str, float]:
+    latencies = []
+    cursor = iter(range(requests))
+    unique = len(challenges) // trades
+
+    async def worker():
+        for i in cursor:
+            synapse = _synapse(challenges, i % unique, trades, parties)
+            synapse.timeout = timeout
+            start = time.perf_counter()
+            await miner.forward(synapse)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": requests,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "mean_ms": sum(latencies) / len(latencies),
+        "throughput_rps": requests / elapsed,
+    }
+
+
+def run(
+    concurrency_levels: Sequence[int] = (1, 8, 32, 128),
+    requests: int = 2000,
+    warmup: int = 200,
+    repeat_fraction: float = 0.0,
+    timeout: float = 12.0,
+    seed: int = 0,
+    trades: int = 1,
+    parties: bool = True,
+    **miner_kwargs
+) -> Dict[str, dict]:
+    """
+    Benchmark NashMiner.forward; returns {"c<level>": metrics} per level.
+
+    `miner_kwargs` are passed to NashMiner (backend, precision, batching...).
+    Each request carries `trades` challenges. With `repeat_fraction` > 0
+    that share of requests reuses a small pool of challenges, exercising
+    the equilibrium cache.
+    """
+    torch.manual_seed(seed)
+    miner = NashMiner(**miner_kwargs)
+
+    unique = max(int(requests * (1.0 - repeat_fraction)), 1)
+    factory = ChallengeFactory(torch.device("cpu"), seed=seed)
+    challenges = factory.take(unique * trades)
+
+    async def main():
+        await _run_level(miner, challenges, trades, parties, max(concurrency_levels), warmup, timeout)
+        results = {}
+        for level in concurrency_levels:
+            if miner._cache is not None:
+                miner._cache.clear()
+            results[f"c{level}"] = await _run_level(
+                miner, challenges, trades, parties, level, requests, timeout
+            )
+        return results
+
+    return asyncio.run(main())
+
+
+if __name__ == "__main__":
+    import json
+    print(json.dumps(run(), indent=2))
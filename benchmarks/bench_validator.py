@@ -0,0 +1,93 @@
+"""
+NashValidator.forward round time at 256, 1024 and 4096 simulated miners.
+
+Miners answer instantly with canned responses, so the measurement is the
+validator's own overhead: challenge generation, fan-out, stacking,
+scoring, sybil detection, TWF and set_weights.
+"""
+
+from benchmarks import stubs
+
+stubs.install()
+
+import asyncio
+import tempfile
+import time
+from typing import Callable, Dict, Sequence
+
+import torch
+
+from nash.protocol import NashSynapse
+from nash.validator import NashValidator
+from benchmarks.bench_miner import percentile
+
+
+def canned_handlers(n: int, manifold_dim: int = 256, seed: int = 0) -> Dict[int, Callable]:
+    """Dendrite handlers answering each UID's queries with a fixed random response."""
+    generator = torch.Generator().manual_seed(seed)
+    manifolds = torch.randn(n, 1, manifold_dim, generator=generator)
+    equilibria = torch.rand(n, 1, 2, generator=generator)
+
+    def make(uid: int):
+        async def handler(synapse: NashSynapse) -> NashSynapse:
+            synapse.manifold_tensor = manifolds[uid]
+            synapse.equilibrium_point = equilibria[uid]
+            return synapse
+        return handler
+
+    return {uid: make(uid) for uid in range(n)}
+
+
+def run(
+    miner_counts: Sequence[int] = (256, 1024, 4096),
+    rounds: int = 10,
+    warmup: int = 2,
+    streaming: bool = True,
+    seed: int = 0
+) -> Dict[str, dict]:
+    """Benchmark validator rounds; returns {"n<miners>": metrics} per size."""
+    torch.manual_seed(seed)
+    results = {}
+
+    for n in miner_counts:
+        with tempfile.TemporaryDirectory() as state_dir:
+            validator = NashValidator(
+                twf_path=state_dir,
+                reveal_path=f"{state_dir}/reveals",
+                challenge_seed=seed,
+            )
+            validator.metagraph = stubs.Metagraph(n, seed=seed)
+            validator.dendrite = stubs.Dendrite(
+                handlers=canned_handlers(n, validator.scorer.manifold_dim, seed)
+            )
+            validator.streaming = streaming
+
+            async def main():
+                durations = []
+                for i in range(warmup + rounds):
+                    start = time.perf_counter()
+                    await validator.forward()
+                    if i >= warmup:
+                        durations.append((time.perf_counter() - start) * 1000)
+                return durations
+
+            try:
+                durations = asyncio.run(main())
+            finally:
+                validator.shutdown()
+
+            results[f"n{n}"] = {
+                "miners": n,
+                "rounds": rounds,
+                "p50_ms": percentile(durations, 50),
+                "p99_ms": percentile(durations, 99),
+                "mean_ms": sum(durations) / len(durations),
+                "weights_set": len(validator.subtensor.weights),
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    import json
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,137 @@
+"""
+Run the NASH benchmarks, write JSON results and compare against a baseline.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --output results.json --baseline baseline.json --tolerance 0.15
+
+The exit status is 1 if any metric regressed by more than `tolerance`
+relative to the baseline (latencies up, throughput down).
+"""
+
+from benchmarks import stubs
+
+stubs.install()
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import torch
+
+from benchmarks import bench_miner, bench_validator
+
+
+# Metric name suffix -> whether a larger value is better
+_DIRECTION = {"_ms": False, "_rps": True}
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> List[dict]:
+    """
+    Relative change of every shared metric; entries beyond `tolerance` in
+    the bad direction are flagged as regressions.
+    """
+    changes = []
+    for suite, cases in results["suites"].items():
+        for case, metrics in cases.items():
+            base_metrics = baseline.get("suites", {}).get(suite, {}).get(case, {})
+            for name, value in metrics.items():
+                higher_is_better = next(
+                    (better for suffix, better in _DIRECTION.items() if name.endswith(suffix)), None
+                )
+                base = base_metrics.get(name)
+                if higher_is_better is None or not base:
+                    continue
+                change = (value - base) / base
+                regressed = -change > tolerance if higher_is_better else change > tolerance
+                changes.append({
+                    "metric": f"{suite}.{case}.{name}",
+                    "baseline": base,
+                    "value": value,
+                    "change": change,
+                    "regressed": regressed,
+                })
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run NASH miner/validator benchmarks")
+    parser.add_argument("--output", default="benchmark-results.json", help="Where to write JSON results")
+    parser.add_argument("--baseline", default=None, help="Previous results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative regression")
+    parser.add_argument("--suite", choices=["miner", "validator", "all"], default="all")
+    parser.add_argument("--requests", type=int, default=2000, help="Miner requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--miners", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--rounds", type=int, default=10, help="Validator rounds per miner count")
+    parser.add_argument("--backend", default="eager", help="Miner inference backend")
+    parser.add_argument("--precision", default="fp32", help="Miner precision")
+    parser.add_argument("--workers", type=int, default=0, help="Miner inference worker processes (0: in-process)")
+    parser.add_argument("--trades", type=int, default=1, help="Challenges per miner request")
+    parser.add_argument("--flat", action="store_true", help="Send flat intents only, without the party tensor")
+    args = parser.parse_args()
+
+    suites: Dict[str, dict] = {}
+    start = time.perf_counter()
+    if args.suite in ("miner", "all"):
+        suites["miner"] = bench_miner.run(
+            concurrency_levels=args.concurrency,
+            requests=args.requests,
+            backend=args.backend,
+            precision=args.precision,
+            workers=args.workers,
+            trades=args.trades,
+            parties=not args.flat,
+        )
+    if args.suite in ("validator", "all"):
+        suites["validator"] = bench_validator.run(miner_counts=args.miners, rounds=args.rounds)
+
+    results = {
+        "meta": {
+            "revision": _git_revision(),
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "machine": platform.machine(),
+            "threads": torch.get_num_threads(),
+            "duration_s": time.perf_counter() - start,
+            "config": vars(args),
+        },
+        "suites": suites,
+    }
+
+    regressed = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            changes = compare(results, json.load(f), args.tolerance)
+        results["comparison"] = changes
+        regressed = [c for c in changes if c["regressed"]]
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    for suite, cases in suites.items():
+        for case, metrics in cases.items():
+            summary = ", ".join(f"{k}={v:.2f}" for k, v in metrics.items() if isinstance(v, float))
+            print(f"{suite:<10} {case:<8} {summary}")
+
+    for change in regressed:
+        print(f"REGRESSION {change['metric']}: {change['baseline']:.2f} -> {change['value']:.2f} "
+              f"({change['change']:+.1%})")
+    print(f"Wrote {args.output}")
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+In-process simulated subnet: validators against hundreds of local miners.
+
+Every miner is a real NashMiner. Queries travel over a fake transport
+that applies each miner's profile:
+
+- latency: lognormal network delay around `latency_ms` (sigma `jitter`)
+- drop_rate: probability a query never gets an answer
+- slow: adds `slow_ms` of extra delay (misses tight deadlines)
+- malicious: answers with random manifolds and equilibria
+- sybil: shares one model with the rest of its sybil group
+
+Weights are captured by the stub subtensor, so runs report emission
+outcomes per profile alongside round timings.
+
+Usage:
+    python -m benchmarks.simulate --miners 256 --validators 2 --rounds 20 \\
+        --slow 0.1 --malicious 0.05 --sybil 0.1 --drop-rate 0.02
+"""
+
+from benchmarks import stubs
+
+stubs.install()
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+import torch
+
+from nash.miner import NashMiner
+from nash.protocol import NashSynapse
+from nash.validator import NashValidator
+from benchmarks.bench_miner import percentile
+
+
+PROFILES = ("honest", "slow", "malicious", "sybil")
+
+
+@dataclass
+class MinerProfile:
+    """Transport and behaviour settings for one simulated miner."""
+    kind: str = "honest"
+    latency_ms: float = 20.0
+    jitter: float = 0.5
+    drop_rate: float = 0.0
+    slow_ms: float = 0.0
+
+
+class SimulatedTransport:
+    """
+    Dendrite handlers that delay, drop or corrupt queries per miner profile.
+
+    Handlers run the miner's forward after sleeping for the sampled
+    network delay, so validators see realistic arrival orders.
+    """
+
+    def __init__(self, miners: List[NashMiner], profiles: List[MinerProfile], seed: int = 0):
+        self.miners = miners
+        self.profiles = profiles
+        self.rng = random.Random(seed)
+        self.queries = 0
+        self.dropped = 0
+
+    def delay_seconds(self, profile: MinerProfile) -> float:
+        delay = self.rng.lognormvariate(0.0, profile.jitter) * profile.latency_ms + profile.slow_ms
+        return delay / 1000.0
+
+    def handler(self, uid: int):
+        miner, profile = self.miners[uid], self.profiles[uid]
+
+        async def handle(synapse: NashSynapse) -> NashSynapse:
+            self.queries += 1
+            if self.rng.random() < profile.drop_rate:
+                self.dropped += 1
+                raise ConnectionError("dropped")
+
+            # Half the delay on the way in, half on the way back
+            delay = self.delay_seconds(profile)
+            await asyncio.sleep(delay / 2)
+            if profile.kind == "malicious":
+                synapse.manifold_tensor = torch.randn(1, 256) * 10
+                synapse.equilibrium_point = torch.randn(1, 2) * 10
+            else:
+                synapse = await miner.forward(synapse)
+            await asyncio.sleep(delay / 2)
+            return synapse
+
+        return handle
+
+    def handlers(self) -> Dict[int, Callable]:
+        return {uid: self.handler(uid) for uid in range(len(self.miners))}
+
+
+def build_profiles(
+    n: int,
+    slow: float,
+    malicious: float,
+    sybil: float,
+    drop_rate: float,
+    latency_ms: float,
+    slow_ms: float,
+    seed: int
+) -> List[MinerProfile]:
+    """Assign profiles to n miners in the requested proportions (shuffled)."""
+    counts = {
+        "slow": int(n * slow),
+        "malicious": int(n * malicious),
+        "sybil": int(n * sybil),
+    }
+    kinds = [kind for kind, count in counts.items() for _ in range(count)]
+    kinds += ["honest"] * (n - len(kinds))
+    random.Random(seed).shuffle(kinds)
+    return [
+        MinerProfile(
+            kind=kind,
+            latency_ms=latency_ms,
+            drop_rate=drop_rate,
+            slow_ms=slow_ms if kind == "slow" else 0.0,
+        )
+        for kind in kinds
+    ]
+
+
+def build_miners(profiles: List[MinerProfile], seed: int, **miner_kwargs) -> List[NashMiner]:
+    """One NashMiner per profile; sybil miners share a single instance's weights."""
+    miners = []
+    sybil: Optional[NashMiner] = None
+    for uid, profile in enumerate(profiles):
+        torch.manual_seed(seed + uid)
+        if profile.kind == "sybil":
+            if sybil is None:
+                sybil = NashMiner(**miner_kwargs)
+            miners.append(sybil)
+        else:
+            miners.append(NashMiner(**miner_kwargs))
+    return miners
+
+
+def emission_by_profile(weights: List[float], uids: List[int], profiles: List[MinerProfile]) -> Dict[str, float]:
+    """Share of the last weight vector received by each profile kind."""
+    share = {kind: 0.0 for kind in PROFILES}
+    for uid, weight in zip(uids, weights):
+        share[profiles[uid].kind] += weight
+    return share
+
+
+async def simulate(
+    miners: int = 256,
+    validators: int = 1,
+    rounds: int = 20,
+    slow: float = 0.1,
+    malicious: float = 0.05,
+    sybil: float = 0.1,
+    drop_rate: float = 0.02,
+    latency_ms: float = 20.0,
+    slow_ms: float = 300.0,
+    query_timeout: float = 0.25,
+    concurrency: int = 4,
+    seed: int = 0,
+    **miner_kwargs
+) -> dict:
+    """
+    Run `validators` pipelined validators for `rounds` rounds each and
+    return timings, transport counters and emission shares per profile.
+    """
+    profiles = build_profiles(miners, slow, malicious, sybil, drop_rate, latency_ms, slow_ms, seed)
+    miner_neurons = build_miners(profiles, seed, **miner_kwargs)
+    transport = SimulatedTransport(miner_neurons, profiles, seed)
+    metagraph = stubs.Metagraph(miners, seed=seed)
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        neurons = []
+        for v in range(validators):
+            validator = NashValidator(
+                twf_path=f"{state_dir}/twf-{v}",
+                reveal_path=f"{state_dir}/reveals-{v}",
+                challenge_seed=seed + v,
+            )
+            validator.metagraph = metagraph
+            validator.dendrite = stubs.Dendrite(handlers=transport.handlers())
+            validator.query_timeout = query_timeout
+            neurons.append(validator)
+
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*[
+                validator.run_pipeline(
+                    concurrency=concurrency,
+                    commit_every=max(rounds // 2, 1),
+                    round_interval=0.0,
+                    num_rounds=rounds,
+                )
+                for validator in neurons
+            ])
+        finally:
+            for validator in neurons:
+                validator.shutdown()
+        elapsed = time.perf_counter() - start
+
+    results = {
+        "config": {
+            "miners": miners,
+            "validators": validators,
+            "rounds": rounds,
+            "query_timeout": query_timeout,
+            "concurrency": concurrency,
+            "profiles": {kind: sum(p.kind == kind for p in profiles) for kind in PROFILES},
+            "example_profile": asdict(profiles[0]),
+        },
+        "elapsed_s": elapsed,
+        "rounds_per_s": validators * rounds / elapsed,
+        "transport": {"queries": transport.queries, "dropped": transport.dropped},
+        "validators": [],
+    }
+
+    for validator in neurons:
+        latencies = validator.last_round_latencies
+        answered = latencies[~torch.isnan(latencies)].tolist() if latencies is not None else []
+        committed = validator.subtensor.weights
+        results["validators"].append({
+            "pipeline": validator.pipeline.stats(),
+            "response_p50_ms": percentile(answered, 50) if answered else None,
+            "response_p99_ms": percentile(answered, 99) if answered else None,
+            "weight_commits": len(committed),
+            "emission_share": (
+                emission_by_profile(committed[-1]["weights"], committed[-1]["uids"], profiles)
+                if committed else None
+            ),
+            "sybil": validator.sybil.stats(),
+            "twf": validator.twf.stats() if validator.twf is not None else None,
+        })
+
+    # Miner-side effects of the load (cache, batching, deadlines)
+    unique_miners = list({id(m): m for m in miner_neurons}.values())
+    results["miners"] = {
+        "fallbacks": sum(m.metrics.counters["fallbacks"] for m in unique_miners),
+        "cache_hits": sum(m.metrics.counters["cache_hits"] for m in unique_miners),
+        "deadline_misses": sum(m.metrics.counters["deadline_misses"] for m in unique_miners),
+    }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a NASH subnet in one process")
+    parser.add_argument("--miners", type=int, default=256)
+    parser.add_argument("--validators", type=int, default=1)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--slow", type=float, default=0.1, help="Fraction of slow miners")
+    parser.add_argument("--malicious", type=float, default=0.05, help="Fraction of random-answer miners")
+    parser.add_argument("--sybil", type=float, default=0.1, help="Fraction of miners sharing one model")
+    parser.add_argument("--drop-rate", type=float, default=0.02, help="Per-query drop probability")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Median network latency")
+    parser.add_argument("--slow-ms", type=float, default=300.0, help="Extra delay for slow miners")
+    parser.add_argument("--query-timeout", type=float, default=0.25, help="Validator query deadline (s)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Rounds in flight per validator")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Write JSON results here")
+    args = parser.parse_args()
+
+    results = asyncio.run(simulate(
+        miners=args.miners,
+        validators=args.validators,
+        rounds=args.rounds,
+        slow=args.slow,
+        malicious=args.malicious,
+        sybil=args.sybil,
+        drop_rate=args.drop_rate,
+        latency_ms=args.latency_ms,
+        slow_ms=args.slow_ms,
+        query_timeout=args.query_timeout,
+        concurrency=args.concurrency,
+        seed=args.seed,
+    ))
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
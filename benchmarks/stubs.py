@@ -0,0 +1,214 @@
+"""
+Local stand-ins for the parts of bittensor the NASH neurons use.
+
+install() registers a fake `bittensor` module in sys.modules, so it must
+run before anything under `nash` is imported:
+
+    from benchmarks import stubs
+    stubs.install()
+    from nash.miner import NashMiner
+
+The fakes cover: bt.Neuron (device, metagraph, dendrite, subtensor,
+wallet, config, context manager), bt.Synapse, bt.logging, and a
+dendrite that routes queries to in-process handlers.
+"""
+
+import asyncio
+import copy
+import sys
+import time
+import types
+from typing import Callable, Dict, List, Optional
+
+import torch
+
+
+# ============================================================================
+# bt.logging / bt.Synapse
+# ============================================================================
+
+class _Logging:
+    """Drops everything below `level` (debug < info < warning < error)."""
+
+    _LEVELS = {"debug": 0, "info": 1, "warning": 2, "error": 3}
+
+    def __init__(self, level: str = "error"):
+        self.level = level
+
+    def _log(self, level: str, message: str):
+        if self._LEVELS[level] >= self._LEVELS[self.level]:
+            print(f"[{level}] {message}", file=sys.stderr)
+
+    def debug(self, message: str):
+        self._log("debug", message)
+
+    def info(self, message: str):
+        self._log("info", message)
+
+    def warning(self, message: str):
+        self._log("warning", message)
+
+    def error(self, message: str):
+        self._log("error", message)
+
+
+class _SynapseMeta(type):
+    """Treats annotated class attributes as field defaults, like pydantic does."""
+
+    def __new__(mcs, name, bases, namespace):
+        namespace.pop("__slots__", None)
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class Synapse(metaclass=_SynapseMeta):
+    """Minimal bt.Synapse: keyword fields, a timeout and copy()."""
+
+    timeout: float = 12.0
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def copy(self) -> "Synapse":
+        return copy.copy(self)
+
+    def deserialize(self):
+        return self
+
+
+# ============================================================================
+# Network fakes
+# ============================================================================
+
+class AxonInfo:
+    """Endpoint of a simulated miner; `uid` routes queries to its handler."""
+
+    def __init__(self, uid: int, ip: str = "127.0.0.1", port: int = 8091):
+        self.uid = uid
+        self.ip = ip
+        self.port = port + uid
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AxonInfo) and (self.uid, self.ip, self.port) == (other.uid, other.ip, other.port)
+
+    def __repr__(self) -> str:
+        return f"AxonInfo(uid={self.uid}, {self.ip}:{self.port})"
+
+
+class Metagraph:
+    """n miners with distinct hotkeys, random stake and a block counter."""
+
+    def __init__(self, n: int, block: int = 1, seed: int = 0):
+        generator = torch.Generator().manual_seed(seed)
+        self.n = n
+        self.block = block
+        self.uids = torch.arange(n)
+        self.hotkeys = [f"hotkey-{uid}" for uid in range(n)]
+        self.axons = [AxonInfo(uid) for uid in range(n)]
+        self.S = torch.rand(n, generator=generator) * 1000
+
+    def reregister(self, uid: int):
+        """Give a UID a new hotkey and advance the block."""
+        self.hotkeys[uid] = f"hotkey-{uid}-{self.block}"
+        self.block += 1
+
+
+Handler = Callable[[Synapse], "asyncio.Future"]
+
+
+class Dendrite:
+    """
+    Routes queries to per-UID async handlers: `handler(synapse) -> synapse`.
+
+    Without a handler for a UID the default handler is used; with neither
+    the query returns the unanswered synapse.
+    """
+
+    def __init__(self, handlers: Optional[Dict[int, Handler]] = None, default: Optional[Handler] = None):
+        self.handlers = handlers or {}
+        self.default = default
+        self.queries = 0
+
+    async def call(self, target_axon: AxonInfo, synapse: Synapse, timeout: float = 12.0,
+                   deserialize: bool = True):
+        self.queries += 1
+        synapse.timeout = timeout
+        handler = self.handlers.get(target_axon.uid, self.default)
+        try:
+            if handler is not None:
+                synapse = await asyncio.wait_for(handler(synapse), timeout)
+        except Exception:
+            # Timeouts, drops and handler errors all look like no response
+            return None if deserialize else synapse
+        if not deserialize:
+            return synapse
+        try:
+            return synapse.deserialize()
+        except Exception:
+            return None
+
+    async def __call__(self, axons: List[AxonInfo], synapse: Synapse, deserialize: bool = True,
+                       timeout: float = 12.0):
+        return await asyncio.gather(*[
+            self.call(axon, synapse.copy(), timeout=timeout, deserialize=deserialize)
+            for axon in axons
+        ])
+
+
+class Subtensor:
+    """Records set_weights calls instead of submitting extrinsics."""
+
+    def __init__(self):
+        self.weights: List[dict] = []
+
+    def set_weights(self, netuid: int, wallet, uids: List[int], weights: List[float], **kwargs) -> bool:
+        self.weights.append({"time": time.time(), "netuid": netuid, "uids": list(uids), "weights": list(weights)})
+        return True
+
+
+class Neuron:
+    """
+    Minimal bt.Neuron on the CPU with an empty metagraph; harnesses replace
+    metagraph/dendrite/subtensor after construction.
+    """
+
+    def __init__(self):
+        self.device = torch.device("cpu")
+        self.config = types.SimpleNamespace(netuid=1)
+        self.wallet = types.SimpleNamespace(hotkey=types.SimpleNamespace(ss58_address="local"))
+        self.metagraph = Metagraph(0)
+        self.dendrite = Dendrite()
+        self.subtensor = Subtensor()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+# ============================================================================
+# Installation
+# ============================================================================
+
+logging = _Logging()
+
+
+def install(log_level: str = "error") -> types.ModuleType:
+    """Register the fake bittensor module (idempotent) and return it."""
+    existing = sys.modules.get("bittensor")
+    if existing is not None and getattr(existing, "__nash_stub__", False):
+        return existing
+
+    logging.level = log_level
+    module = types.ModuleType("bittensor")
+    module.__nash_stub__ = True
+    module.logging = logging
+    module.Synapse = Synapse
+    module.Neuron = Neuron
+    module.AxonInfo = AxonInfo
+    module.metagraph = Metagraph
+    module.dendrite = Dendrite
+    module.subtensor = Subtensor
+    sys.modules["bittensor"] = module
+    return module
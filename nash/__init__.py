@@ -0,0 +1,34 @@
+"""NASH - Inter-Subnet Settlement Layer for Bittensor."""
+
+import importlib
+import typing
+
+__version__ = "0.1.0"
+
+# Public names -> defining module. Imported on first access (PEP 562), so
+# `import nash` stays cheap and doesn't load bittensor/torch until needed.
+_LAZY_IMPORTS = {
+    "NashSynapse": "nash.protocol",
+    "NashMiner": "nash.miner",
+    "NashValidator": "nash.validator",
+}
+
+__all__ = ["NashSynapse", "NashMiner", "NashValidator"]
+
+if typing.TYPE_CHECKING:
+    from nash.protocol import NashSynapse
+    from nash.miner import NashMiner
+    from nash.validator import NashValidator
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,59 @@
+"""
+Process side of nash.workers.InferencePool.
+
+Spawned workers import this module and unpickle the models from
+nash.models, so neither may pull in bittensor: workers start without the
+neuron stack (and without paying for its import).
+"""
+
+import torch
+import torch.nn as nn
+from typing import List, Optional, Tuple
+
+
+# Slot kinds: which encoder a slot's rows are for
+INTENT = 0
+PARTY = 1
+
+
+def worker_main(
+    worker_id: int,
+    models: List[Tuple[nn.Module, nn.Module, Optional[nn.Module]]],
+    widths: Tuple[int, int],
+    intents: torch.Tensor,
+    manifolds: torch.Tensor,
+    equilibria: torch.Tensor,
+    rows: torch.Tensor,
+    kinds: torch.Tensor,
+    versions: torch.Tensor,
+    current: torch.Tensor,
+    requests,
+    responses,
+    num_threads: int,
+):
+    """Worker process loop: serve slot indices until a None arrives."""
+    torch.set_num_threads(num_threads)
+    while True:
+        slot = requests.get()
+        if slot is None:
+            break
+        # Lets the front-end fail this slot if the process dies mid-request
+        current[worker_id] = slot
+        error = None
+        try:
+            # The model copy the slot was submitted against, not the newest:
+            # a reload never loads into a copy that still has requests
+            encoder, solver, party_encoder = models[int(versions[slot])]
+            kind = int(kinds[slot])
+            if kind == PARTY:
+                encoder = party_encoder
+            n = int(rows[slot])
+            with torch.no_grad():
+                manifold = encoder(intents[slot, :n, :widths[kind]])
+                equilibrium = solver(manifold)
+            manifolds[slot, :n] = manifold
+            equilibria[slot, :n] = equilibrium
+        except Exception as e:
+            error = f"worker {worker_id}: {e}"
+        current[worker_id] = -1
+        responses.put((slot, error))
@@ -0,0 +1,111 @@
+"""
+NASH Axon Cache - Incremental metagraph view for the validator.
+
+Rebuilding the axon list from the metagraph on a timer both wastes work
+and serves stale axons between rebuilds. The AxonCache is keyed on the
+metagraph block: when the block moves it diffs hotkeys and axon endpoints
+and patches only the UIDs that changed, keeping UID -> index arrays
+ready so per-round score tensors line up without rebuilding lists.
+
+Optimizations:
+- Unchanged block: a single integer comparison
+- Changed block: one pass of hotkey/endpoint comparisons, patches only where needed
+- Precomputed uid / uid_to_index tensors
+"""
+
+import bittensor as bt
+import torch
+from typing import List, Optional
+
+
+class AxonCache:
+    """
+    Axons, hotkeys and UID index arrays synced incrementally from a metagraph.
+
+    After sync(), `axons[i]` is the axon for `uids[i]`, and
+    `uid_to_index[uid]` gives i (or -1 for unknown UIDs).
+    """
+
+    def __init__(self):
+        self.block: Optional[int] = None
+        self.uids: List[int] = []
+        self.axons: List = []
+        self.hotkeys: List[str] = []
+        self.uid_tensor = torch.empty(0, dtype=torch.long)
+        self.uid_to_index = torch.empty(0, dtype=torch.long)
+
+        # Counters
+        self.syncs = 0
+        self.patched_uids = 0
+        self.reregistered_uids = 0
+
+    def __len__(self) -> int:
+        return len(self.uids)
+
+    def sync(self, metagraph) -> List[int]:
+        """
+        Bring the cache up to date with `metagraph`.
+
+        Returns the UIDs whose hotkey changed (new registrations), so
+        per-UID state such as TWF can be reset for them.
+        """
+        block = int(metagraph.block)
+        if block == self.block:
+            return []
+
+        uids = [int(uid) for uid in metagraph.uids]
+        hotkeys = list(metagraph.hotkeys)
+        n = len(uids)
+
+        if uids != self.uids:
+            # The UID set itself changed (subnet grew/shrank): rebuild indices
+            old_hotkeys = dict(zip(self.uids, self.hotkeys))
+            reregistered = [
+                uid for uid, hotkey in zip(uids, hotkeys)
+                if uid in old_hotkeys and old_hotkeys[uid] != hotkey
+            ]
+            self.axons = [metagraph.axons[i] for i in range(n)]
+            patched = n
+            self._index(uids)
+        else:
+            # Same UIDs: only touch rows whose hotkey or endpoint moved
+            reregistered = []
+            patched = 0
+            for i in range(n):
+                axon = metagraph.axons[i]
+                if hotkeys[i] != self.hotkeys[i]:
+                    reregistered.append(uids[i])
+                elif axon == self.axons[i]:
+                    continue
+                self.axons[i] = axon
+                patched += 1
+
+        self.hotkeys = hotkeys
+        self.block = block
+        self.syncs += 1
+        self.patched_uids += patched
+        self.reregistered_uids += len(reregistered)
+
+        if patched:
+            bt.logging.debug(
+                f"Axon cache synced at block {block}: {patched} patched, "
+                f"{len(reregistered)} re-registered"
+            )
+        return reregistered
+
+    def _index(self, uids: List[int]):
+        self.uids = uids
+        self.uid_tensor = torch.tensor(uids, dtype=torch.long)
+        size = max(uids) + 1 if uids else 0
+        self.uid_to_index = torch.full((size,), -1, dtype=torch.long)
+        self.uid_to_index[self.uid_tensor] = torch.arange(len(uids))
+
+    def stats(self) -> dict:
+        """Counters for monitoring."""
+        return {
+            "block": self.block,
+            "uids": len(self.uids),
+            "syncs": self.syncs,
+            "patched_uids": self.patched_uids,
+            "reregistered_uids": self.reregistered_uids,
+        }
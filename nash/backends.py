@@ -0,0 +1,311 @@
+"""
+NASH Inference Backends - Selectable execution engines for the miner.
+
+The miner's IntentEncoder and EquilibriumSolver are fused into a single
+graph and run through one of:
+
+- eager:       plain PyTorch modules (reference)
+- torchscript: traced, frozen and optimized TorchScript graph
+- compile:     torch.compile of the fused graph
+- onnx:        exported ONNX graph run on onnxruntime's CPU provider
+
+Every backend supports warmup (so the first live request is not slow) and
+a parity check against the eager reference. Built graphs can be
+serialized into a warm-start snapshot and restored without re-tracing
+or re-exporting.
+"""
+
+import bittensor as bt
+import torch
+import torch.nn as nn
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import io
+import os
+import tempfile
+import time
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    # Fallback if onnxruntime not available
+    ort = None
+
+
+class FusedMinerModel(nn.Module):
+    """Encoder -> solver as one module so it can be traced/compiled/exported as a unit."""
+
+    def __init__(self, encoder: nn.Module, solver: nn.Module):
+        super().__init__()
+        self.encoder = encoder
+        self.solver = solver
+
+    def forward(self, intent: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        manifold = self.encoder(intent)
+        return manifold, self.solver(manifold)
+
+
+class InferenceBackend:
+    """
+    Eager PyTorch backend and base class for the others.
+
+    Calling the backend with a [B, input_dim] intent batch returns
+    ([B, manifold_dim], [B, 2]) tensors on `device`.
+    """
+
+    name = "eager"
+
+    def __init__(self, encoder: nn.Module, solver: nn.Module, device: torch.device, input_dim: int = 10):
+        self.device = device
+        self.input_dim = input_dim
+        self.model = FusedMinerModel(encoder, solver).eval()
+
+        # Optional (stage, seconds) callback; only eager can time encode and solve separately
+        self.observe: Optional[Callable[[str, float], None]] = None
+
+    def __call__(self, intent: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        with torch.no_grad():
+            if self.observe is None:
+                return self.model(intent)
+
+            start = time.perf_counter()
+            manifold = self.model.encoder(intent)
+            encoded = time.perf_counter()
+            equilibrium = self.model.solver(manifold)
+            self.observe("encode", encoded - start)
+            self.observe("solve", time.perf_counter() - encoded)
+            return manifold, equilibrium
+
+    def serialize(self) -> Optional[bytes]:
+        """Built graph as bytes for restore(); None if there is nothing to save."""
+        return None
+
+    @classmethod
+    def restore(
+        cls,
+        encoder: nn.Module,
+        solver: nn.Module,
+        device: torch.device,
+        data: Optional[bytes],
+        input_dim: int = 10,
+        **options
+    ) -> "InferenceBackend":
+        """
+        Rebuild a backend from serialize() output (default: build from scratch).
+
+        `options` are the backend's extra constructor arguments (e.g. the
+        onnx backend's num_threads), applied to the restored backend too.
+        """
+        return cls(encoder, solver, device, input_dim, **options)
+
+    def _example(self, batch_size: int) -> torch.Tensor:
+        return torch.randn(batch_size, self.input_dim, device=self.device)
+
+    def warmup(self, batch_sizes: Iterable[int] = (1, 64), iterations: int = 3):
+        """Run a few dummy batches so lazy init, JIT and allocator costs are paid up front."""
+        for batch_size in batch_sizes:
+            example = self._example(batch_size)
+            for _ in range(iterations):
+                self(example)
+
+    def parity_check(
+        self,
+        reference: "InferenceBackend",
+        batch_size: int = 16,
+        atol: float = 1e-4
+    ) -> Dict[str, float]:
+        """
+        Compare this backend's outputs with `reference` on random intents.
+
+        Returns max absolute errors and whether both are within `atol`.
+        """
+        example = self._example(batch_size)
+        manifold, equilibrium = self(example)
+        ref_manifold, ref_equilibrium = reference(example)
+
+        manifold_error = (manifold.float() - ref_manifold.float()).abs().max().item()
+        equilibrium_error = (equilibrium.float() - ref_equilibrium.float()).abs().max().item()
+        return {
+            "manifold_max_abs_error": manifold_error,
+            "equilibrium_max_abs_error": equilibrium_error,
+            "passed": manifold_error <= atol and equilibrium_error <= atol,
+        }
+
+
+class TorchScriptBackend(InferenceBackend):
+    """Traced + frozen TorchScript graph, removing per-layer Python dispatch."""
+
+    name = "torchscript"
+
+    def __init__(self, encoder: nn.Module, solver: nn.Module, device: torch.device, input_dim: int = 10):
+        super().__init__(encoder, solver, device, input_dim)
+        with torch.no_grad():
+            traced = torch.jit.trace(self.model, self._example(1))
+            self.graph = torch.jit.optimize_for_inference(torch.jit.freeze(traced))
+
+    def serialize(self) -> Optional[bytes]:
+        buffer = io.BytesIO()
+        torch.jit.save(self.graph, buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def restore(cls, encoder, solver, device, data, input_dim=10, **options):
+        if data is None:
+            return cls(encoder, solver, device, input_dim, **options)
+        backend = cls.__new__(cls)
+        InferenceBackend.__init__(backend, encoder, solver, device, input_dim)
+        backend.graph = torch.jit.load(io.BytesIO(data), map_location=device)
+        return backend
+
+    def __call__(self, intent: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        with torch.no_grad():
+            return self.graph(intent)
+
+
+class CompileBackend(InferenceBackend):
+    """torch.compile of the fused graph with dynamic batch size."""
+
+    name = "compile"
+
+    def __init__(self, encoder: nn.Module, solver: nn.Module, device: torch.device, input_dim: int = 10):
+        super().__init__(encoder, solver, device, input_dim)
+        self.compiled = torch.compile(self.model, dynamic=True)
+
+    def __call__(self, intent: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        with torch.no_grad():
+            return self.compiled(intent)
+
+
+class OnnxBackend(InferenceBackend):
+    """
+    Fused graph exported to ONNX and run on onnxruntime (CPU).
+
+    The graph is exported to `export_path` if given, otherwise to a private
+    mkstemp file that is removed once the session is open; the session and
+    serialize() work from the exported bytes.
+    """
+
+    name = "onnx"
+
+    def __init__(
+        self,
+        encoder: nn.Module,
+        solver: nn.Module,
+        device: torch.device,
+        input_dim: int = 10,
+        export_path: Optional[str] = None,
+        num_threads: Optional[int] = None,
+    ):
+        if ort is None:
+            raise ImportError("onnxruntime is required for the onnx backend")
+        if torch.device(device).type != "cpu":
+            raise ValueError(f"onnx backend only supports CPU, got device {device}")
+
+        super().__init__(encoder, solver, device, input_dim)
+        self.num_threads = num_threads
+
+        # mkstemp creates the file 0600 under a unique name, so nothing else
+        # can pre-create or swap the graph between export and load
+        temporary = export_path is None
+        if temporary:
+            fd, export_path = tempfile.mkstemp(prefix="nash_miner_", suffix=".onnx")
+            os.close(fd)
+        try:
+            with torch.no_grad():
+                torch.onnx.export(
+                    self.model,
+                    (self._example(1),),
+                    export_path,
+                    input_names=["intent"],
+                    output_names=["manifold", "equilibrium"],
+                    dynamic_axes={
+                        "intent": {0: "batch"},
+                        "manifold": {0: "batch"},
+                        "equilibrium": {0: "batch"},
+                    },
+                )
+            with open(export_path, "rb") as f:
+                self.graph_bytes = f.read()
+        finally:
+            if temporary:
+                os.remove(export_path)
+
+        self.session = self._open_session(self.graph_bytes, num_threads)
+
+    @staticmethod
+    def _open_session(graph: bytes, num_threads: Optional[int] = None):
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        return ort.InferenceSession(graph, sess_options=options, providers=["CPUExecutionProvider"])
+
+    def serialize(self) -> Optional[bytes]:
+        return self.graph_bytes
+
+    @classmethod
+    def restore(cls, encoder, solver, device, data, input_dim=10, num_threads=None):
+        if data is None:
+            return cls(encoder, solver, device, input_dim, num_threads=num_threads)
+        if ort is None:
+            raise ImportError("onnxruntime is required for the onnx backend")
+        backend = cls.__new__(cls)
+        InferenceBackend.__init__(backend, encoder, solver, device, input_dim)
+        backend.num_threads = num_threads
+        backend.graph_bytes = data
+        backend.session = cls._open_session(data, num_threads)
+        return backend
+
+    def __call__(self, intent: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        manifold, equilibrium = self.session.run(
+            None, {"intent": intent.detach().float().contiguous().numpy()}
+        )
+        return torch.from_numpy(manifold), torch.from_numpy(equilibrium)
+
+
+BACKENDS = {
+    InferenceBackend.name: InferenceBackend,
+    TorchScriptBackend.name: TorchScriptBackend,
+    CompileBackend.name: CompileBackend,
+    OnnxBackend.name: OnnxBackend,
+}
+
+
+def build_backend(
+    name: str,
+    encoder: nn.Module,
+    solver: nn.Module,
+    device: torch.device,
+    input_dim: int = 10,
+    warmup_batch_sizes: Iterable[int] = (1, 64),
+    parity_atol: float = 1e-4,
+) -> Tuple[InferenceBackend, Optional[Dict[str, float]]]:
+    """
+    Build, warm up and verify an inference backend.
+
+    Falls back to eager if the requested backend can't be built or fails
+    the parity check. Returns the backend and the parity report (None for eager).
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown inference backend {name!r}, expected one of {list(BACKENDS)}")
+
+    eager = InferenceBackend(encoder, solver, device, input_dim)
+    if name == InferenceBackend.name:
+        eager.warmup(warmup_batch_sizes)
+        return eager, None
+
+    try:
+        backend = BACKENDS[name](encoder, solver, device, input_dim)
+        backend.warmup(warmup_batch_sizes)
+        parity = backend.parity_check(eager, atol=parity_atol)
+    except Exception as e:
+        bt.logging.error(f"Failed to build {name} backend, falling back to eager: {e}")
+        eager.warmup(warmup_batch_sizes)
+        return eager, None
+
+    if not parity["passed"]:
+        bt.logging.error(f"{name} backend failed parity check ({parity}), falling back to eager")
+        eager.warmup(warmup_batch_sizes)
+        return eager, parity
+
+    bt.logging.info(f"Using {name} inference backend (parity: {parity})")
+    return backend, parity
@@ -0,0 +1,187 @@
+"""
+NASH Request Batching - Coalesces concurrent miner requests.
+
+When many validators query a miner in the same block, running the encoder
+and solver once per synapse pays the full per-call overhead every time.
+The RequestBatcher collects requests that arrive within a short window,
+stacks them into a single batch and runs one inference pass.
+
+Optimizations:
+- Single encode+solve pass per window instead of per request
+- Flush early as soon as the batch is full
+- Requests grouped by intent width so mismatched inputs never block a batch
+- Optional executor keeps inference off the event loop so callers can
+  enforce deadlines; requests cancelled before their batch starts are
+  dropped, and a queued batch whose callers have all given up is skipped
+- Callers' deadlines travel with the batch, so `infer_fn` can stop
+  waiting once the last of them has passed
+"""
+
+import bittensor as bt
+import torch
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import time
+
+
+InferenceFn = Callable[..., Tuple[torch.Tensor, torch.Tensor]]
+
+# (intent, future, deadline in time.monotonic() seconds or None)
+_Request = Tuple[torch.Tensor, asyncio.Future, Optional[float]]
+
+
+class RequestBatcher:
+    """
+    Collects intents submitted within `window_seconds` (or until
+    `max_batch_size` is reached) and runs them through `infer_fn` together.
+
+    `infer_fn` takes a [B, D] intent batch and returns a tuple of
+    ([B, manifold_dim], [B, 2]) tensors. Each caller receives the rows
+    that correspond to the intent it submitted. With an `executor`,
+    `infer_fn` runs there instead of on the event loop. When every request
+    in a batch was submitted with a timeout, `infer_fn` is also passed
+    `timeout=`: the seconds left until the latest of their deadlines.
+    """
+
+    def __init__(
+        self,
+        infer_fn: InferenceFn,
+        max_batch_size: int = 64,
+        window_seconds: float = 0.002,
+        executor: Optional[Executor] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+        if window_seconds < 0:
+            raise ValueError(f"window_seconds must be >= 0, got {window_seconds}")
+
+        self._infer_fn = infer_fn
+        self._executor = executor
+        self.max_batch_size = max_batch_size
+        self.window_seconds = window_seconds
+
+        self._pending: List[_Request] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Simple counters for debugging batch efficiency
+        self.batches_run = 0
+        self.batches_dropped = 0
+        self.requests_served = 0
+
+    async def submit(
+        self,
+        intent: torch.Tensor,
+        timeout: Optional[float] = None
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Queue an [N, D] intent and wait for its (manifold, equilibrium) rows.
+        
+        `timeout` is the caller's remaining budget in seconds; it is handed
+        on to infer_fn (the caller still enforces it with asyncio.wait_for).
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._pending.append((intent, future, deadline))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Run every pending request through one inference pass per intent width."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        # Group by feature width so a malformed intent can't poison the batch
+        groups: Dict[int, List[_Request]] = {}
+        for request in pending:
+            groups.setdefault(request[0].shape[-1], []).append(request)
+
+        for group in groups.values():
+            self._run_group(group)
+
+    def _run_group(self, group: List[_Request]):
+        """Stack a group, run inference once and hand each future its rows."""
+        # Callers that gave up (deadline passed) before the batch started are dropped
+        group = [request for request in group if not request[1].cancelled()]
+        if not group:
+            return
+
+        try:
+            batch = torch.cat([intent for intent, _, _ in group], dim=0)
+            if self._executor is None:
+                self._distribute(group, self._infer(group, batch))
+                return
+        except Exception as e:
+            self._fail(group, e)
+            return
+
+        task = asyncio.get_running_loop().run_in_executor(self._executor, self._run_batch, group, batch)
+        task.add_done_callback(lambda done: self._on_done(group, done))
+
+    def _run_batch(
+        self,
+        group: List[_Request],
+        batch: torch.Tensor
+    ) -> Optional[Tuple[torch.Tensor, torch.Tensor]]:
+        """
+        Executor side of a batch. Returns None without running inference if
+        every caller timed out while the batch waited for a thread (reading
+        a future's state from another thread is a plain attribute read).
+        """
+        if all(future.done() for _, future, _ in group):
+            return None
+        return self._infer(group, batch)
+
+    def _infer(self, group: List[_Request], batch: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Call infer_fn, passing the time left until the group's last deadline."""
+        deadlines = [deadline for _, _, deadline in group]
+        if None in deadlines:
+            return self._infer_fn(batch)
+        return self._infer_fn(batch, timeout=max(max(deadlines) - time.monotonic(), 0.0))
+
+    def _on_done(self, group: List[_Request], done: asyncio.Future):
+        if done.cancelled():
+            self._fail(group, asyncio.CancelledError())
+        elif done.exception() is not None:
+            self._fail(group, done.exception())
+        elif done.result() is None:
+            self.batches_dropped += 1
+        else:
+            self._distribute(group, done.result())
+
+    def _fail(self, group: List[_Request], error: BaseException):
+        bt.logging.error(f"Batched inference failed for {len(group)} requests: {error}")
+        for _, future, _ in group:
+            if not future.done():
+                future.set_exception(error)
+
+    def _distribute(
+        self,
+        group: List[_Request],
+        result: Tuple[torch.Tensor, torch.Tensor]
+    ):
+        manifolds, equilibria = result
+        self.batches_run += 1
+        self.requests_served += len(group)
+
+        offset = 0
+        for intent, future, _ in group:
+            rows = intent.shape[0]
+            if not future.done():
+                # Clone so each synapse serializes only its own rows, not the whole batch
+                future.set_result((
+                    manifolds[offset:offset + rows].clone(),
+                    equilibria[offset:offset + rows].clone(),
+                ))
+            offset += rows
@@ -0,0 +1,260 @@
+"""
+NASH Equilibrium Cache - Reuses solutions for repeated intents.
+
+Validators send many near-identical challenges and real agents repeat the
+same orders. The EquilibriumCache keys results on a quantized intent plus a
+hash of the synapse context, so a repeat is answered without running the
+encoder or solver.
+
+Optimizations:
+- O(1) exact lookups via quantized keys in an LRU-ordered dict
+- Optional nearest-neighbour mode: one vectorized scan over a
+  preallocated [capacity, intent_dim] slot matrix; single-row intents of
+  any width up to intent_dim (flat intents, packed party rows) are
+  searched among rows of their own width
+- TTL expiry checked lazily on access
+- peek() answers deadline fallbacks without touching counters or LRU order
+"""
+
+import torch
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, List, Optional, Tuple
+import json
+import time
+
+
+@dataclass
+class _CacheEntry:
+    """A cached solution and the slot holding its intent for tolerance search."""
+    manifold: torch.Tensor
+    equilibrium: torch.Tensor
+    slot: int
+    expires_at: float
+
+
+class EquilibriumCache:
+    """
+    Bounded LRU/TTL cache mapping (intent, context) to (manifold, equilibrium).
+
+    Args:
+        capacity: Maximum number of entries before LRU eviction
+        ttl_seconds: Lifetime of an entry (<= 0 disables expiry)
+        quantization: Step used to quantize intents into exact-match keys
+        tolerance: If > 0, an exact miss falls back to the closest stored
+            intent with the same context whose max abs difference is within
+            this tolerance
+        intent_dim: Widest single-row intent eligible for tolerance search
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        ttl_seconds: float = 30.0,
+        quantization: float = 1e-3,
+        tolerance: float = 0.0,
+        intent_dim: int = 10,
+    ):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        if quantization <= 0:
+            raise ValueError(f"quantization must be > 0, got {quantization}")
+
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self.quantization = quantization
+        self.tolerance = tolerance
+        self.intent_dim = intent_dim
+
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+
+        # Slot storage for nearest-neighbour search
+        self._slot_intents = torch.zeros(capacity, intent_dim)
+        self._slot_contexts = torch.zeros(capacity, dtype=torch.int64)
+        self._slot_widths = torch.zeros(capacity, dtype=torch.int64)
+        self._slot_expires = torch.zeros(capacity, dtype=torch.float64)
+        self._slot_occupied = torch.zeros(capacity, dtype=torch.bool)
+        self._slot_keys: List[Optional[Hashable]] = [None] * capacity
+        self._free_slots = list(range(capacity - 1, -1, -1))
+
+        # Counters
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def context_hash(context: Optional[dict]) -> int:
+        """Stable-within-process hash of a synapse context dict."""
+        if not context:
+            return 0
+        return hash(json.dumps(context, sort_keys=True, default=str))
+
+    def _key(self, intent: torch.Tensor, context_hash: int) -> Hashable:
+        quantized = torch.round(intent / self.quantization).to(torch.int64)
+        return (context_hash, tuple(intent.shape), quantized.numpy().tobytes())
+
+    def get(
+        self,
+        intent: torch.Tensor,
+        context: Optional[dict] = None,
+        tolerance: Optional[float] = None
+    ) -> Optional[Tuple[torch.Tensor, torch.Tensor]]:
+        """
+        Return the cached (manifold, equilibrium) for an intent, or None.
+
+        The tensors are copies; callers may modify them without touching the
+        cache. `tolerance` overrides the configured nearest-neighbour
+        tolerance. Exact and nearest-neighbour hits are counted separately
+        (hits / near_hits).
+        """
+        tolerance = self.tolerance if tolerance is None else tolerance
+        intent = intent.detach().float().cpu()
+        ctx = self.context_hash(context)
+        key = self._key(intent, ctx)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None and self._expired(entry, now):
+            self._remove(key)
+            self.expirations += 1
+            entry = None
+
+        if entry is not None:
+            self.hits += 1
+        elif tolerance > 0 and self._searchable(intent):
+            key, entry = self._nearest(intent.flatten(), ctx, now, tolerance)
+            if entry is not None:
+                self.near_hits += 1
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.manifold.clone(), entry.equilibrium.clone()
+
+    def peek(
+        self,
+        intent: torch.Tensor,
+        context: Optional[dict],
+        tolerance: float
+    ) -> Optional[Tuple[torch.Tensor, torch.Tensor]]:
+        """
+        Closest live entry within `tolerance`, like get(), but without
+        counting a hit or miss, refreshing LRU order or evicting expired
+        entries. Used for deadline fallbacks.
+        """
+        intent = intent.detach().float().cpu()
+        ctx = self.context_hash(context)
+        now = time.monotonic()
+
+        entry = self._entries.get(self._key(intent, ctx))
+        if entry is None or self._expired(entry, now):
+            entry = None
+            if tolerance > 0 and self._searchable(intent):
+                _, entry = self._nearest(intent.flatten(), ctx, now, tolerance)
+        if entry is None:
+            return None
+        return entry.manifold.clone(), entry.equilibrium.clone()
+
+    def put(
+        self,
+        intent: torch.Tensor,
+        context: Optional[dict],
+        manifold: torch.Tensor,
+        equilibrium: torch.Tensor
+    ):
+        """Store a solution, evicting the least recently used entry when full."""
+        intent = intent.detach().float().cpu()
+        ctx = self.context_hash(context)
+        key = self._key(intent, ctx)
+
+        if key in self._entries:
+            self._remove(key)
+        while len(self._entries) >= self.capacity:
+            oldest, _ = next(iter(self._entries.items()))
+            self._remove(oldest)
+            self.evictions += 1
+
+        slot = self._free_slots.pop()
+        if self._searchable(intent):
+            width = intent.numel()
+            self._slot_intents[slot, :width] = intent.flatten()
+            self._slot_intents[slot, width:] = 0
+            self._slot_contexts[slot] = ctx
+            self._slot_widths[slot] = width
+            self._slot_occupied[slot] = True
+        self._slot_keys[slot] = key
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else float("inf")
+        self._slot_expires[slot] = expires_at
+        self._entries[key] = _CacheEntry(
+            manifold=manifold.detach().clone(),
+            equilibrium=equilibrium.detach().clone(),
+            slot=slot,
+            expires_at=expires_at,
+        )
+
+    def clear(self):
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+        self._slot_occupied.zero_()
+        self._slot_keys = [None] * self.capacity
+        self._free_slots = list(range(self.capacity - 1, -1, -1))
+
+    def stats(self) -> dict:
+        """Counters for monitoring and get_model_info()."""
+        lookups = self.hits + self.near_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": (self.hits + self.near_hits) / lookups if lookups else 0.0,
+        }
+
+    def _searchable(self, intent: torch.Tensor) -> bool:
+        """Single-row intents that fit the slot matrix take part in tolerance search."""
+        return intent.dim() > 0 and 0 < intent.numel() <= self.intent_dim and intent.numel() == intent.shape[-1]
+
+    def _expired(self, entry: _CacheEntry, now: float) -> bool:
+        return now >= entry.expires_at
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._slot_occupied[entry.slot] = False
+        self._slot_keys[entry.slot] = None
+        self._free_slots.append(entry.slot)
+
+    def _nearest(self, intent: torch.Tensor, ctx: int, now: float, tolerance: float):
+        """
+        Closest live same-context, same-width entry within tolerance (max
+        abs difference). Expired entries are skipped, so a stale closer
+        entry never hides a live one.
+        """
+        width = intent.numel()
+        candidates = (
+            self._slot_occupied
+            & (self._slot_contexts == ctx)
+            & (self._slot_widths == width)
+            & (self._slot_expires > now)
+        )
+        if not candidates.any():
+            return None, None
+
+        distance = (self._slot_intents[:, :width] - intent).abs().amax(dim=1)
+        distance = torch.where(candidates, distance, torch.full_like(distance, float("inf")))
+        best_distance, best_slot = distance.min(dim=0)
+        if best_distance.item() > tolerance:
+            return None, None
+
+        key = self._slot_keys[best_slot.item()]
+        return key, self._entries[key]
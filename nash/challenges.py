@@ -0,0 +1,264 @@
+"""
+NASH Challenge Factory - Challenges generated ahead of demand.
+
+Building a challenge used to sit on the round's hot path: a torch.randn
+per round, then a 32-dim commitment vector assembled from a Python list
+with .item() host syncs and random.random(). The factory moves all of it
+to a producer thread that fills a ring of ready challenges (flat intent,
+commitments, padded party tensor and mask) a whole batch at a time; a
+validation round only dequeues what it sends.
+
+Optimizations:
+- Preallocated ring on the scoring device, one copy per produced batch
+- Commitments built for the whole batch with tensor ops (no .item())
+- Seeded torch.Generator / numpy Generator, so a given seed always
+  yields the same challenge sequence
+- Inline production if the ring runs dry, so rounds never block on an
+  idle producer
+"""
+
+import bittensor as bt
+import torch
+from dataclasses import dataclass
+from typing import Optional
+import threading
+
+from nash.protocol import PARTY_FEATURES
+
+try:
+    import numpy as np
+    from nash.solver import MAX_PARTIES, random_problems
+except ImportError:
+    np = None
+    random_problems = None
+    MAX_PARTIES = 6
+
+
+INTENT_DIM = 10
+COMMITMENT_DIM = 32
+COMMITMENT_PARTIES = 4
+
+
+@dataclass
+class ChallengeBatch:
+    """B challenges: what miners are sent and the commitments validators see."""
+    intents: torch.Tensor       # [B, 10] flat intents
+    commitments: torch.Tensor   # [B, 32]
+    parties: torch.Tensor       # [B, P, PARTY_FEATURES], zero-padded
+    party_mask: torch.Tensor    # [B, P] bool
+
+    def __len__(self) -> int:
+        return self.intents.shape[0]
+
+
+def parties_from_intents(intents: torch.Tensor, generator: Optional[torch.Generator] = None) -> torch.Tensor:
+    """
+    Build [B, PARTY_FEATURES] party rows from [B, intent_dim] intents.
+
+    Used when no solver is available. Layout matches PartyBatch.features:
+    [price, quantity, latency, region, buyer, seller, deferrer, time_horizon].
+    """
+    batch = intents.shape[0]
+    sides = (torch.rand(batch, 2, generator=generator, device=intents.device) > 0.5).to(intents.dtype)
+    party = torch.zeros(batch, PARTY_FEATURES, dtype=intents.dtype, device=intents.device)
+    party[:, 0] = intents[:, 0]          # price
+    party[:, 1] = intents[:, 1].abs()    # quantity
+    party[:, 2] = 0.5                    # latency
+    party[:, 4:6] = sides                # buyer, seller (region US, deferrer 0)
+    party[:, 7] = 0.5                    # time_horizon
+    return party
+
+
+def commitments_from_intents(intents: torch.Tensor, generator: Optional[torch.Generator] = None) -> torch.Tensor:
+    """Build [B, 32] commitment vectors: the intent's party repeated 4 times."""
+    return parties_from_intents(intents, generator).repeat(1, COMMITMENT_PARTIES)
+
+
+class ChallengeFactory:
+    """
+    Ring of pregenerated challenges filled by a background producer.
+
+    Args:
+        device: Device the dequeued tensors live on
+        capacity: Ring size in challenges
+        batch_size: Challenges produced per batch
+        seed: Seed for the challenge streams (None: nondeterministic)
+        use_solver: Generate multi-party problems with nash.solver when
+            available, otherwise random intents
+    """
+
+    def __init__(
+        self,
+        device: torch.device,
+        capacity: int = 1024,
+        batch_size: int = 128,
+        seed: Optional[int] = None,
+        use_solver: bool = True,
+    ):
+        if batch_size < 1 or capacity < batch_size:
+            raise ValueError(f"Need 1 <= batch_size <= capacity, got {batch_size} and {capacity}")
+
+        self.device = device
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.seed = seed
+        self.use_solver = use_solver and random_problems is not None
+
+        # Generation happens on the CPU so a seed means the same stream on any device
+        self._generator = torch.Generator()
+        if seed is None:
+            self._generator.seed()
+        else:
+            self._generator.manual_seed(seed)
+        self._rng = np.random.default_rng(seed) if self.use_solver else None
+
+        self._intents = torch.empty(capacity, INTENT_DIM, device=device)
+        self._commitments = torch.empty(capacity, COMMITMENT_DIM, device=device)
+        self._parties = torch.empty(capacity, MAX_PARTIES, PARTY_FEATURES, device=device)
+        self._party_mask = torch.empty(capacity, MAX_PARTIES, dtype=torch.bool, device=device)
+        self._head = 0   # next row to read
+        self._size = 0   # rows ready
+
+        self.produced = 0
+        self.consumed = 0
+        self.stalls = 0
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        # Serializes the generators between the producer and inline fills
+        self._produce_lock = threading.Lock()
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def start(self):
+        """Start the producer thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="nash-challenges", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        with self._changed:
+            self._changed.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _generate(self, batch_size: int) -> ChallengeBatch:
+        """One batch of challenges on the CPU."""
+        if self.use_solver:
+            problems = random_problems(batch_size, self._rng, max_parties=MAX_PARTIES)
+            return ChallengeBatch(
+                intents=torch.from_numpy(problems.intents(INTENT_DIM)),
+                commitments=torch.from_numpy(problems.commitments(COMMITMENT_PARTIES)),
+                parties=torch.from_numpy(problems.features()),
+                party_mask=torch.from_numpy(problems.mask),
+            )
+
+        # Without the solver every challenge is a single party
+        intents = torch.randn(batch_size, INTENT_DIM, generator=self._generator)
+        party = parties_from_intents(intents, self._generator)
+        parties = torch.zeros(batch_size, MAX_PARTIES, PARTY_FEATURES)
+        parties[:, 0] = party
+        party_mask = torch.zeros(batch_size, MAX_PARTIES, dtype=torch.bool)
+        party_mask[:, 0] = True
+        return ChallengeBatch(
+            intents=intents,
+            commitments=party.repeat(1, COMMITMENT_PARTIES),
+            parties=parties,
+            party_mask=party_mask,
+        )
+
+    def _produce(self) -> bool:
+        """Generate one batch and append it; False if the ring has no room."""
+        with self._produce_lock:
+            with self._lock:
+                if self.capacity - self._size < self.batch_size:
+                    return False
+            batch = self._generate(self.batch_size)
+
+            with self._changed:
+                # Appends are serialized by _produce_lock and consumers only free
+                # rows, so the room checked above is still there
+                index = (self._head + self._size + torch.arange(self.batch_size)) % self.capacity
+                index = index.to(self.device)
+                self._intents[index] = batch.intents.to(self.device, non_blocking=True)
+                self._commitments[index] = batch.commitments.to(self.device, non_blocking=True)
+                self._parties[index] = batch.parties.to(self.device, non_blocking=True)
+                self._party_mask[index] = batch.party_mask.to(self.device, non_blocking=True)
+                self._size += self.batch_size
+                self.produced += self.batch_size
+                self._changed.notify_all()
+            return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self._produce():
+                    continue
+            except Exception as e:
+                bt.logging.error(f"Challenge production failed: {e}")
+                self._stop.wait(1.0)
+                continue
+            # Ring full: wait for a consumer to free a batch worth of rows
+            with self._changed:
+                self._changed.wait_for(
+                    lambda: self._stop.is_set() or self.capacity - self._size >= self.batch_size,
+                    timeout=0.5,
+                )
+
+    def take(self, count: int) -> ChallengeBatch:
+        """
+        Dequeue `count` challenges (owned copies, safe to keep after the
+        ring rows are reused).
+        """
+        chunks = []
+        while count > 0:
+            with self._changed:
+                available = min(count, self._size)
+                if available:
+                    index = (self._head + torch.arange(available)) % self.capacity
+                    index = index.to(self.device)
+                    chunks.append(ChallengeBatch(
+                        intents=self._intents[index],
+                        commitments=self._commitments[index],
+                        parties=self._parties[index],
+                        party_mask=self._party_mask[index],
+                    ))
+                    self._head = (self._head + available) % self.capacity
+                    self._size -= available
+                    self.consumed += available
+                    count -= available
+                    self._changed.notify_all()
+                    continue
+            # Ring empty: the producer is behind (or not running), fill inline
+            self.stalls += 1
+            self._produce()
+
+        if len(chunks) == 1:
+            return chunks[0]
+        return ChallengeBatch(
+            intents=torch.cat([c.intents for c in chunks]),
+            commitments=torch.cat([c.commitments for c in chunks]),
+            parties=torch.cat([c.parties for c in chunks]),
+            party_mask=torch.cat([c.party_mask for c in chunks]),
+        )
+
+    def next(self) -> ChallengeBatch:
+        """Dequeue a single challenge."""
+        return self.take(1)
+
+    def stats(self) -> dict:
+        return {
+            "ready": self._size,
+            "capacity": self.capacity,
+            "produced": self.produced,
+            "consumed": self.consumed,
+            "stalls": self.stalls,
+            "solver": self.use_solver,
+        }
@@ -0,0 +1,258 @@
+"""
+NASH Checkpoints - Memory-mapped weights and live hot-reload.
+
+Weights are stored in the safetensors layout, so files are interchangeable
+with the `safetensors` library:
+
+    [header length u64 LE][JSON header][raw tensor bytes]
+
+where the header maps each tensor name to {dtype, shape, data_offsets}
+and "__metadata__" holds string key/values. Loading memory-maps the file
+copy-on-write and builds tensors as views onto it: nothing is read until
+a page is touched and nothing is copied until it is written. Modules take
+the views with load_state_dict(..., assign=True) so the weights stay
+zero-copy. save_checkpoint records a SHA-256 of the tensor bytes in the
+metadata, so a checkpoint is identified without reading its data pages.
+
+CheckpointWatcher polls a path from a daemon thread and hands each new
+version to a callback, which builds fresh modules and swaps them in with
+a single reference assignment so in-flight requests finish on the old
+weights.
+
+Usage:
+    python -m nash.checkpoint convert models/validator_model.pt models/validator_model.safetensors
+"""
+
+import bittensor as bt
+import torch
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+
+# safetensors dtype codes
+_DTYPES = {
+    torch.float64: "F64",
+    torch.float32: "F32",
+    torch.float16: "F16",
+    torch.bfloat16: "BF16",
+    torch.int64: "I64",
+    torch.int32: "I32",
+    torch.int16: "I16",
+    torch.int8: "I8",
+    torch.uint8: "U8",
+    torch.bool: "BOOL",
+}
+_CODES = {code: dtype for dtype, code in _DTYPES.items()}
+
+_HEADER_LENGTH = struct.Struct("<Q")
+
+# Metadata key holding the SHA-256 of the tensor data, written by save_checkpoint
+_DIGEST_KEY = "sha256"
+
+
+@dataclass
+class Checkpoint:
+    """Tensors loaded from a checkpoint file, its metadata and a content fingerprint."""
+    tensors: Dict[str, torch.Tensor]
+    metadata: Dict[str, str]
+    fingerprint: str
+
+
+def save_checkpoint(path: str, tensors: Dict[str, torch.Tensor], metadata: Optional[Dict[str, object]] = None):
+    """Write tensors atomically (write-then-rename) in the safetensors layout."""
+    header: Dict[str, object] = {}
+    payloads = []
+    digest = hashlib.sha256()
+    offset = 0
+    for name, tensor in tensors.items():
+        tensor = tensor.detach().cpu().contiguous()
+        if tensor.dtype not in _DTYPES:
+            raise ValueError(f"Unsupported dtype {tensor.dtype} for tensor {name!r}")
+        data = tensor.reshape(-1).view(torch.uint8).numpy().tobytes() if tensor.numel() else b""
+        header[name] = {
+            "dtype": _DTYPES[tensor.dtype],
+            "shape": list(tensor.shape),
+            "data_offsets": [offset, offset + len(data)],
+        }
+        payloads.append(data)
+        digest.update(data)
+        offset += len(data)
+
+    header["__metadata__"] = {str(k): str(v) for k, v in (metadata or {}).items()}
+    header["__metadata__"][_DIGEST_KEY] = digest.hexdigest()
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    # Pad so tensor data starts 8-byte aligned
+    header_bytes += b" " * (-len(header_bytes) % 8)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        for data in payloads:
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, device: Optional[torch.device] = None) -> Checkpoint:
+    """
+    Memory-map a checkpoint and return tensors viewing the mapping.
+
+    With a non-CPU `device` the tensors are copied there.
+
+    Raises:
+        ValueError: If the file is not a valid checkpoint.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    if len(mapped) < _HEADER_LENGTH.size:
+        raise ValueError(f"{path} is too short to be a checkpoint")
+    (header_length,) = _HEADER_LENGTH.unpack_from(mapped, 0)
+    data_start = _HEADER_LENGTH.size + header_length
+    if data_start > len(mapped):
+        raise ValueError(f"{path} has a truncated header")
+
+    header = json.loads(bytes(mapped[_HEADER_LENGTH.size:data_start]).decode("utf-8"))
+    metadata = header.pop("__metadata__", {}) or {}
+
+    tensors: Dict[str, torch.Tensor] = {}
+    for name, info in header.items():
+        dtype = _CODES.get(info["dtype"])
+        if dtype is None:
+            raise ValueError(f"Unsupported dtype {info['dtype']!r} for tensor {name!r}")
+        begin, end = info["data_offsets"]
+        if data_start + end > len(mapped):
+            raise ValueError(f"Tensor {name!r} extends past the end of {path}")
+
+        count = (end - begin) // torch.empty((), dtype=dtype).element_size()
+        if count:
+            tensor = torch.frombuffer(mapped, dtype=dtype, count=count, offset=data_start + begin)
+        else:
+            tensor = torch.empty(0, dtype=dtype)
+        tensor = tensor.view(info["shape"])
+        if device is not None and torch.device(device).type != "cpu":
+            tensor = tensor.to(device)
+        tensors[name] = tensor
+
+    # Files written elsewhere carry no digest: identify them by header and
+    # file identity instead of reading every data page
+    fingerprint = metadata.get(_DIGEST_KEY)
+    if fingerprint is None:
+        st = os.stat(path)
+        identity = f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8")
+        fingerprint = hashlib.sha256(bytes(mapped[:data_start]) + identity).hexdigest()
+    return Checkpoint(tensors=tensors, metadata=metadata, fingerprint=fingerprint)
+
+
+def split_prefix(tensors: Dict[str, torch.Tensor], prefix: str) -> Dict[str, torch.Tensor]:
+    """Sub-dict of tensors under `prefix.` with the prefix stripped."""
+    prefix = prefix + "."
+    return {name[len(prefix):]: tensor for name, tensor in tensors.items() if name.startswith(prefix)}
+
+
+class CheckpointWatcher:
+    """
+    Polls `path` and calls `on_change(checkpoint)` for every new version.
+
+    Writers must replace the file atomically (save_checkpoint does). A
+    version whose callback raises is not retried until the file changes
+    again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        on_change: Callable[[Checkpoint], None],
+        interval: float = 1.0,
+        device: Optional[torch.device] = None,
+    ):
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+        self.device = device
+
+        self.reloads = 0
+        self.failures = 0
+        self._version: Optional[Tuple[int, int, int]] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def start(self, skip_current: bool = False):
+        """Start polling; with skip_current the file as it is now is not reported."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if skip_current:
+            self._version = self._stat()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="nash-checkpoint-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def poll(self) -> bool:
+        """Check once; returns True if a new version was loaded and applied."""
+        version = self._stat()
+        if version is None or version == self._version:
+            return False
+        self._version = version
+
+        try:
+            checkpoint = load_checkpoint(self.path, self.device)
+            self.on_change(checkpoint)
+        except Exception as e:
+            self.failures += 1
+            bt.logging.error(f"Failed to reload checkpoint {self.path}: {e}")
+            return False
+
+        self.reloads += 1
+        bt.logging.info(f"Reloaded checkpoint {self.path} ({checkpoint.fingerprint[:12]})")
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self.interval)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="NASH checkpoint utilities")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    convert = subparsers.add_parser("convert", help="Convert a torch.save checkpoint to the mmap format")
+    convert.add_argument("source", help="torch.save file (raw state dict or {'model_state_dict': ...})")
+    convert.add_argument("target", help="Output .safetensors path")
+    args = parser.parse_args()
+
+    state = torch.load(args.source, map_location="cpu")
+    metadata = {k: v for k, v in state.items() if k != "model_state_dict" and not isinstance(v, dict)}
+    tensors = state.get("model_state_dict", state)
+    save_checkpoint(args.target, tensors, metadata)
+    print(f"Wrote {len(tensors)} tensors to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+NASH Synthetic Dataset - Offline ground-truth generation for the validator.
+
+Generates synthetic settlement problems across all cores, solves them with
+the batched NashSolver and writes fixed-width, memory-mapped shards that a
+trainer can stream without copying. pretrain() fits the validator's
+CommitmentModel on them and writes a checkpoint the validator loads at
+startup (in production mode).
+
+Record layout (float32, one row per problem):
+    [intent (10) | commitments (32) | targets (4)]
+
+Usage:
+    python -m nash.dataset --output data/synthetic --samples 1000000 --workers 16
+    python -m nash.dataset --output data/synthetic --samples 1000000 \
+        --pretrain models/validator_model.pt --epochs 3
+
+Optimizations:
+- One process per shard via ProcessPoolExecutor
+- Problems generated and solved in vectorized chunks
+- Shards are .npy files opened with mmap, batches are zero-copy views
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from nash.solver import NashSolver, random_problems
+
+
+INTENT_DIM = 10
+COMMITMENT_DIM = 32
+TARGET_DIM = 4
+RECORD_WIDTH = INTENT_DIM + COMMITMENT_DIM + TARGET_DIM
+
+INTENT_COLUMNS = slice(0, INTENT_DIM)
+COMMITMENT_COLUMNS = slice(INTENT_DIM, INTENT_DIM + COMMITMENT_DIM)
+TARGET_COLUMNS = slice(INTENT_DIM + COMMITMENT_DIM, RECORD_WIDTH)
+
+MANIFEST_NAME = "manifest.json"
+
+
+# ============================================================================
+# Generation
+# ============================================================================
+
+@dataclass
+class ShardSpec:
+    """Work item for a single generator process."""
+    path: str
+    rows: int
+    seed: np.random.SeedSequence
+    chunk_size: int = 65536
+
+
+def _generate_shard(spec: ShardSpec) -> Tuple[str, int]:
+    """Generate, solve and write one shard. Runs inside a worker process."""
+    rng = np.random.default_rng(spec.seed)
+    solver = NashSolver()
+
+    tmp_path = spec.path + ".tmp"
+    shard = np.lib.format.open_memmap(
+        tmp_path, mode="w+", dtype=np.float32, shape=(spec.rows, RECORD_WIDTH)
+    )
+
+    for start in range(0, spec.rows, spec.chunk_size):
+        stop = min(start + spec.chunk_size, spec.rows)
+        problems = random_problems(stop - start, rng)
+        settlements = solver.solve_batch(problems)
+
+        shard[start:stop, INTENT_COLUMNS] = problems.intents(INTENT_DIM)
+        shard[start:stop, COMMITMENT_COLUMNS] = problems.commitments()
+        shard[start:stop, TARGET_COLUMNS] = settlements.targets(problems.mask)
+
+    shard.flush()
+    del shard
+    os.replace(tmp_path, spec.path)
+    return os.path.basename(spec.path), spec.rows
+
+
+def generate_dataset(
+    output_dir: str,
+    num_samples: int,
+    shard_size: int = 262144,
+    workers: Optional[int] = None,
+    seed: int = 0
+) -> dict:
+    """
+    Generate `num_samples` solved problems into shards under `output_dir`.
+
+    Shards are produced in parallel and are reproducible for a given seed.
+    Returns the manifest that is also written to `output_dir/manifest.json`.
+    """
+    if num_samples < 1 or shard_size < 1:
+        raise ValueError("num_samples and shard_size must be >= 1")
+
+    os.makedirs(output_dir, exist_ok=True)
+    num_shards = (num_samples + shard_size - 1) // shard_size
+    seeds = np.random.SeedSequence(seed).spawn(num_shards)
+
+    specs = [
+        ShardSpec(
+            path=os.path.join(output_dir, f"shard-{i:05d}.npy"),
+            rows=min(shard_size, num_samples - i * shard_size),
+            seed=seeds[i],
+        )
+        for i in range(num_shards)
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        shards = list(pool.map(_generate_shard, specs))
+
+    manifest = {
+        "record_width": RECORD_WIDTH,
+        "columns": {
+            "intent": [INTENT_COLUMNS.start, INTENT_COLUMNS.stop],
+            "commitments": [COMMITMENT_COLUMNS.start, COMMITMENT_COLUMNS.stop],
+            "targets": [TARGET_COLUMNS.start, TARGET_COLUMNS.stop],
+        },
+        "seed": seed,
+        "num_samples": num_samples,
+        "shards": [{"file": name, "rows": rows} for name, rows in shards],
+    }
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+class ShardDataset:
+    """
+    Streams (commitments, targets) batches from generated shards.
+
+    Shards are memory-mapped copy-on-write, so every batch is a torch view
+    onto the mapped file. Shuffling permutes whole blocks of `batch_size`
+    consecutive rows, not rows within a block, to keep batches contiguous
+    and zero-copy: a batch always holds the same rows in the same order.
+    Generated rows are independent draws, so this costs nothing for
+    synthetic shards; shuffle other data before writing it.
+    """
+
+    def __init__(self, data_dir: str):
+        with open(os.path.join(data_dir, MANIFEST_NAME)) as f:
+            self.manifest = json.load(f)
+
+        if self.manifest["record_width"] != RECORD_WIDTH:
+            raise ValueError(
+                f"Record width mismatch: expected {RECORD_WIDTH}, "
+                f"got {self.manifest['record_width']}"
+            )
+
+        self.shards: List[np.ndarray] = [
+            np.load(os.path.join(data_dir, shard["file"]), mmap_mode="c")
+            for shard in self.manifest["shards"]
+        ]
+
+    def __len__(self) -> int:
+        return sum(shard.shape[0] for shard in self.shards)
+
+    def iter_batches(
+        self,
+        batch_size: int,
+        shuffle: bool = False,
+        seed: Optional[int] = None,
+        device: Optional[torch.device] = None
+    ) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        """
+        Yield ([B, 32] commitments, [B, 4] targets) tensors.
+
+        Without `device`, tensors share memory with the mapped shards.
+        """
+        blocks = [
+            (shard_index, start)
+            for shard_index, shard in enumerate(self.shards)
+            for start in range(0, shard.shape[0], batch_size)
+        ]
+        if shuffle:
+            np.random.default_rng(seed).shuffle(blocks)
+
+        for shard_index, start in blocks:
+            block = torch.from_numpy(self.shards[shard_index][start:start + batch_size])
+            commitments = block[:, COMMITMENT_COLUMNS]
+            targets = block[:, TARGET_COLUMNS]
+            if device is not None:
+                commitments = commitments.to(device, non_blocking=True)
+                targets = targets.to(device, non_blocking=True)
+            yield commitments, targets
+
+
+# ============================================================================
+# Pre-training
+# ============================================================================
+
+def pretrain(
+    data_dir: str,
+    checkpoint_path: str,
+    epochs: int = 1,
+    batch_size: int = 4096,
+    lr: float = 0.001,
+    seed: int = 0,
+    device: Optional[torch.device] = None
+) -> dict:
+    """
+    Train a fresh CommitmentModel on the shards in `data_dir` and save it
+    to `checkpoint_path` in the trainer's checkpoint format, marked ready,
+    so a validator starting from it scores in production mode.
+
+    Returns {"steps", "samples_seen", "loss"} (loss of the last epoch).
+    """
+    # Imported here so generating shards never needs bittensor
+    from nash.training import _save_checkpoint
+    from nash.validator import CommitmentModel
+
+    device = torch.device(device or ("cuda" if torch.cuda.is_available() else "cpu"))
+    dataset = ShardDataset(data_dir)
+    torch.manual_seed(seed)
+    model = CommitmentModel(input_dim=COMMITMENT_DIM, hidden_dim=64).to(device)
+    optimizer = torch.optim.Adam(model.parameters(), lr=lr)
+    criterion = torch.nn.MSELoss()
+
+    steps = 0
+    samples_seen = 0
+    model.train()
+    for epoch in range(epochs):
+        total_loss, batches = 0.0, 0
+        for commitments, targets in dataset.iter_batches(batch_size, shuffle=True, seed=seed + epoch, device=device):
+            # BatchNorm needs more than one row; only a shard's last block can be that short
+            if commitments.shape[0] < 2:
+                continue
+            optimizer.zero_grad()
+            loss = criterion(model(commitments), targets)
+            loss.backward()
+            optimizer.step()
+            total_loss += loss.item()
+            batches += 1
+            steps += 1
+            samples_seen += commitments.shape[0]
+        print(f"epoch {epoch + 1}/{epochs}: loss {total_loss / max(batches, 1):.5f}")
+
+    state = {
+        'model_state_dict': {k: v.detach().cpu() for k, v in model.state_dict().items()},
+        'steps': steps,
+        'samples_seen': samples_seen,
+        'training_state': {'mode': 'production', 'samples_collected': len(dataset), 'model_ready': True},
+    }
+    _save_checkpoint(state, checkpoint_path)
+    return {"steps": steps, "samples_seen": samples_seen, "loss": total_loss / max(batches, 1)}
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate NASH synthetic ground-truth shards")
+    parser.add_argument("--output", required=True, help="Output directory for shards")
+    parser.add_argument("--samples", type=int, default=1_000_000, help="Total problems to generate")
+    parser.add_argument("--shard-size", type=int, default=262144, help="Rows per shard")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="Root seed for reproducible shards")
+    parser.add_argument("--pretrain", default=None, help="Then pre-train the commitment model into this checkpoint")
+    parser.add_argument("--epochs", type=int, default=1, help="Pre-training epochs over the shards")
+    parser.add_argument("--batch-size", type=int, default=4096, help="Pre-training batch size")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    manifest = generate_dataset(
+        args.output,
+        args.samples,
+        shard_size=args.shard_size,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Wrote {manifest['num_samples']} samples in {len(manifest['shards'])} shards "
+          f"to {args.output} in {elapsed:.1f}s ({manifest['num_samples'] / elapsed:,.0f} samples/s)")
+
+    if args.pretrain:
+        start_time = time.perf_counter()
+        result = pretrain(args.output, args.pretrain, epochs=args.epochs, batch_size=args.batch_size, seed=args.seed)
+        print(f"Pre-trained on {result['samples_seen']} samples in {time.perf_counter() - start_time:.1f}s, "
+              f"wrote {args.pretrain}")
+
+
+if __name__ == "__main__":
+    main()
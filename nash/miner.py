@@ -1,6 +1,3 @@
-**nash/miner.py**
-
-```python
 """
 NASH Miner - Optimized implementation for equilibrium discovery.
 
@@ -10,53 +7,50 @@ Optimizations:
 - Pre-allocated tensors to avoid allocation overhead
 - torch.no_grad() for inference
 - Timeout handling for <50ms target
+- Micro-batching of concurrent requests into one encode+solve pass
+- Approximate intent cache for repeated challenges
+- Selectable fused inference backend (eager, TorchScript, torch.compile, ONNX)
+- Optional bf16 / dynamic INT8 precision, calibrated against fp32
+- Per-stage latency histograms with a local Prometheus endpoint
+- Hard per-request deadlines with cached / heuristic fallback answers
+- Warm-start snapshots and a startup phase profile
+- Memory-mapped checkpoints, hot-reloaded without dropping requests
+- Multi-party trades (padded parties x features + mask), many per synapse
+  in one masked-pooling pass; packed into flat rows so they share the
+  batcher, cache, backends, precision and worker pool with flat intents
+- Optional multi-process inference workers on shared-memory weights
+- Session-keyed warm re-solves: revised intents reuse the last solve's
+  linear region (exact while no ReLU flips)
 """
 
 import bittensor as bt
 from nash.protocol import NashSynapse
+from nash.models import (
+    MAX_PARTIES,
+    PACKED_PARTY_DIM,
+    PARTY_FEATURES,
+    EquilibriumSolver,
+    IntentEncoder,
+    MultiPartyEncoder,
+    PackedPartyEncoder,
+    pack_parties,
+)
+from nash.batching import RequestBatcher
+from nash.cache import EquilibriumCache
+from nash.backends import BACKENDS, FusedMinerModel, build_backend
+from nash.precision import apply_precision, calibrate_precision, resolve_precision, synthetic_intents
+from nash.checkpoint import Checkpoint, CheckpointWatcher, split_prefix
+from nash.metrics import MetricsServer, MinerMetrics, StartupProfile
+from nash.workers import InferencePool
+from nash.sessions import PiecewiseAffineModel, SessionStore, session_key
+from nash.snapshot import load_miner_snapshot, restore_module, save_miner_snapshot, snapshot_key
 import torch
-import torch.nn as nn
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 import asyncio
 import time
 
 
-class IntentEncoder(nn.Module):
-    """
-    Encodes raw intent vectors into a compressed manifold representation.
-    """
-    def __init__(self, input_dim: int = 10, manifold_dim: int = 256):
-        super().__init__()
-        self.encoder = nn.Sequential(
-            nn.Linear(input_dim, 64),
-            nn.ReLU(),
-            nn.Linear(64, 128),
-            nn.ReLU(),
-            nn.Linear(128, manifold_dim),
-        )
-    
-    def forward(self, x: torch.FloatTensor) -> torch.FloatTensor:
-        return self.encoder(x)
-
-
-class EquilibriumSolver(nn.Module):
-    """
-    Discovers optimal equilibrium points from manifold representations.
-    """
-    def __init__(self, manifold_dim: int = 256):
-        super().__init__()
-        self.solver = nn.Sequential(
-            nn.Linear(manifold_dim, 128),
-            nn.ReLU(),
-            nn.Linear(128, 64),
-            nn.ReLU(),
-            nn.Linear(64, 2),  # Output: (x, y) equilibrium coordinates
-        )
-    
-    def forward(self, manifold: torch.FloatTensor) -> torch.FloatTensor:
-        return self.solver(manifold)
-
-
 class NashMiner(bt.Neuron):
     """
     NASH Miner that encodes intents and solves for equilibria.
@@ -65,27 +59,450 @@ class NashMiner(bt.Neuron):
     - Pre-allocated tensors
     - GPU acceleration
     - No gradient computation in inference
+    - Micro-batching of requests arriving within a short window
+    - LRU/TTL cache of recent intent -> equilibrium results
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        enable_batching: bool = True,
+        batch_window_ms: float = 2.0,
+        max_batch_size: int = 64,
+        cache_size: int = 4096,
+        cache_ttl_seconds: float = 30.0,
+        cache_tolerance: float = 0.0,
+        backend: str = "eager",
+        precision: str = "fp32",
+        metrics_port: Optional[int] = None,
+        deadline_fraction: float = 0.9,
+        fallback_tolerance: float = 0.05,
+        snapshot_path: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+        workers: int = 0,
+        session_capacity: int = 1024,
+    ):
         super().__init__()
         
-        # Initialize models and move to device
-        self.encoder = IntentEncoder(input_dim=10, manifold_dim=256).to(self.device)
-        self.solver = EquilibriumSolver(manifold_dim=256).to(self.device)
+        self.startup = StartupProfile()
+        warmup_batch_sizes = (1, max_batch_size)
         
-        # Set to evaluation mode
-        self.encoder.eval()
-        self.solver.eval()
+        # Kept for rebuilding the backend when new weights are hot-loaded
+        self._backend_request = backend
+        self._warmup_batch_sizes = warmup_batch_sizes
+        
+        # Identity of the loaded checkpoint (None: initial random weights), and a
+        # counter bumped on every swap so stale results never enter the cache
+        self._weights_fingerprint: Optional[str] = None
+        self._weights_generation = 0
+        self._cache_generation = 0
+        
+        # Warm start: reuse converted models and built graphs from a snapshot
+        snapshot_config = {"backend": backend, "precision": precision, "max_batch_size": max_batch_size}
+        self._snapshot_path = snapshot_path
+        self._snapshot_key = snapshot_key(snapshot_config, self.device)
+        snapshot = None
+        if snapshot_path is not None:
+            with self.startup.phase("load_snapshot"):
+                snapshot = load_miner_snapshot(snapshot_path, self._snapshot_key, self.device)
+        
+        if snapshot is not None:
+            try:
+                with self.startup.phase("restore_backend"):
+                    self.precision = snapshot["precision"]
+                    self.encoder = restore_module(
+                        IntentEncoder(input_dim=10, manifold_dim=256).to(self.device), snapshot["encoder"], self.precision
+                    )
+                    self.solver = restore_module(
+                        EquilibriumSolver(manifold_dim=256).to(self.device), snapshot["solver"], self.precision
+                    )
+                    self.party_encoder = restore_module(
+                        MultiPartyEncoder(manifold_dim=256).to(self.device), snapshot["party_encoder"], self.precision
+                    )
+                    self._precision_report = snapshot["precision_report"]
+                    self._backend = BACKENDS[snapshot["backend"]].restore(
+                        self.encoder, self.solver, self.device, snapshot["backend_data"], input_dim=10
+                    )
+                    self._backend_parity = snapshot["backend_parity"]
+                    self._party_backend = BACKENDS[snapshot["party_backend"]].restore(
+                        PackedPartyEncoder(self.party_encoder), self.solver, self.device,
+                        snapshot["party_backend_data"], input_dim=PACKED_PARTY_DIM
+                    )
+                    self._party_backend_parity = snapshot["party_backend_parity"]
+            except Exception as e:
+                bt.logging.warning(f"Failed to restore snapshot {snapshot_path}, rebuilding: {e}")
+                snapshot = None
+        
+        if snapshot is not None:
+            self._weights_fingerprint = snapshot.get("weights_fingerprint")
+            with self.startup.phase("warmup"):
+                self._backend.warmup(warmup_batch_sizes, iterations=1)
+                self._party_backend.warmup(warmup_batch_sizes, iterations=1)
+        else:
+            self._build_models(backend, precision, warmup_batch_sizes)
+            if snapshot_path is not None:
+                with self.startup.phase("save_snapshot"):
+                    self._save_snapshot()
         
         # Pre-allocate output tensors to avoid allocation overhead
         self._manifold_buffer = torch.empty(1, 256, device=self.device)
         self._equilibrium_buffer = torch.empty(1, 2, device=self.device)
         
-        # Timeout for equilibrium discovery (in seconds)
+        # Budget for equilibrium discovery (in seconds) when a synapse carries no timeout
         self._timeout_seconds = 0.045  # 45ms timeout to leave buffer for <50ms total
         
+        # Deadline enforcement: share of the synapse timeout a request may use,
+        # and how far a cached intent may be from the request for a fallback answer
+        self._deadline_fraction = deadline_fraction
+        self._fallback_tolerance = fallback_tolerance
+        
+        # Worker-pool mode: encode+solve in `workers` processes sharing one copy
+        # of the weights; the executor threads only dispatch and wait
+        self._pool: Optional[InferencePool] = None
+        if workers > 0:
+            if torch.device(self.device).type != "cpu":
+                bt.logging.warning(f"Inference workers need a CPU device, running in-process on {self.device}")
+            elif self.precision == "int8":
+                # Packed INT8 weights are not shared, so workers would miss hot reloads
+                bt.logging.warning("Inference workers do not support int8 precision, running in-process")
+            else:
+                try:
+                    with self.startup.phase("workers"):
+                        self._pool = InferencePool(
+                            self.encoder,
+                            self.solver,
+                            workers=workers,
+                            slot_rows=max_batch_size,
+                            party_encoder=PackedPartyEncoder(self.party_encoder),
+                            party_dim=PACKED_PARTY_DIM,
+                        )
+                        self._pool.start()
+                except Exception as e:
+                    bt.logging.warning(f"Failed to start inference workers, running in-process: {e}")
+                    self._pool = None
+        
+        # Inference runs off the event loop so overdue requests can be abandoned
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers if self._pool is not None else 1,
+            thread_name_prefix="nash-infer",
+        )
+        
+        # Coalesce concurrent requests into one batch per window
+        self._batcher: Optional[RequestBatcher] = None
+        if enable_batching:
+            self._batcher = RequestBatcher(
+                self._run_models,
+                max_batch_size=max_batch_size,
+                window_seconds=batch_window_ms / 1000.0,
+                executor=self._executor,
+            )
+        
+        # Cache of recent results keyed on quantized intent + context (0 disables)
+        self._cache: Optional[EquilibriumCache] = None
+        if cache_size > 0:
+            self._cache = EquilibriumCache(
+                capacity=cache_size,
+                ttl_seconds=cache_ttl_seconds,
+                tolerance=cache_tolerance,
+                # Wide enough for packed party rows, so they get fallbacks too
+                intent_dim=PACKED_PARTY_DIM,
+            )
+        
+        # Per-session linearizations for warm re-solves (0 disables); built on
+        # their own thread after the request has been answered
+        self._sessions: Optional[SessionStore] = None
+        self._affine: Optional[PiecewiseAffineModel] = None
+        self._session_executor: Optional[ThreadPoolExecutor] = None
+        self._linearizing: set = set()
+        if session_capacity > 0:
+            try:
+                self._affine = PiecewiseAffineModel(self.encoder, self.solver)
+                self._sessions = SessionStore(capacity=session_capacity)
+                self._session_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nash-session")
+            except ValueError as e:
+                bt.logging.info(f"Session warm starts disabled: {e}")
+        
+        # Per-stage latency histograms and counters (optionally served over HTTP)
+        self.metrics = MinerMetrics()
+        for fused in (self._backend, self._party_backend):
+            if fused.name == "eager":
+                fused.observe = self.metrics.observe
+        self._metrics_server: Optional[MetricsServer] = None
+        if metrics_port is not None:
+            self._metrics_server = MetricsServer(self.metrics, port=metrics_port)
+            self._metrics_server.start()
+        
+        # Hot reload: pick up the current checkpoint now, then watch for new versions
+        self._checkpoint_watcher: Optional[CheckpointWatcher] = None
+        if checkpoint_path is not None:
+            with self.startup.phase("load_checkpoint"):
+                self._checkpoint_watcher = CheckpointWatcher(checkpoint_path, self._swap_weights, device=self.device)
+                self._checkpoint_watcher.poll()
+            self._checkpoint_watcher.start()
+        
         bt.logging.info(f"Miner initialized on device: {self.device}")
+        self.startup.log("Miner startup")
+
+    def _build_models(self, backend: str, precision: str, warmup_batch_sizes: Tuple[int, ...]):
+        """Cold start: create, convert and compile the networks."""
+        with self.startup.phase("build_models"):
+            # Initialize models and move to device
+            self.encoder = IntentEncoder(input_dim=10, manifold_dim=256).to(self.device)
+            self.solver = EquilibriumSolver(manifold_dim=256).to(self.device)
+            self.party_encoder = MultiPartyEncoder(manifold_dim=256).to(self.device)
+            
+            # Set to evaluation mode
+            self.encoder.eval()
+            self.solver.eval()
+            self.party_encoder.eval()
+        
+        # Reduced precision: convert, then verify drift on synthetic intents
+        with self.startup.phase("precision"):
+            self.precision = resolve_precision(precision, self.device)
+            self._precision_report: dict = {}
+            if self.precision != "fp32":
+                calibration = synthetic_intents(256, intent_dim=10).to(self.device)
+                fused, self.precision, self._precision_report = calibrate_precision(
+                    FusedMinerModel(self.encoder, self.solver), self.precision, (calibration,)
+                )
+                self.encoder, self.solver = fused.encoder, fused.solver
+                # Party trades share the solver, so they run at the calibrated precision too
+                self.party_encoder = apply_precision(self.party_encoder, self.precision)
+        
+        # Fused encoder -> solver graphs (flat intents and packed parties),
+        # warmed up and parity-checked against eager
+        with self.startup.phase("backend"):
+            self._backend, self._backend_parity = build_backend(
+                backend,
+                self.encoder,
+                self.solver,
+                self.device,
+                input_dim=10,
+                warmup_batch_sizes=warmup_batch_sizes,
+            )
+            self._party_backend, self._party_backend_parity = build_backend(
+                backend,
+                PackedPartyEncoder(self.party_encoder),
+                self.solver,
+                self.device,
+                input_dim=PACKED_PARTY_DIM,
+                warmup_batch_sizes=warmup_batch_sizes,
+            )
+
+    def _save_snapshot(self):
+        save_miner_snapshot(
+            self._snapshot_path,
+            self._snapshot_key,
+            self.encoder,
+            self.solver,
+            self.party_encoder,
+            self._backend.name,
+            self._backend.serialize(),
+            self.precision,
+            self._precision_report,
+            self._backend_parity,
+            party_backend_name=self._party_backend.name,
+            party_backend_data=self._party_backend.serialize(),
+            party_backend_parity=self._party_backend_parity,
+            weights_fingerprint=self._weights_fingerprint,
+        )
+
+    def _swap_weights(self, checkpoint: Checkpoint):
+        """
+        Install encoder/solver weights from a checkpoint.
+        
+        Called from the checkpoint watcher thread. New modules and a new
+        backend are fully built (converted, warmed up, parity-checked)
+        before the swap, so requests already running keep the old backend.
+        """
+        if checkpoint.fingerprint == self._weights_fingerprint:
+            return
+        
+        encoder = IntentEncoder(input_dim=10, manifold_dim=256).to(self.device)
+        solver = EquilibriumSolver(manifold_dim=256).to(self.device)
+        # assign=True keeps the parameters as views onto the mapped checkpoint
+        encoder.load_state_dict(split_prefix(checkpoint.tensors, "encoder"), assign=True)
+        solver.load_state_dict(split_prefix(checkpoint.tensors, "solver"), assign=True)
+        encoder.eval()
+        solver.eval()
+        
+        # Older checkpoints carry no multi-party encoder; keep the current
+        # (already converted) one
+        party_encoder = self.party_encoder
+        party_state = split_prefix(checkpoint.tensors, "party_encoder")
+        if party_state:
+            party_encoder = MultiPartyEncoder(manifold_dim=256).to(self.device)
+            party_encoder.load_state_dict(party_state, assign=True)
+            party_encoder = apply_precision(party_encoder.eval(), self.precision)
+        
+        if self.precision != "fp32":
+            fused = apply_precision(FusedMinerModel(encoder, solver), self.precision)
+            encoder, solver = fused.encoder, fused.solver
+        
+        backend, parity = build_backend(
+            self._backend_request,
+            encoder,
+            solver,
+            self.device,
+            input_dim=10,
+            warmup_batch_sizes=self._warmup_batch_sizes,
+        )
+        party_backend, party_parity = build_backend(
+            self._backend_request,
+            PackedPartyEncoder(party_encoder),
+            solver,
+            self.device,
+            input_dim=PACKED_PARTY_DIM,
+            warmup_batch_sizes=self._warmup_batch_sizes,
+        )
+        if backend.name == "eager":
+            backend.observe = self.metrics.observe
+        if party_backend.name == "eager":
+            party_backend.observe = self.metrics.observe
+        
+        if self._pool is not None:
+            self._pool.update_weights(encoder, solver, PackedPartyEncoder(party_encoder))
+        if self._sessions is not None:
+            self._affine = PiecewiseAffineModel(encoder, solver)
+        self.encoder, self.solver, self.party_encoder = encoder, solver, party_encoder
+        self._backend, self._backend_parity = backend, parity
+        self._party_backend, self._party_backend_parity = party_backend, party_parity
+        self._weights_fingerprint = checkpoint.fingerprint
+        self._weights_generation += 1
+        
+        if self._snapshot_path is not None:
+            self._save_snapshot()
+
+    def _run_models(self, intent: torch.FloatTensor, timeout: Optional[float] = None):
+        """
+        Run encoder and solver on a [B, input_dim] intent batch, or on
+        [B, PACKED_PARTY_DIM] packed multi-party trades.
+        
+        `timeout` (seconds left for the request) bounds how long the worker
+        pool waits; in-process backends run to completion.
+        """
+        if self._pool is not None:
+            start = time.perf_counter()
+            result = self._pool.run(intent, timeout)
+            self.metrics.observe("infer", time.perf_counter() - start)
+            return result
+        
+        backend = self._party_backend if intent.shape[-1] == PACKED_PARTY_DIM else self._backend
+        if backend.observe is not None:
+            return backend(intent)
+        
+        # Fused backends run encode+solve as one graph
+        start = time.perf_counter()
+        result = backend(intent)
+        self.metrics.observe("infer", time.perf_counter() - start)
+        return result
+
+    async def _infer(
+        self,
+        intent: torch.FloatTensor,
+        budget: Optional[float] = None
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Full encode+solve on the inference thread, batched when enabled."""
+        if self._batcher is not None:
+            return await self._batcher.submit(intent, budget)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._run_models, intent, budget)
+
+    async def _solve_session(
+        self,
+        key,
+        intent: torch.FloatTensor,
+        generation: int,
+        budget: float
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Answer a single-row session intent, warm-starting from the session's
+        last solve when the revision stays in the same linear region.
+        
+        Otherwise the intent takes the normal inference path (batcher,
+        backend, workers, deadline) and the session is re-linearized in
+        the background, off the request's budget.
+        """
+        state = self._sessions.get(key, generation)
+        if state is not None:
+            start = time.perf_counter()
+            refined = self._affine.refine(state, intent[0])
+            if refined is not None:
+                self._sessions.hits += 1
+                self.metrics.observe("infer", time.perf_counter() - start)
+                manifold, equilibrium = refined
+                return manifold.unsqueeze(0), equilibrium.unsqueeze(0)
+        
+        # New session or region boundary crossed: full solve, re-linearized later
+        self._sessions.misses += 1
+        result = await asyncio.wait_for(self._infer(intent, budget), timeout=budget)
+        self._schedule_linearize(key, intent[0], generation)
+        return result
+
+    def _schedule_linearize(self, key, intent: torch.FloatTensor, generation: int):
+        """Linearize a session on the session thread (one job per session at a time)."""
+        if key in self._linearizing:
+            return
+        self._linearizing.add(key)
+        future = asyncio.get_running_loop().run_in_executor(
+            self._session_executor, self._affine.linearize, intent
+        )
+        future.add_done_callback(lambda done: self._store_session(key, generation, done))
+
+    def _store_session(self, key, generation: int, done: asyncio.Future):
+        """Loop-thread callback: keep a linearization unless the weights changed meanwhile."""
+        self._linearizing.discard(key)
+        if done.cancelled():
+            return
+        if done.exception() is not None:
+            bt.logging.debug(f"Session linearization failed: {done.exception()}")
+            return
+        if generation != self._weights_generation:
+            return
+        state = done.result()
+        state.generation = generation
+        self._sessions.put(key, state)
+
+    def _request_budget(self, synapse: NashSynapse) -> float:
+        """
+        Seconds a request may spend in total: deadline_fraction of the
+        synapse timeout, or the default budget if the synapse has none.
+        """
+        timeout = getattr(synapse, "timeout", None)
+        if not timeout:
+            return self._timeout_seconds
+        return timeout * self._deadline_fraction
+
+    def _fallback_answer(
+        self,
+        intent: torch.FloatTensor,
+        context: Optional[dict]
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Cheap answer for a request that would miss its deadline.
+        
+        Tier 1: closest cached result within fallback_tolerance.
+        Tier 2: heuristic midpoint equilibrium - the mean (price, quantity)
+                over the parties in the intent, with an empty manifold.
+        """
+        if self._cache is not None:
+            # peek() leaves the cache's hit/miss counters to real lookups
+            cached = self._cache.peek(intent.cpu(), context, self._fallback_tolerance)
+            if cached is not None:
+                return cached
+        
+        rows, width = intent.shape[0], intent.shape[-1]
+        if width == PACKED_PARTY_DIM:
+            split = MAX_PARTIES * PARTY_FEATURES
+            parties = intent[:, :split].reshape(rows, MAX_PARTIES, PARTY_FEATURES).float()
+            weights = intent[:, split:].unsqueeze(-1).float()
+            equilibrium = (parties[..., :2] * weights).sum(dim=1) / weights.sum(dim=1).clamp(min=1.0)
+            return torch.zeros(rows, 256, device=intent.device), equilibrium
+        
+        pairs = intent.reshape(rows, -1)[:, :(width // 2) * 2].reshape(rows, -1, 2).float()
+        present = (pairs != 0).any(dim=2, keepdim=True)
+        equilibrium = (pairs * present).sum(dim=1) / present.sum(dim=1).clamp(min=1)
+        manifold = torch.zeros(rows, 256, device=intent.device)
+        return manifold, equilibrium
 
     async def forward(self, synapse: NashSynapse) -> NashSynapse:
         """
@@ -95,56 +512,104 @@ class NashMiner(bt.Neuron):
         Optimizations:
         - No gradient computation
         - Pre-allocated tensors
-        - Timeout handling
+        - Hard deadline with fallback answers
         """
         start_time = time.perf_counter()
+        self.metrics.increment("requests")
         
         try:
             # Validate input
             if not synapse.validate():
                 bt.logging.warning("Invalid synapse received, returning empty response")
+                self.metrics.increment("invalid")
                 synapse.manifold_tensor = None
                 synapse.equilibrium_point = None
                 return synapse
             
-            # Move input to device and ensure correct shape
-            intent = synapse.raw_intent.to(self.device)
+            if synapse.party_tensor is not None:
+                # Multi-party trades become packed rows and take the same path
+                # (cache, batcher, fused backend, workers) as flat intents
+                intent = pack_parties(synapse.party_tensor, synapse.party_mask)
+            else:
+                # Ensure correct shape
+                intent = synapse.raw_intent
+                
+                # Handle different input shapes
+                if intent.dim() == 1:
+                    intent = intent.unsqueeze(0)
+                elif intent.dim() == 0:
+                    intent = intent.unsqueeze(0).unsqueeze(0)
             
-            # Handle different input shapes
-            if intent.dim() == 1:
-                intent = intent.unsqueeze(0)
-            elif intent.dim() == 0:
-                intent = intent.unsqueeze(0).unsqueeze(0)
+            stage_start = time.perf_counter()
+            self.metrics.observe("validate", stage_start - start_time)
             
-            # Check timeout before computation
-            elapsed = time.perf_counter() - start_time
-            if elapsed > self._timeout_seconds:
-                bt.logging.warning(f"Timeout exceeded before computation: {elapsed*1000:.1f}ms")
+            # Repeated intents are answered straight from the cache
+            # Results from replaced weights are dropped on the loop thread
+            generation = self._weights_generation
+            if self._cache is not None and self._cache_generation != generation:
+                self._cache.clear()
+                self._cache_generation = generation
+            cached = None
+            if self._cache is not None:
+                cached = self._cache.get(intent, synapse.context)
             
-            # Inference: encode intent to manifold (no gradients)
-            with torch.no_grad():
-                manifold = self.encoder(intent)
-                
-                # Check timeout after encoding
-                elapsed = time.perf_counter() - start_time
-                if elapsed > self._timeout_seconds:
-                    bt.logging.warning(f"Timeout after encoding: {elapsed*1000:.1f}ms")
-                
-                # Solve for equilibrium
-                equilibrium = self.solver(manifold)
+            if cached is not None:
+                manifold, equilibrium = cached
+                self.metrics.increment("cache_hits")
+            else:
+                # Move input to device
+                stage_start = time.perf_counter()
+                intent = intent.to(self.device)
+                self.metrics.observe("host_to_device", time.perf_counter() - stage_start)
                 
-                # Check final timeout
-                elapsed = time.perf_counter() - start_time
-                bt.logging.debug(f"Inference completed in {elapsed*1000:.2f}ms")
+                # Remaining budget; overdue work is cancelled and a fallback is returned
+                budget = max(self._request_budget(synapse) - (time.perf_counter() - start_time), 0.0)
+                # Sessions linearize the flat-intent model only
+                session = None
+                if self._sessions is not None and synapse.party_tensor is None:
+                    session = session_key(synapse.context)
+                try:
+                    if session is not None and intent.shape[0] == 1:
+                        manifold, equilibrium = await self._solve_session(session, intent, generation, budget)
+                    else:
+                        manifold, equilibrium = await asyncio.wait_for(self._infer(intent, budget), timeout=budget)
+                    if self._cache is not None and generation == self._weights_generation:
+                        self._cache.put(intent, synapse.context, manifold, equilibrium)
+                except asyncio.TimeoutError:
+                    manifold, equilibrium = self._fallback_answer(intent, synapse.context)
+                    self.metrics.increment("fallbacks")
+                    bt.logging.warning(
+                        f"Deadline of {self._request_budget(synapse)*1000:.1f}ms reached, "
+                        f"returned fallback answer"
+                    )
+            
+            # Check final timeout
+            elapsed = time.perf_counter() - start_time
+            budget = self._request_budget(synapse)
+            if elapsed > budget:
+                bt.logging.warning(f"Timeout after inference: {elapsed*1000:.1f}ms")
+            bt.logging.debug(f"Inference completed in {elapsed*1000:.2f}ms (cached: {cached is not None})")
             
             # Store results (move to CPU for serialization if needed)
-            synapse.manifold_tensor = manifold.contiguous()
-            synapse.equilibrium_point = equilibrium.contiguous()
+            stage_start = time.perf_counter()
+            if synapse.wire_format is not None:
+                # Validator opted into the compact quantized encoding
+                synapse.encode_compact(manifold, equilibrium)
+            else:
+                synapse.manifold_tensor = manifold.contiguous()
+                synapse.equilibrium_point = equilibrium.contiguous()
+            
+            end_time = time.perf_counter()
+            self.metrics.observe("serialize", end_time - stage_start)
+            self.metrics.observe("total", end_time - start_time)
+            if end_time - start_time > budget:
+                self.metrics.increment("deadline_misses")
             
             return synapse
             
         except Exception as e:
             bt.logging.error(f"Error in miner forward: {e}")
+            self.metrics.increment("errors")
             synapse.manifold_tensor = None
             synapse.equilibrium_point = None
             return synapse
@@ -154,8 +619,26 @@ class NashMiner(bt.Neuron):
         return {
             "encoder_params": sum(p.numel() for p in self.encoder.parameters()),
             "solver_params": sum(p.numel() for p in self.solver.parameters()),
+            "party_encoder_params": sum(p.numel() for p in self.party_encoder.parameters()),
             "device": str(self.device),
-            "dtype": str(next(self.encoder.parameters()).dtype),
+            "dtype": str(next((p.dtype for p in self.encoder.parameters()), torch.qint8)),
+            "precision": self.precision,
+            "precision_drift": self._precision_report,
+            "backend": self._backend.name if self._pool is None else "workers",
+            "workers": self._pool.stats() if self._pool is not None else None,
+            "backend_parity": self._backend_parity,
+            "party_backend": self._party_backend.name if self._pool is None else "workers",
+            "party_backend_parity": self._party_backend_parity,
+            "batching": self._batcher is not None,
+            "batches_run": self._batcher.batches_run if self._batcher else 0,
+            "requests_batched": self._batcher.requests_served if self._batcher else 0,
+            "batches_dropped": self._batcher.batches_dropped if self._batcher else 0,
+            "cache": self._cache.stats() if self._cache else None,
+            "sessions": self._sessions.stats() if self._sessions is not None else None,
+            "metrics": self.metrics.summary(),
+            "startup": self.startup.report(),
+            "weights": self._weights_fingerprint,
+            "checkpoint_reloads": self._checkpoint_watcher.reloads if self._checkpoint_watcher else 0,
         }
 
 
@@ -172,6 +655,3 @@ async def run_miner():
 if __name__ == "__main__":
     import asyncio
     asyncio.run(run_miner())
-```
-
----
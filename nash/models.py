@@ -0,0 +1,128 @@
+"""
+NASH Models - The miner's encoder and solver networks.
+
+Kept free of bittensor so inference worker processes can unpickle them
+without importing the neuron stack.
+"""
+
+import torch
+import torch.nn as nn
+
+
+# Per-party feature row of party_tensor (same layout as the validator's commitments):
+#   [price, quantity, latency, region, buyer, seller, deferrer, time_horizon]
+PARTY_FEATURES = 8
+
+# Most parties a single trade may carry (party_tensor is [T, <= MAX_PARTIES, F])
+MAX_PARTIES = 6
+
+
+class IntentEncoder(nn.Module):
+    """
+    Encodes raw intent vectors into a compressed manifold representation.
+    """
+    def __init__(self, input_dim: int = 10, manifold_dim: int = 256):
+        super().__init__()
+        self.encoder = nn.Sequential(
+            nn.Linear(input_dim, 64),
+            nn.ReLU(),
+            nn.Linear(64, 128),
+            nn.ReLU(),
+            nn.Linear(128, manifold_dim),
+        )
+        # Inputs are cast to this dtype (set to bfloat16 by nash.precision)
+        self.compute_dtype = torch.float32
+    
+    def forward(self, x: torch.FloatTensor) -> torch.FloatTensor:
+        return self.encoder(x.to(self.compute_dtype)).float()
+
+
+class MultiPartyEncoder(nn.Module):
+    """
+    Encodes padded multi-party trades into the same manifold space.
+    
+    Each party row is embedded independently, then masked mean and max
+    pooling over parties make the result independent of party order and
+    padding, so 2- and 6-party trades share one batched pass.
+    """
+    def __init__(self, party_dim: int = PARTY_FEATURES, manifold_dim: int = 256, hidden_dim: int = 128):
+        super().__init__()
+        self.party = nn.Sequential(
+            nn.Linear(party_dim, 64),
+            nn.ReLU(),
+            nn.Linear(64, hidden_dim),
+            nn.ReLU(),
+        )
+        self.project = nn.Linear(2 * hidden_dim, manifold_dim)
+        # Inputs are cast to this dtype (set to bfloat16 by nash.precision)
+        self.compute_dtype = torch.float32
+    
+    def forward(self, parties: torch.FloatTensor, mask: torch.BoolTensor) -> torch.FloatTensor:
+        """[T, P, party_dim] parties and [T, P] mask -> [T, manifold_dim]."""
+        embedded = self.party(parties.to(self.compute_dtype))
+        weights = mask.unsqueeze(-1).to(embedded.dtype)
+        mean = (embedded * weights).sum(dim=1) / weights.sum(dim=1).clamp(min=1.0)
+        peak = embedded.masked_fill(~mask.unsqueeze(-1), float("-inf")).amax(dim=1)
+        # Trades with no parties at all pool to zero rather than -inf
+        peak = torch.where(torch.isfinite(peak), peak, torch.zeros_like(peak))
+        return self.project(torch.cat([mean, peak], dim=1)).float()
+
+
+# Packed multi-party row: MAX_PARTIES party rows, then their MAX_PARTIES mask flags
+PACKED_PARTY_DIM = MAX_PARTIES * (PARTY_FEATURES + 1)
+
+
+def pack_parties(parties: torch.FloatTensor, mask: torch.BoolTensor) -> torch.FloatTensor:
+    """
+    Flatten [T, P, PARTY_FEATURES] parties and their [T, P] mask
+    (P <= MAX_PARTIES) into [T, PACKED_PARTY_DIM] rows.
+    
+    Padding parties are zeroed, so equal trades pack to equal rows and
+    share a cache key.
+    """
+    trades, count = mask.shape
+    packed = torch.zeros(trades, PACKED_PARTY_DIM, device=parties.device)
+    features = packed[:, :MAX_PARTIES * PARTY_FEATURES].view(trades, MAX_PARTIES, PARTY_FEATURES)
+    features[:, :count] = parties.float() * mask.unsqueeze(-1)
+    packed[:, MAX_PARTIES * PARTY_FEATURES:MAX_PARTIES * PARTY_FEATURES + count] = mask.float()
+    return packed
+
+
+class PackedPartyEncoder(nn.Module):
+    """
+    MultiPartyEncoder over pack_parties() rows.
+    
+    Packed trades have the same [B, width] shape as flat intents, so they
+    are batched, cached, compiled into a fused backend and served by the
+    worker pool exactly like them.
+    """
+    def __init__(self, encoder: MultiPartyEncoder):
+        super().__init__()
+        self.encoder = encoder
+    
+    def forward(self, packed: torch.FloatTensor) -> torch.FloatTensor:
+        """[T, PACKED_PARTY_DIM] -> [T, manifold_dim]."""
+        split = MAX_PARTIES * PARTY_FEATURES
+        parties = packed[:, :split].reshape(-1, MAX_PARTIES, PARTY_FEATURES)
+        mask = packed[:, split:] > 0.5
+        return self.encoder(parties, mask)
+
+
+class EquilibriumSolver(nn.Module):
+    """
+    Discovers optimal equilibrium points from manifold representations.
+    """
+    def __init__(self, manifold_dim: int = 256):
+        super().__init__()
+        self.solver = nn.Sequential(
+            nn.Linear(manifold_dim, 128),
+            nn.ReLU(),
+            nn.Linear(128, 64),
+            nn.ReLU(),
+            nn.Linear(64, 2),  # Output: (x, y) equilibrium coordinates
+        )
+        # Inputs are cast to this dtype (set to bfloat16 by nash.precision)
+        self.compute_dtype = torch.float32
+    
+    def forward(self, manifold: torch.FloatTensor) -> torch.FloatTensor:
+        return self.solver(manifold.to(self.compute_dtype)).float()
@@ -0,0 +1,232 @@
+"""
+NASH Round Pipeline - Several validation rounds in flight at once.
+
+A round moves through four stages:
+    prepare (challenge generation) -> query (network I/O)
+        -> score (model inference) -> commit (weight aggregation)
+
+Each stage reads from a bounded asyncio.Queue, so a slow stage exerts
+backpressure on the ones before it instead of letting rounds pile up.
+Query I/O for round N+1 overlaps with scoring of round N, and per-round
+scores are averaged per UID before weights are set.
+
+Optimizations:
+- `concurrency` query workers share the network wait
+- Bounded queues cap memory and in-flight rounds
+- set_weights is called once per `commit_every` rounds, not per round
+"""
+
+import bittensor as bt
+import torch
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+import asyncio
+import time
+
+
+# Sentinel pushed through the queues to stop downstream workers
+_STOP = object()
+
+# Defaults shared with NashValidator.run_pipeline: the neuron's original
+# cadence of one round every 10 seconds, weights set after each round
+DEFAULT_CONCURRENCY = 1
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_COMMIT_EVERY = 1
+DEFAULT_ROUND_INTERVAL = 10.0
+
+
+class ScoreAggregator:
+    """
+    Running per-UID mean of round scores.
+
+    Rounds may cover different UID sets (the metagraph can change between
+    them); storage grows to the largest UID seen.
+    """
+
+    def __init__(self, initial_size: int = 256):
+        self._totals = torch.zeros(initial_size)
+        self._counts = torch.zeros(initial_size)
+        self.rounds = 0
+
+    def add(self, uids: torch.Tensor, scores: torch.Tensor):
+        """Accumulate one round of [N] scores for [N] uids."""
+        uids = uids.long().cpu()
+        scores = scores.detach().float().cpu()
+        if uids.numel() == 0:
+            return
+
+        size = int(uids.max()) + 1
+        if size > self._totals.shape[0]:
+            grow = size - self._totals.shape[0]
+            self._totals = torch.cat([self._totals, torch.zeros(grow)])
+            self._counts = torch.cat([self._counts, torch.zeros(grow)])
+
+        self._totals.index_add_(0, uids, scores)
+        self._counts.index_add_(0, uids, torch.ones_like(scores))
+        self.rounds += 1
+
+    def flush(self) -> Tuple[List[int], torch.Tensor]:
+        """Return (uids, mean scores) for every scored UID and reset."""
+        seen = self._counts > 0
+        uids = seen.nonzero().flatten()
+        means = self._totals[uids] / self._counts[uids]
+        self._totals.zero_()
+        self._counts.zero_()
+        self.rounds = 0
+        return uids.tolist(), means
+
+
+class RoundPipeline:
+    """
+    Runs prepare/query/score/commit stages concurrently over many rounds.
+
+    Args:
+        prepare: () -> round state, or None to skip this round
+        query: async (round) -> round, performs the network I/O
+        score: (round) -> (uids [N], scores [N])
+        commit: (uids, mean scores) -> None; normalizes and sets weights
+        concurrency: Number of rounds querying the network at once
+        queue_size: Capacity of each inter-stage queue (backpressure)
+        commit_every: Rounds aggregated per commit
+        round_interval: Minimum seconds between round starts
+    """
+
+    def __init__(
+        self,
+        prepare: Callable[[], Optional[Any]],
+        query: Callable[[Any], Awaitable[Any]],
+        score: Callable[[Any], Tuple[torch.Tensor, torch.Tensor]],
+        commit: Callable[[List[int], torch.Tensor], None],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        commit_every: int = DEFAULT_COMMIT_EVERY,
+        round_interval: float = DEFAULT_ROUND_INTERVAL,
+    ):
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        if commit_every < 1:
+            raise ValueError(f"commit_every must be >= 1, got {commit_every}")
+
+        self.prepare = prepare
+        self.query = query
+        self.score = score
+        self.commit = commit
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.commit_every = commit_every
+        self.round_interval = round_interval
+
+        self.aggregator = ScoreAggregator()
+        self._stopping = False
+
+        # Counters
+        self.rounds_started = 0
+        self.rounds_scored = 0
+        self.rounds_failed = 0
+        self.commits = 0
+
+    def stop(self):
+        """Finish the rounds already in flight, then return from run()."""
+        self._stopping = True
+
+    async def run(self, num_rounds: Optional[int] = None):
+        """Run until stop() is called or `num_rounds` rounds have been started."""
+        self._stopping = False
+        query_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        score_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        query_workers = [
+            asyncio.ensure_future(self._query_worker(query_queue, score_queue))
+            for _ in range(self.concurrency)
+        ]
+        score_worker = asyncio.ensure_future(self._score_worker(score_queue))
+
+        try:
+            await self._produce(query_queue, num_rounds)
+            for _ in query_workers:
+                await query_queue.put(_STOP)
+            await asyncio.gather(*query_workers)
+            await score_queue.put(_STOP)
+            await score_worker
+        finally:
+            for task in query_workers + [score_worker]:
+                task.cancel()
+
+        # Commit whatever was aggregated since the last commit
+        if self.aggregator.rounds:
+            self._commit()
+
+    async def _produce(self, query_queue: asyncio.Queue, num_rounds: Optional[int]):
+        """Prepare rounds; blocks on put() when query workers fall behind."""
+        loop = asyncio.get_running_loop()
+        while not self._stopping and (num_rounds is None or self.rounds_started < num_rounds):
+            started = loop.time()
+            try:
+                state = self.prepare()
+            except Exception as e:
+                bt.logging.error(f"Round preparation failed: {e}")
+                self.rounds_failed += 1
+                state = None
+
+            if state is not None:
+                await query_queue.put(state)
+                self.rounds_started += 1
+
+            wait = self.round_interval - (loop.time() - started)
+            await asyncio.sleep(max(wait, 0.0))
+
+    async def _query_worker(self, query_queue: asyncio.Queue, score_queue: asyncio.Queue):
+        while True:
+            state = await query_queue.get()
+            if state is _STOP:
+                return
+            try:
+                state = await self.query(state)
+            except Exception as e:
+                bt.logging.error(f"Round query failed: {e}")
+                self.rounds_failed += 1
+                continue
+            await score_queue.put(state)
+
+    async def _score_worker(self, score_queue: asyncio.Queue):
+        while True:
+            state = await score_queue.get()
+            if state is _STOP:
+                return
+            try:
+                uids, scores = self.score(state)
+            except Exception as e:
+                bt.logging.error(f"Round scoring failed: {e}")
+                self.rounds_failed += 1
+                continue
+
+            self.aggregator.add(torch.as_tensor(uids), scores)
+            self.rounds_scored += 1
+            if self.aggregator.rounds >= self.commit_every:
+                self._commit()
+
+    def _commit(self):
+        rounds = self.aggregator.rounds
+        uids, scores = self.aggregator.flush()
+
+        start = time.perf_counter()
+        try:
+            self.commit(uids, scores)
+            self.commits += 1
+        except Exception as e:
+            bt.logging.error(f"Failed to commit weights: {e}")
+            return
+        bt.logging.info(
+            f"Committed weights for {len(uids)} uids over {rounds} rounds "
+            f"in {(time.perf_counter() - start)*1000:.1f}ms"
+        )
+
+    def stats(self) -> dict:
+        """Counters for monitoring."""
+        return {
+            "concurrency": self.concurrency,
+            "rounds_started": self.rounds_started,
+            "rounds_scored": self.rounds_scored,
+            "rounds_failed": self.rounds_failed,
+            "commits": self.commits,
+            "pending_rounds": self.aggregator.rounds,
+        }
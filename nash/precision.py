@@ -0,0 +1,147 @@
+"""
+NASH Precision - Reduced-precision inference for miner and validator networks.
+
+Supported modes:
+- fp32: full precision (reference)
+- bf16: weights and activations in bfloat16, where the device supports it
+- int8: dynamic INT8 quantization of every nn.Linear (CPU only)
+
+Converted models are checked against their fp32 originals on synthetic
+calibration inputs; if the drift exceeds a tolerance the model stays fp32.
+"""
+
+import bittensor as bt
+import torch
+import torch.nn as nn
+from typing import Callable, Dict, Sequence, Tuple, Union
+import copy
+
+try:
+    from nash.solver import random_problems
+except ImportError:
+    # Fallback if solver (numpy) not available
+    random_problems = None
+
+
+PRECISIONS = ("fp32", "bf16", "int8")
+
+Outputs = Union[torch.Tensor, Tuple[torch.Tensor, ...]]
+
+
+def bf16_supported(device: torch.device) -> bool:
+    """Whether bfloat16 matmuls are natively supported on `device`."""
+    device = torch.device(device)
+    try:
+        if device.type == "cuda":
+            return torch.cuda.is_bf16_supported()
+        return torch.backends.mkldnn.is_available() and torch.ops.mkldnn._is_mkldnn_bf16_supported()
+    except Exception:
+        return False
+
+
+def resolve_precision(precision: str, device: torch.device) -> str:
+    """Validate a precision mode and downgrade it to fp32 if the device can't run it."""
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision {precision!r}, expected one of {list(PRECISIONS)}")
+    if precision == "int8" and torch.device(device).type != "cpu":
+        bt.logging.warning(f"int8 dynamic quantization is CPU-only, using fp32 on {device}")
+        return "fp32"
+    if precision == "bf16" and not bf16_supported(device):
+        bt.logging.warning(f"bf16 is not supported on {device}, using fp32")
+        return "fp32"
+    return precision
+
+
+def apply_precision(module: nn.Module, precision: str) -> nn.Module:
+    """
+    Return a copy of `module` converted to `precision` (fp32 returns it unchanged).
+
+    Modules exposing a `compute_dtype` attribute cast their inputs to it,
+    so bf16 models can be called with fp32 tensors.
+    """
+    if precision == "fp32":
+        return module
+
+    converted = copy.deepcopy(module).eval()
+    if precision == "int8":
+        converted = torch.ao.quantization.quantize_dynamic(converted, {nn.Linear}, dtype=torch.qint8)
+    elif precision == "bf16":
+        converted = converted.to(torch.bfloat16)
+        for submodule in converted.modules():
+            if hasattr(submodule, "compute_dtype"):
+                submodule.compute_dtype = torch.bfloat16
+    else:
+        raise ValueError(f"Unknown precision {precision!r}, expected one of {list(PRECISIONS)}")
+    return converted
+
+
+def synthetic_intents(batch_size: int, intent_dim: int = 10) -> torch.Tensor:
+    """Calibration intents from the same distribution as the validator's challenges."""
+    if random_problems is not None:
+        return torch.from_numpy(random_problems(batch_size).intents(intent_dim))
+    return torch.randn(batch_size, intent_dim)
+
+
+def drift_report(
+    reference: Callable[..., Outputs],
+    candidate: Callable[..., Outputs],
+    inputs: Sequence[torch.Tensor]
+) -> Dict[str, float]:
+    """
+    Compare candidate outputs against the fp32 reference on the same inputs.
+
+    Reports max/mean absolute error and relative error (mean abs error over
+    mean abs reference value), taking the worst across all outputs.
+    """
+    with torch.no_grad():
+        ref_outputs = reference(*inputs)
+        cand_outputs = candidate(*inputs)
+
+    if isinstance(ref_outputs, torch.Tensor):
+        ref_outputs, cand_outputs = (ref_outputs,), (cand_outputs,)
+
+    max_abs, mean_abs, relative = 0.0, 0.0, 0.0
+    for ref, cand in zip(ref_outputs, cand_outputs):
+        error = (cand.float() - ref.float()).abs()
+        max_abs = max(max_abs, error.max().item())
+        mean_abs = max(mean_abs, error.mean().item())
+        relative = max(relative, error.mean().item() / max(ref.float().abs().mean().item(), 1e-12))
+
+    return {
+        "max_abs_error": max_abs,
+        "mean_abs_error": mean_abs,
+        "relative_error": relative,
+        "samples": int(inputs[0].shape[0]),
+    }
+
+
+def calibrate_precision(
+    module: nn.Module,
+    precision: str,
+    calibration_inputs: Sequence[torch.Tensor],
+    max_relative_error: float = 0.05,
+    forward: Callable[[nn.Module], Callable[..., Outputs]] = lambda m: m,
+) -> Tuple[nn.Module, str, Dict[str, float]]:
+    """
+    Convert `module` and verify it on calibration inputs.
+
+    `forward` maps a module to the callable under test (e.g. a bound
+    scoring method). Returns (module, active precision, drift report);
+    falls back to the fp32 module if the relative drift is too large.
+    """
+    if precision == "fp32":
+        return module, "fp32", {}
+
+    converted = apply_precision(module, precision)
+    report = drift_report(forward(module), forward(converted), calibration_inputs)
+    report["precision"] = precision
+
+    if report["relative_error"] > max_relative_error:
+        bt.logging.warning(
+            f"{type(module).__name__} {precision} drift {report['relative_error']:.4f} exceeds "
+            f"{max_relative_error}, keeping fp32"
+        )
+        return module, "fp32", report
+
+    bt.logging.info(f"{type(module).__name__} running in {precision} (drift: {report})")
+    return converted, precision, report
@@ -1,10 +1,26 @@
-**nash/protocol.py**
+from __future__ import annotations
 
-```python
 import bittensor as bt
+import numpy as np
 import typing
 import torch
-from __future__ import annotations
+import base64
+import struct
+
+from nash.models import MAX_PARTIES, PARTY_FEATURES
+
+
+# Compact wire encoding: one contiguous little-endian buffer
+#   [version u8 | format u8 | rows u16 | cols u32]  header (8 bytes)
+#   [manifold scales rows x fp32]                    offset 8
+#   [equilibria rows x 2 x fp32]                     offset 8 + 4 * rows
+#   [manifold rows*cols x fp16 | int8]               offset 8 + 12 * rows
+# int8 rows are quantized with their own scale (1.0 for fp16), so one large
+# trade does not cost the others their precision.
+WIRE_VERSION = 2
+WIRE_FORMATS = {"fp16": 1, "int8": 2}
+_WIRE_HEADER = struct.Struct("<BBHI")
+_WIRE_DTYPES = {WIRE_FORMATS["fp16"]: np.float16, WIRE_FORMATS["int8"]: np.int8}
 
 
 class NashSynapse(bt.Synapse):
@@ -12,18 +28,35 @@ class NashSynapse(bt.Synapse):
     The Nash Synapse protocol for high-frequency economic negotiation.
     
     Optimized with __slots__ for reduced memory overhead and explicit
-    tensor shape validation.
+    tensor shape validation. Responses can opt into a compact quantized
+    encoding (fp16 or int8-with-scale manifolds, fp32 equilibria) carried
+    in a single buffer, for any number of trades.
+    
+    Multi-party trades travel as a padded [T, P, PARTY_FEATURES] tensor
+    with a [T, P] party mask: T trades of up to P parties each, answered
+    with [T, manifold_dim] manifolds and [T, 2] equilibria.
     """
     
-    __slots__ = ('raw_intent', 'context', 'manifold_tensor', 'equilibrium_point')
+    __slots__ = ('raw_intent', 'context', 'manifold_tensor', 'equilibrium_point',
+                 'wire_format', 'compact_payload', 'party_tensor', 'party_mask', 'challenge_id')
     
     # --- Input (Filled by Validator) ---
     # raw_intent: N-dimensional vector of requirements [Price, Latency, Reliability, etc.]
     raw_intent: torch.FloatTensor = None
     
+    # party_tensor: [T, P, PARTY_FEATURES] per-party features for T trades, zero-padded
+    party_tensor: typing.Optional[torch.FloatTensor] = None
+    
+    # party_mask: [T, P] bool, True for real (non-padding) parties
+    party_mask: typing.Optional[torch.BoolTensor] = None
+    
     # context: Additional metadata (e.g. "Hardware": "H100", "Region": "US-East")
     context: typing.Optional[dict] = None
 
+    # challenge_id: Id of the first trade; trade t is challenge_id + t. Settlements
+    # reveal their outcomes under these ids (NashValidator.record_reveal)
+    challenge_id: typing.Optional[int] = None
+
     # --- Output (Filled by Miner) ---
     # manifold_tensor: Compressed hypernetwork weights (The Nash Manifold)
     manifold_tensor: typing.Optional[torch.FloatTensor] = None
@@ -31,13 +64,144 @@ class NashSynapse(bt.Synapse):
     # equilibrium_point: The proposed (x, y) coordinates for the transaction
     equilibrium_point: typing.Optional[torch.FloatTensor] = None
 
+    # --- Wire encoding (opt-in) ---
+    # wire_format: Compact response encoding requested by the validator ("fp16" or "int8")
+    wire_format: typing.Optional[str] = None
+
+    # compact_payload: Base64 of the single-buffer encoding, replaces the output tensors
+    compact_payload: typing.Optional[str] = None
+
+    @property
+    def num_trades(self) -> int:
+        """Trades carried by this synapse (rows of party_tensor, else of raw_intent)."""
+        if self.party_tensor is not None:
+            return self.party_tensor.shape[0]
+        if self.raw_intent is None:
+            return 0
+        return self.raw_intent.shape[0] if self.raw_intent.dim() > 1 else 1
+
+    def set_parties(self, party_tensor: torch.FloatTensor, party_mask: typing.Optional[torch.BoolTensor] = None):
+        """
+        Attach a padded multi-party batch.
+        
+        `party_tensor` may be [P, F] for a single trade. Without a mask,
+        all-zero rows are treated as padding.
+        
+        Raises:
+            ValueError: If shapes are inconsistent or a trade has more than
+                MAX_PARTIES parties.
+        """
+        if party_tensor.dim() == 2:
+            party_tensor = party_tensor.unsqueeze(0)
+            if party_mask is not None and party_mask.dim() == 1:
+                party_mask = party_mask.unsqueeze(0)
+        if party_tensor.dim() != 3 or party_tensor.shape[-1] != PARTY_FEATURES:
+            raise ValueError(
+                f"party_tensor must be [T, P, {PARTY_FEATURES}], got {tuple(party_tensor.shape)}"
+            )
+        if party_tensor.shape[1] > MAX_PARTIES:
+            raise ValueError(f"At most {MAX_PARTIES} parties per trade, got {party_tensor.shape[1]}")
+        if party_mask is None:
+            party_mask = (party_tensor != 0).any(dim=-1)
+        if party_mask.shape != party_tensor.shape[:2]:
+            raise ValueError(
+                f"party_mask must be {tuple(party_tensor.shape[:2])}, got {tuple(party_mask.shape)}"
+            )
+        
+        self.party_tensor = party_tensor.float().contiguous()
+        self.party_mask = party_mask.bool().contiguous()
+
+    def encode_compact(self, manifold: torch.FloatTensor, equilibrium: torch.FloatTensor,
+                       wire_format: typing.Optional[str] = None):
+        """
+        Pack [T, manifold_dim] manifolds and [T, 2] equilibria into
+        `compact_payload` (a single trade may be passed as 1D tensors).
+        
+        Clears manifold_tensor/equilibrium_point so only the compact buffer
+        goes over the wire.
+        
+        Raises:
+            ValueError: If the format is unknown or shapes are invalid.
+        """
+        wire_format = wire_format or self.wire_format
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"Unknown wire_format {wire_format!r}, expected one of {list(WIRE_FORMATS)}")
+        
+        manifold = manifold.detach().cpu().float()
+        rows, cols = (1, manifold.numel()) if manifold.dim() < 2 else (manifold.shape[0], manifold[0].numel())
+        if equilibrium.numel() != 2 * rows:
+            raise ValueError(f"equilibrium_point must have 2 elements per trade ({rows} trades), got {equilibrium.numel()}")
+        matrix = manifold.reshape(rows, cols)
+        
+        if wire_format == "fp16":
+            scales = torch.ones(rows)
+            payload = matrix.half()
+        else:
+            max_abs = matrix.abs().amax(dim=1) if cols else torch.zeros(rows)
+            scales = torch.where(max_abs > 0, max_abs / 127.0, torch.ones_like(max_abs))
+            payload = torch.round(matrix / scales.unsqueeze(1)).clamp_(-127, 127).to(torch.int8)
+        
+        equilibrium_offset = _WIRE_HEADER.size + 4 * rows
+        manifold_offset = equilibrium_offset + 8 * rows
+        buffer = bytearray(manifold_offset + payload.numel() * payload.element_size())
+        _WIRE_HEADER.pack_into(buffer, 0, WIRE_VERSION, WIRE_FORMATS[wire_format], rows, cols)
+        buffer[_WIRE_HEADER.size:equilibrium_offset] = scales.numpy().tobytes()
+        buffer[equilibrium_offset:manifold_offset] = equilibrium.detach().cpu().float().numpy().tobytes()
+        buffer[manifold_offset:] = payload.numpy().tobytes()
+        
+        self.compact_payload = base64.b64encode(buffer).decode("ascii")
+        self.wire_format = wire_format
+        self.manifold_tensor = None
+        self.equilibrium_point = None
+
+    def _decode_compact(self) -> typing.Tuple[torch.FloatTensor, torch.FloatTensor]:
+        """
+        Decode `compact_payload` into fp32 tensors.
+        
+        The decoded bytes are parsed through read-only views; the only
+        copies are the conversions into the returned fp32 tensors.
+        """
+        buffer = base64.b64decode(self.compact_payload)
+        if len(buffer) < _WIRE_HEADER.size:
+            raise ValueError(f"compact_payload too short: {len(buffer)} bytes")
+        
+        version, fmt, rows, cols = _WIRE_HEADER.unpack_from(buffer, 0)
+        if version != WIRE_VERSION:
+            raise ValueError(f"Unsupported wire version {version}")
+        dtype = _WIRE_DTYPES.get(fmt)
+        if dtype is None:
+            raise ValueError(f"Unknown wire format code {fmt}")
+        
+        equilibrium_offset = _WIRE_HEADER.size + 4 * rows
+        manifold_offset = equilibrium_offset + 8 * rows
+        count = rows * cols
+        expected = manifold_offset + count * np.dtype(dtype).itemsize
+        if len(buffer) != expected:
+            raise ValueError(f"compact_payload has {len(buffer)} bytes, expected {expected}")
+        
+        scales = np.frombuffer(buffer, dtype="<f4", count=rows, offset=_WIRE_HEADER.size)
+        equilibrium = np.frombuffer(buffer, dtype="<f4", count=2 * rows, offset=equilibrium_offset)
+        manifold = np.frombuffer(buffer, dtype=dtype, count=count, offset=manifold_offset).reshape(rows, cols)
+        if fmt == WIRE_FORMATS["int8"]:
+            manifold = manifold * scales[:, None]
+        
+        return (
+            torch.from_numpy(manifold.astype(np.float32, copy=False)),
+            torch.from_numpy(equilibrium.reshape(rows, 2).copy()),
+        )
+
     def deserialize(self) -> typing.Tuple[torch.FloatTensor, torch.FloatTensor]:
         """
         Returns a tuple of (manifold, equilibrium).
         
+        Decodes `compact_payload` when the response used the compact encoding.
+        
         Raises:
             ValueError: If tensors have invalid shapes or are None.
         """
+        if self.compact_payload is not None:
+            return self._decode_compact()
+        
         if self.manifold_tensor is None or self.equilibrium_point is None:
             raise ValueError("Cannot deserialize: manifold_tensor or equilibrium_point is None")
         
@@ -45,8 +209,10 @@ class NashSynapse(bt.Synapse):
         if self.manifold_tensor.dim() < 1:
             raise ValueError(f"manifold_tensor must be at least 1D, got {self.manifold_tensor.dim()}D")
         
-        if self.equilibrium_point.numel() != 2:
-            raise ValueError(f"equilibrium_point must have 2 elements, got {self.equilibrium_point.numel()}")
+        if self.equilibrium_point.numel() == 0 or self.equilibrium_point.numel() % 2:
+            raise ValueError(
+                f"equilibrium_point must have 2 elements per trade, got {self.equilibrium_point.numel()}"
+            )
         
         # Ensure contiguous memory layout for faster processing
         manifold = self.manifold_tensor.contiguous()
@@ -61,27 +227,39 @@ class NashSynapse(bt.Synapse):
         Returns:
             bool: True if valid, False otherwise.
         """
-        if self.raw_intent is None:
+        # Party synapses may leave raw_intent unset
+        if self.raw_intent is None and self.party_tensor is None:
+            return False
+        
+        if self.raw_intent is not None and self.raw_intent.dim() < 1:
             return False
         
-        if self.raw_intent.dim() < 1:
+        if self.wire_format is not None and self.wire_format not in WIRE_FORMATS:
             return False
         
+        if self.party_tensor is not None:
+            if self.party_tensor.dim() != 3 or self.party_tensor.shape[-1] != PARTY_FEATURES:
+                return False
+            if self.party_tensor.shape[0] == 0 or self.party_tensor.shape[1] > MAX_PARTIES:
+                return False
+            if self.party_mask is None or self.party_mask.shape != self.party_tensor.shape[:2]:
+                return False
+        
         return True
     
     def __repr__(self) -> str:
         intent_shape = self.raw_intent.shape if self.raw_intent is not None else "None"
+        party_shape = self.party_tensor.shape if self.party_tensor is not None else "None"
         manifold_shape = self.manifold_tensor.shape if self.manifold_tensor is not None else "None"
         eq_shape = self.equilibrium_point.shape if self.equilibrium_point is not None else "None"
         
         return (
             f"NashSynapse(\n"
             f"  raw_intent: shape={intent_shape},\n"
+            f"  party_tensor: shape={party_shape},\n"
             f"  manifold_tensor: shape={manifold_shape},\n"
             f"  equilibrium_point: shape={eq_shape},\n"
+            f"  wire_format: {self.wire_format},\n"
             f"  context: {self.context}\n"
             f")"
         )
-```
-
----
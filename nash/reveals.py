@@ -0,0 +1,457 @@
+"""
+NASH Reveals - Post-settlement ground truth for the CommitmentModel.
+
+Once a settlement clears, its revealed outcome is the label the
+commitment model should have predicted (docs/incentive_mechanism.md).
+The validator logs the commitment vector of every challenge it sends;
+reveals arrive later, keyed by the same challenge id. Both go into one
+append-only log:
+
+    <dir>/<base offset, 20 digits>.log     segments, rolled at segment_bytes
+    record: [payload len u32][crc32 u32][kind u8][challenge id u64][payload f32...]
+
+Offsets are global byte positions, so a segment's file name is the
+offset of its first record and segments are contiguous.
+
+RevealConsumer tails the log from its checkpointed offset, joins each
+reveal with its commitment and hands matched (commitments, targets)
+batches to a callback - the validator's replay buffer, so the background
+trainer keeps updating the model online. Its checkpoint (offset plus the
+bounded tables of not-yet-matched records) is replaced atomically, so a
+restart resumes where it stopped without re-reading old segments, which
+are deleted once consumed.
+
+Optimizations:
+- Binary fixed-width records, appended in one write per batch
+- Torn tails detected by CRC and truncated on open
+- Bounded join tables (LRU) keep memory flat however many reveals never come
+"""
+
+import bittensor as bt
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+import bisect
+import os
+import struct
+import threading
+import time
+import zlib
+
+
+KIND_COMMITMENT = 1
+KIND_REVEAL = 2
+
+# Payload widths: commitment vector, and normalized [optimal_prob, utility, price, quantity]
+COMMITMENT_DIM = 32
+TARGET_DIM = 4
+_WIDTHS = {KIND_COMMITMENT: COMMITMENT_DIM, KIND_REVEAL: TARGET_DIM}
+
+_HEADER = struct.Struct("<IIBQ")
+_BODY = struct.Struct("<BQ")
+
+_SEGMENT_SUFFIX = ".log"
+
+
+def _segment_name(base: int) -> str:
+    return f"{base:020d}{_SEGMENT_SUFFIX}"
+
+
+def _encode(kind: int, ids: np.ndarray, rows: np.ndarray) -> bytes:
+    """Serialize N records of one kind."""
+    rows = np.ascontiguousarray(rows, dtype="<f4").reshape(len(ids), _WIDTHS[kind])
+    out = bytearray()
+    for challenge_id, row in zip(ids.tolist(), rows):
+        payload = row.tobytes()
+        body = _BODY.pack(kind, challenge_id) + payload
+        out += _HEADER.pack(len(payload), zlib.crc32(body), kind, challenge_id)
+        out += payload
+    return bytes(out)
+
+
+def _decode(buffer: bytes) -> Tuple[List[Tuple[int, int, np.ndarray]], int, bool]:
+    """
+    Parse complete records from the start of `buffer`.
+
+    Returns (records, bytes consumed, corrupt) where corrupt means parsing
+    stopped at a bad record rather than at the end of the data.
+    """
+    records = []
+    position = 0
+    while position + _HEADER.size <= len(buffer):
+        length, crc, kind, challenge_id = _HEADER.unpack_from(buffer, position)
+        width = _WIDTHS.get(kind)
+        if width is None or length != width * 4:
+            return records, position, True
+        end = position + _HEADER.size + length
+        if end > len(buffer):
+            break
+        payload = buffer[position + _HEADER.size:end]
+        if zlib.crc32(_BODY.pack(kind, challenge_id) + payload) != crc:
+            return records, position, True
+        records.append((kind, challenge_id, np.frombuffer(payload, dtype="<f4")))
+        position = end
+    return records, position, False
+
+
+class SegmentLog:
+    """
+    Append-only, segmented record log in `directory`.
+
+    One writer (the validator) and any number of readers (consumers);
+    appends are flushed to the OS immediately, fsynced on flush().
+
+    Args:
+        directory: Where segments live (created if missing)
+        segment_bytes: Size at which the active segment is sealed and a new one started
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = 16 << 20):
+        if segment_bytes < _HEADER.size + 4 * COMMITMENT_DIM:
+            raise ValueError(f"segment_bytes too small: {segment_bytes}")
+
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._bases = sorted(
+            int(name[:-len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(_SEGMENT_SUFFIX) and name[:-len(_SEGMENT_SUFFIX)].isdigit()
+        )
+        if not self._bases:
+            self._bases = [0]
+            open(self._path(0), "ab").close()
+
+        self._recover_tail()
+        base = self._bases[-1]
+        self._file = open(self._path(base), "ab")
+        self._end = base + self._file.tell()
+
+    def _path(self, base: int) -> str:
+        return os.path.join(self.directory, _segment_name(base))
+
+    def _recover_tail(self):
+        """Drop a torn or corrupt tail left by a crash mid-append."""
+        path = self._path(self._bases[-1])
+        with open(path, "rb") as f:
+            data = f.read()
+        _, valid, _ = _decode(data)
+        if valid < len(data):
+            bt.logging.warning(f"Truncating {len(data) - valid} bytes of torn records from {path}")
+            with open(path, "r+b") as f:
+                f.truncate(valid)
+
+    @property
+    def end_offset(self) -> int:
+        """Offset the next record will be written at."""
+        return self._end
+
+    @property
+    def start_offset(self) -> int:
+        """Offset of the oldest retained record."""
+        with self._lock:
+            return self._bases[0]
+
+    def append(self, kind: int, ids: np.ndarray, rows: np.ndarray) -> int:
+        """Append N records of one kind; returns the end offset after them."""
+        data = _encode(kind, np.asarray(ids, dtype=np.uint64).reshape(-1), rows)
+        with self._lock:
+            if self._file.tell() > 0 and self._file.tell() + len(data) > self.segment_bytes:
+                self._roll()
+            self._file.write(data)
+            self._file.flush()
+            self._end += len(data)
+            return self._end
+
+    def append_commitments(self, ids: np.ndarray, commitments: np.ndarray) -> int:
+        return self.append(KIND_COMMITMENT, ids, commitments)
+
+    def append_reveals(self, ids: np.ndarray, targets: np.ndarray) -> int:
+        return self.append(KIND_REVEAL, ids, targets)
+
+    def _roll(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._bases.append(self._end)
+        self._file = open(self._path(self._end), "ab")
+
+    def flush(self):
+        """fsync the active segment."""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def read(self, offset: int, max_bytes: int = 1 << 20) -> Tuple[List[Tuple[int, int, np.ndarray]], int]:
+        """
+        Records starting at `offset` (at most ~max_bytes of them).
+
+        Returns (records, next offset). Offsets before the oldest retained
+        segment resume from its start.
+        """
+        with self._lock:
+            bases = list(self._bases)
+            end = self._end
+        offset = max(offset, bases[0])
+
+        records: List[Tuple[int, int, np.ndarray]] = []
+        while offset < end and max_bytes > 0:
+            index = bisect.bisect_right(bases, offset) - 1
+            base = bases[index]
+            sealed = index + 1 < len(bases)
+            with open(self._path(base), "rb") as f:
+                f.seek(offset - base)
+                data = f.read(max_bytes)
+            at_end = len(data) < max_bytes
+
+            batch, consumed, corrupt = _decode(data)
+            records.extend(batch)
+            offset += consumed
+            max_bytes -= consumed
+
+            if corrupt:
+                if not sealed:
+                    break
+                bt.logging.error(f"Corrupt record at offset {offset} in a sealed segment, skipping to the next")
+                offset = bases[index + 1]
+            elif consumed == 0:
+                # End of a sealed segment: continue in the next one. Otherwise a
+                # record still being written, or a read budget smaller than a record
+                if not (sealed and at_end):
+                    break
+                offset = bases[index + 1]
+        return records, offset
+
+    def delete_before(self, offset: int) -> int:
+        """Delete sealed segments that end at or before `offset`; returns how many."""
+        deleted = 0
+        with self._lock:
+            while len(self._bases) > 1 and self._bases[1] <= offset:
+                os.remove(self._path(self._bases.pop(0)))
+                deleted += 1
+        return deleted
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "segments": len(self._bases),
+                "start_offset": self._bases[0],
+                "end_offset": self._end,
+            }
+
+
+class RevealConsumer:
+    """
+    Streams a SegmentLog, joins reveals with commitments by challenge id
+    and delivers matched rows to `on_samples(commitments, targets)`
+    ([B, 32] and [B, 4] float32 arrays).
+
+    Delivery is at-least-once: batches delivered after the last checkpoint
+    are delivered again after a crash, and a poll whose `on_samples`
+    raises is retried from the same offset and join state.
+
+    Args:
+        log: Log to consume
+        checkpoint_path: File holding the consumer offset and join state
+        on_samples: Callback for matched batches
+        pending_capacity: Max unmatched records kept per side (oldest dropped)
+        batch_size: Matched rows per callback
+        checkpoint_every: Records consumed between checkpoints
+        checkpoint_interval: Seconds after which an idle consumer checkpoints
+            records consumed since the last checkpoint
+        interval: Poll period of the background thread (seconds)
+        delete_consumed: Remove sealed segments once consumed
+    """
+
+    def __init__(
+        self,
+        log: SegmentLog,
+        checkpoint_path: str,
+        on_samples: Callable[[np.ndarray, np.ndarray], None],
+        pending_capacity: int = 65536,
+        batch_size: int = 256,
+        checkpoint_every: int = 4096,
+        checkpoint_interval: float = 30.0,
+        interval: float = 1.0,
+        delete_consumed: bool = True,
+    ):
+        if pending_capacity < 1 or batch_size < 1:
+            raise ValueError("pending_capacity and batch_size must be >= 1")
+
+        self.log = log
+        self.checkpoint_path = checkpoint_path
+        self.on_samples = on_samples
+        self.pending_capacity = pending_capacity
+        self.batch_size = batch_size
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.interval = interval
+        self.delete_consumed = delete_consumed
+
+        self.offset = log.start_offset
+        self._commitments: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._reveals: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._since_checkpoint = 0
+        self._last_checkpoint = time.monotonic()
+
+        self.records = 0
+        self.matched = 0
+        self.expired = 0
+
+        self._load_checkpoint()
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _load_checkpoint(self):
+        if not os.path.exists(self.checkpoint_path):
+            return
+        try:
+            with np.load(self.checkpoint_path) as state:
+                self.offset = int(state["offset"])
+                self.records, self.matched, self.expired = (int(v) for v in state["counters"])
+                for challenge_id, row in zip(state["commitment_ids"].tolist(), state["commitment_rows"]):
+                    self._commitments[challenge_id] = row
+                for challenge_id, row in zip(state["reveal_ids"].tolist(), state["reveal_rows"]):
+                    self._reveals[challenge_id] = row
+            bt.logging.info(f"Resuming reveal consumer at offset {self.offset}")
+        except Exception as e:
+            bt.logging.warning(f"Ignoring unreadable reveal checkpoint {self.checkpoint_path}: {e}")
+
+    def checkpoint(self):
+        """Atomically persist the offset and join tables (write-then-rename)."""
+        def table(pending: "OrderedDict[int, np.ndarray]", width: int):
+            ids = np.fromiter(pending.keys(), dtype=np.uint64, count=len(pending))
+            rows = np.stack(list(pending.values())) if pending else np.zeros((0, width), dtype=np.float32)
+            return ids, rows
+
+        commitment_ids, commitment_rows = table(self._commitments, COMMITMENT_DIM)
+        reveal_ids, reveal_rows = table(self._reveals, TARGET_DIM)
+        tmp_path = self.checkpoint_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    offset=np.int64(self.offset),
+                    counters=np.array([self.records, self.matched, self.expired], dtype=np.int64),
+                    commitment_ids=commitment_ids,
+                    commitment_rows=commitment_rows,
+                    reveal_ids=reveal_ids,
+                    reveal_rows=reveal_rows,
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.checkpoint_path)
+        except Exception as e:
+            bt.logging.error(f"Failed to checkpoint reveal consumer: {e}")
+            return
+        self._since_checkpoint = 0
+        self._last_checkpoint = time.monotonic()
+        if self.delete_consumed:
+            self.log.delete_before(self.offset)
+
+    def _remember(self, pending: "OrderedDict[int, np.ndarray]", challenge_id: int, row: np.ndarray):
+        pending[challenge_id] = row
+        pending.move_to_end(challenge_id)
+        if len(pending) > self.pending_capacity:
+            pending.popitem(last=False)
+            self.expired += 1
+
+    def _deliver(self, commitments: List[np.ndarray], targets: List[np.ndarray]):
+        for start in range(0, len(commitments), self.batch_size):
+            self.on_samples(
+                np.stack(commitments[start:start + self.batch_size]).astype(np.float32),
+                np.stack(targets[start:start + self.batch_size]).astype(np.float32),
+            )
+
+    def poll(self, max_bytes: int = 1 << 20) -> int:
+        """
+        Consume what is available (up to ~max_bytes); returns records read.
+
+        Joins are staged and applied only after every matched row has been
+        delivered, so if `on_samples` raises, the offset and join tables are
+        untouched and the next poll retries the same records.
+        """
+        records, next_offset = self.log.read(self.offset, max_bytes)
+        tables = {KIND_COMMITMENT: self._commitments, KIND_REVEAL: self._reveals}
+        # Unmatched rows read by this poll, and stored rows it matched
+        staged = {KIND_COMMITMENT: OrderedDict(), KIND_REVEAL: OrderedDict()}
+        taken = {KIND_COMMITMENT: set(), KIND_REVEAL: set()}
+        commitments, targets = [], []
+        for kind, challenge_id, row in records:
+            other = KIND_REVEAL if kind == KIND_COMMITMENT else KIND_COMMITMENT
+            match = staged[other].pop(challenge_id, None)
+            if match is None and challenge_id not in taken[other]:
+                match = tables[other].get(challenge_id)
+                if match is not None:
+                    taken[other].add(challenge_id)
+            if match is None:
+                # A reveal may arrive ahead of (or without) its commitment
+                staged[kind][challenge_id] = row
+            elif kind == KIND_COMMITMENT:
+                commitments.append(row)
+                targets.append(match)
+            else:
+                commitments.append(match)
+                targets.append(row)
+
+        # Everything read is delivered before the offset moves past it
+        self._deliver(commitments, targets)
+        for kind, table in tables.items():
+            for challenge_id in taken[kind]:
+                del table[challenge_id]
+            for challenge_id, row in staged[kind].items():
+                self._remember(table, challenge_id, row)
+        self.matched += len(commitments)
+        self.offset = next_offset
+        self.records += len(records)
+        self._since_checkpoint += len(records)
+        if self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+        return len(records)
+
+    def start(self):
+        """Start consuming on a daemon thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="nash-reveals", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop consuming and checkpoint."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.checkpoint()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.poll():
+                    continue
+            except Exception as e:
+                bt.logging.error(f"Reveal consumer failed: {e}")
+            # Idle: persist a partial batch of progress, at most once per interval
+            if self._since_checkpoint and time.monotonic() - self._last_checkpoint >= self.checkpoint_interval:
+                self.checkpoint()
+            self._stop.wait(self.interval)
+
+    def stats(self) -> dict:
+        return {
+            "offset": self.offset,
+            "lag_bytes": self.log.end_offset - self.offset,
+            "records": self.records,
+            "matched": self.matched,
+            "pending_commitments": len(self._commitments),
+            "pending_reveals": len(self._reveals),
+            "expired": self.expired,
+            **self.log.stats(),
+        }
@@ -0,0 +1,185 @@
+"""
+NASH Sessions - Warm-started re-solves for evolving intents.
+
+Agents revise an order in small steps, and each revision used to be solved
+from scratch. The miner's encoder and solver are stacks of Linear + ReLU
+layers, so the fused model is piecewise affine: within the region where
+every ReLU keeps its on/off state, output = A @ intent + c exactly.
+
+A session remembers, for its last intent, the pre-activations of every
+ReLU, their Jacobian w.r.t. the intent and the affine map of the outputs.
+A revised intent costs one [H, D] @ [D] product to move the
+pre-activations by the delta; if no ReLU changes state, the new manifold
+and equilibrium follow from the stored affine map (exact, not an
+approximation). Only when the revision crosses a region boundary is
+the full solve run, which also re-linearizes the session.
+
+Cost per warm re-quote: ~(H + manifold_dim + 2) * D multiply-adds
+versus the full encoder + solver stack (H = total hidden width).
+"""
+
+import torch
+import torch.nn as nn
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, List, Optional, Tuple, Union
+
+
+# Context keys identifying a session, in order of preference
+SESSION_KEYS = ("session_id", "order_id", "agent_id")
+
+
+def session_key(context: Optional[dict]) -> Optional[Hashable]:
+    """Session identifier from a synapse context, or None if it has none."""
+    if not context:
+        return None
+    for name in SESSION_KEYS:
+        value = context.get(name)
+        if value is not None:
+            return (name, str(value))
+    return None
+
+
+@dataclass
+class SessionState:
+    """Linearization of the fused model around a session's last intent."""
+    intent: torch.Tensor               # [D]
+    pre_activations: torch.Tensor      # [H] inputs of every ReLU
+    active: torch.Tensor               # [H] bool, pre_activations > 0
+    jacobian: torch.Tensor             # [H, D] d pre_activations / d intent
+    manifold: torch.Tensor             # [manifold_dim]
+    equilibrium: torch.Tensor          # [2]
+    manifold_jacobian: torch.Tensor    # [manifold_dim, D]
+    equilibrium_jacobian: torch.Tensor # [2, D]
+    generation: int = 0
+
+
+class PiecewiseAffineModel:
+    """
+    Encoder -> solver viewed as one stack of Linear / ReLU layers.
+
+    Raises:
+        ValueError: If either network holds anything else (quantized or
+            bf16 layers, other activations), which breaks exactness.
+    """
+
+    def __init__(self, encoder: nn.Module, solver: nn.Module):
+        self.layers: List[Union[nn.Linear, nn.ReLU]] = []
+        boundary = None
+        for network in (encoder, solver):
+            if getattr(network, "compute_dtype", torch.float32) != torch.float32:
+                raise ValueError("Warm re-solves need fp32 models")
+            for module in network.modules():
+                if type(module) is nn.Linear:
+                    if module.weight.dtype != torch.float32:
+                        raise ValueError("Warm re-solves need fp32 models")
+                    self.layers.append(module)
+                elif type(module) is nn.ReLU:
+                    self.layers.append(module)
+                elif len(list(module.children())) == 0:
+                    raise ValueError(f"Unsupported layer for warm re-solves: {type(module).__name__}")
+            if boundary is None:
+                boundary = len(self.layers)
+        # Index after which the encoder output (the manifold) is available
+        self._manifold_at = boundary
+
+    @torch.no_grad()
+    def linearize(self, intent: torch.Tensor) -> SessionState:
+        """Full solve of one [D] intent, keeping the region's affine maps."""
+        h = intent.float()
+        jacobian = torch.eye(h.shape[0], device=h.device)
+        pre_activations, jacobians = [], []
+        manifold = manifold_jacobian = None
+
+        for index, layer in enumerate(self.layers):
+            if isinstance(layer, nn.Linear):
+                h = layer(h)
+                jacobian = layer.weight @ jacobian
+            else:
+                pre_activations.append(h)
+                jacobians.append(jacobian)
+                on = h > 0
+                h = h * on
+                jacobian = jacobian * on.unsqueeze(1)
+            if index + 1 == self._manifold_at:
+                manifold, manifold_jacobian = h, jacobian
+
+        pre = torch.cat(pre_activations)
+        return SessionState(
+            intent=intent.float().clone(),
+            pre_activations=pre,
+            active=pre > 0,
+            jacobian=torch.cat(jacobians),
+            manifold=manifold,
+            equilibrium=h,
+            manifold_jacobian=manifold_jacobian,
+            equilibrium_jacobian=jacobian,
+        )
+
+    @torch.no_grad()
+    def refine(self, state: SessionState, intent: torch.Tensor) -> Optional[Tuple[torch.Tensor, torch.Tensor]]:
+        """
+        Outputs for a revised [D] intent from the session's affine maps,
+        or None if the revision leaves the linear region.
+        """
+        delta = intent.float() - state.intent
+        pre = state.pre_activations + state.jacobian @ delta
+        if not torch.equal(pre > 0, state.active):
+            return None
+        manifold = state.manifold + state.manifold_jacobian @ delta
+        equilibrium = state.equilibrium + state.equilibrium_jacobian @ delta
+        return manifold, equilibrium
+
+
+class SessionStore:
+    """
+    Bounded LRU map of session key -> SessionState.
+
+    Args:
+        capacity: Maximum number of sessions before LRU eviction
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self._sessions: "OrderedDict[Hashable, SessionState]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, key: Hashable, generation: int) -> Optional[SessionState]:
+        """State for `key` if it was built with the current weights generation."""
+        state = self._sessions.get(key)
+        if state is None:
+            return None
+        if state.generation != generation:
+            del self._sessions[key]
+            return None
+        self._sessions.move_to_end(key)
+        return state
+
+    def put(self, key: Hashable, state: SessionState):
+        self._sessions[key] = state
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.capacity:
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._sessions.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "sessions": len(self._sessions),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
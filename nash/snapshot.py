@@ -0,0 +1,123 @@
+"""
+NASH Warm-Start Snapshots - Restart a miner without rebuilding it.
+
+A snapshot is a single file holding everything the miner computes at
+startup: the state dicts of the (possibly bf16 / INT8 converted) encoder,
+solver and multi-party encoder, the serialized TorchScript or ONNX graphs
+for flat intents and packed parties, and the calibration and parity
+reports. Only tensors and
+plain containers are stored, so snapshots load with weights_only=True. Restoring skips calibration, tracing/exporting and parity
+checks; only a short warmup remains, so a crash-restarted miner is
+serving again within a second.
+
+Snapshots are keyed on the miner configuration, torch version and device
+type; any mismatch means the snapshot is ignored and rebuilt.
+"""
+
+import bittensor as bt
+import torch
+import torch.nn as nn
+from typing import Dict, Optional
+import os
+
+from nash.precision import apply_precision
+
+
+SNAPSHOT_VERSION = 4
+
+
+def snapshot_key(config: Dict[str, object], device: torch.device) -> Dict[str, object]:
+    """Everything a snapshot must match to be reused."""
+    return {
+        "version": SNAPSHOT_VERSION,
+        "torch": str(torch.__version__),
+        "device_type": torch.device(device).type,
+        "config": dict(config),
+    }
+
+
+def _to_tensor(data: Optional[bytes]) -> Optional[torch.Tensor]:
+    """Serialized graph bytes as a uint8 tensor, which weights_only loading accepts."""
+    if data is None:
+        return None
+    return torch.frombuffer(bytearray(data), dtype=torch.uint8)
+
+
+def save_miner_snapshot(
+    path: str,
+    key: Dict[str, object],
+    encoder: nn.Module,
+    solver: nn.Module,
+    party_encoder: nn.Module,
+    backend_name: str,
+    backend_data: Optional[bytes],
+    precision: str,
+    precision_report: dict,
+    backend_parity: Optional[dict],
+    party_backend_name: str = "eager",
+    party_backend_data: Optional[bytes] = None,
+    party_backend_parity: Optional[dict] = None,
+    weights_fingerprint: Optional[str] = None,
+):
+    """
+    Write a snapshot atomically (write-then-rename).
+
+    `weights_fingerprint` identifies the checkpoint the weights came from,
+    so a restored miner knows not to reload the same checkpoint.
+    """
+    state = {
+        "key": key,
+        "encoder": encoder.state_dict(),
+        "solver": solver.state_dict(),
+        "party_encoder": party_encoder.state_dict(),
+        "backend": backend_name,
+        "backend_data": _to_tensor(backend_data),
+        "precision": precision,
+        "precision_report": precision_report,
+        "backend_parity": backend_parity,
+        "party_backend": party_backend_name,
+        "party_backend_data": _to_tensor(party_backend_data),
+        "party_backend_parity": party_backend_parity,
+        "weights_fingerprint": weights_fingerprint,
+    }
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        torch.save(state, tmp_path)
+        os.replace(tmp_path, path)
+        bt.logging.info(f"Saved warm-start snapshot to {path}")
+    except Exception as e:
+        bt.logging.error(f"Failed to save snapshot to {path}: {e}")
+
+
+def load_miner_snapshot(
+    path: str,
+    key: Dict[str, object],
+    device: torch.device
+) -> Optional[dict]:
+    """Load a snapshot if it exists and matches `key`, else None."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        state = torch.load(path, map_location=device, weights_only=True)
+    except Exception as e:
+        bt.logging.warning(f"Ignoring unreadable snapshot {path}: {e}")
+        return None
+
+    if state.get("key") != key:
+        bt.logging.info(f"Snapshot {path} was built for a different configuration, rebuilding")
+        return None
+    for name in ("backend_data", "party_backend_data"):
+        if state[name] is not None:
+            state[name] = state[name].cpu().numpy().tobytes()
+    return state
+
+
+def restore_module(module: nn.Module, state_dict: dict, precision: str) -> nn.Module:
+    """
+    Rebuild a snapshotted model: convert a freshly built `module` to
+    `precision` so its layers match the saved ones, then load the weights.
+    """
+    module = apply_precision(module.eval(), precision)
+    module.load_state_dict(state_dict)
+    return module.eval()
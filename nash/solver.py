@@ -1,16 +1,605 @@
+"""
+NASH Equilibrium Solver - Batched multi-party settlement engine.
 
-```
-NASH Nash Equilibrium Solver - DEMO
-============================================================
-
-Parties: ['chutes', 'nodexo', 'compute_horde']
-Buyers: ['chutes']
-Sellers: ['nodexo']
-Deferrers: ['compute_horde']
-
-✓ Settlement found!
-  Price: $1.99/hr
-  Quantity: 300 GPU-hours
-  Pareto Optimal: True
-  Utilities: {'chutes': 0.40, 'nodexo': 0.56, 'compute_horde': 0.60}
-```
+Solves thousands of independent 2-6 party settlement problems per call.
+Each problem is cleared as a uniform-price market:
+
+- BUY parties demand `quantity` at prices up to `price_max`
+- SELL parties supply `quantity` at prices from `price_min`
+- DEFER parties release `quantity` (e.g. deferred batch jobs) for a
+  rebate of at least `price_min`, so they act as suppliers
+- SWAP parties buy below `price_min` and sell above `price_max`
+
+Two parties can only trade if they reach each other within both latency
+limits (region-to-region latency table). The volume at a price is the
+maximum flow of a capacity-constrained bipartite matching: willing buyers
+and sellers are capped at their quantity, and only compatible pairs are
+matched.
+
+Optimizations:
+- Padded [B, P] array layout, no per-problem Python loops
+- Candidate clearing prices evaluated for all problems at once
+- Matchings for every (problem, price) found by shortest augmenting paths
+  advanced in lockstep
+- Nash bargaining midpoint over the volume-maximizing price interval
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+# ============================================================================
+# Party Definitions
+# ============================================================================
+
+class IntentType(IntEnum):
+    """What a party wants to do in the settlement."""
+    BUY = 0
+    SELL = 1
+    SWAP = 2
+    DEFER = 3
+
+
+class Region(IntEnum):
+    """Where a party's resources are located."""
+    US = 0
+    EU = 1
+    ASIA = 2
+
+
+# Approximate round-trip latency between regions (ms), indexed [Region, Region]
+REGION_LATENCY_MS = np.array([
+    [10.0, 80.0, 160.0],
+    [80.0, 10.0, 200.0],
+    [160.0, 200.0, 10.0],
+], dtype=np.float32)
+
+# Normalization constants shared with the validator's CommitmentModel
+PRICE_SCALE = 3.0
+QUANTITY_SCALE = 500.0
+LATENCY_SCALE = 200.0
+
+MAX_PARTIES = 6
+
+
+@dataclass
+class Party:
+    """A single participant in a settlement problem."""
+    name: str
+    intent: IntentType
+    price_min: float
+    price_max: float
+    quantity: float
+    max_latency_ms: float = 100.0
+    region: Region = Region.US
+    time_horizon: float = 0.5
+
+
+@dataclass
+class PartyBatch:
+    """
+    Padded array layout for B problems with up to P parties each.
+
+    All arrays have shape [B, P]; `mask` marks real (non-padding) parties.
+    """
+    intent: np.ndarray
+    price_min: np.ndarray
+    price_max: np.ndarray
+    quantity: np.ndarray
+    max_latency_ms: np.ndarray
+    region: np.ndarray
+    time_horizon: np.ndarray
+    mask: np.ndarray
+    names: Optional[List[List[str]]] = None
+
+    def __len__(self) -> int:
+        return self.mask.shape[0]
+
+    @property
+    def max_parties(self) -> int:
+        return self.mask.shape[1]
+
+    @classmethod
+    def from_parties(
+        cls,
+        problems: Sequence[Sequence[Party]],
+        max_parties: Optional[int] = None
+    ) -> "PartyBatch":
+        """Pack a list of problems (each a list of Party) into padded arrays."""
+        if max_parties is None:
+            max_parties = max((len(p) for p in problems), default=0)
+
+        batch = cls.empty(len(problems), max_parties)
+        batch.names = []
+        for b, parties in enumerate(problems):
+            if len(parties) > max_parties:
+                raise ValueError(f"Problem {b} has {len(parties)} parties, max is {max_parties}")
+            batch.names.append([p.name for p in parties])
+            for i, party in enumerate(parties):
+                batch.intent[b, i] = int(party.intent)
+                batch.price_min[b, i] = party.price_min
+                batch.price_max[b, i] = party.price_max
+                batch.quantity[b, i] = party.quantity
+                batch.max_latency_ms[b, i] = party.max_latency_ms
+                batch.region[b, i] = int(party.region)
+                batch.time_horizon[b, i] = party.time_horizon
+                batch.mask[b, i] = True
+        return batch
+
+    @classmethod
+    def empty(cls, batch_size: int, max_parties: int) -> "PartyBatch":
+        """Allocate an all-padding batch."""
+        shape = (batch_size, max_parties)
+        return cls(
+            intent=np.zeros(shape, dtype=np.int8),
+            price_min=np.zeros(shape, dtype=np.float32),
+            price_max=np.zeros(shape, dtype=np.float32),
+            quantity=np.zeros(shape, dtype=np.float32),
+            max_latency_ms=np.zeros(shape, dtype=np.float32),
+            region=np.zeros(shape, dtype=np.int8),
+            time_horizon=np.zeros(shape, dtype=np.float32),
+            mask=np.zeros(shape, dtype=bool),
+        )
+
+    def to_parties(self, index: int) -> List[Party]:
+        """Unpack problem `index` back into Party objects."""
+        parties = []
+        for i in np.flatnonzero(self.mask[index]):
+            name = self.names[index][i] if self.names else f"party_{i}"
+            parties.append(Party(
+                name=name,
+                intent=IntentType(int(self.intent[index, i])),
+                price_min=float(self.price_min[index, i]),
+                price_max=float(self.price_max[index, i]),
+                quantity=float(self.quantity[index, i]),
+                max_latency_ms=float(self.max_latency_ms[index, i]),
+                region=Region(int(self.region[index, i])),
+                time_horizon=float(self.time_horizon[index, i]),
+            ))
+        return parties
+
+    def features(self) -> np.ndarray:
+        """
+        Build [B, P, 8] per-party feature rows, zero for padding parties.
+
+        Layout (shared with commitments and NashSynapse.party_tensor):
+        [price, quantity, latency, region, buyer, seller, deferrer, time_horizon]
+        """
+        out = np.zeros((len(self), self.max_parties, 8), dtype=np.float32)
+        intent = self.intent
+
+        out[..., 0] = (self.price_min + self.price_max) / (2.0 * PRICE_SCALE)
+        out[..., 1] = self.quantity / QUANTITY_SCALE
+        out[..., 2] = np.minimum(self.max_latency_ms / LATENCY_SCALE, 1.0)
+        out[..., 3] = self.region
+        out[..., 4] = (intent == IntentType.BUY) | (intent == IntentType.SWAP)
+        out[..., 5] = (intent == IntentType.SELL) | (intent == IntentType.SWAP)
+        out[..., 6] = intent == IntentType.DEFER
+        out[..., 7] = self.time_horizon
+        out *= self.mask[..., None]
+        return out
+
+    def commitments(self, num_parties: int = 4) -> np.ndarray:
+        """
+        Build [B, num_parties * 8] commitment vectors.
+
+        The first num_parties rows of features(), flattened and zero-padded.
+        """
+        p = min(num_parties, self.max_parties)
+        out = np.zeros((len(self), num_parties, 8), dtype=np.float32)
+        out[:, :p] = self.features()[:, :p]
+        return out.reshape(len(self), num_parties * 8)
+
+    def intents(self, dim: int = 10) -> np.ndarray:
+        """
+        Build [B, dim] raw intent vectors for miners.
+
+        Interleaves normalized (mid price, quantity) per party, zero-padded.
+        """
+        pairs = np.stack([
+            (self.price_min + self.price_max) / (2.0 * PRICE_SCALE),
+            self.quantity / QUANTITY_SCALE,
+        ], axis=-1) * self.mask[..., None]
+        flat = pairs.reshape(len(self), -1)[:, :dim]
+        out = np.zeros((len(self), dim), dtype=np.float32)
+        out[:, :flat.shape[1]] = flat
+        return out
+
+
+def max_matching(demand: np.ndarray, supply: np.ndarray, edges: np.ndarray, eps: float = 1e-6) -> np.ndarray:
+    """
+    Maximum-volume matchings for N small bipartite graphs at once.
+
+    Args:
+        demand: [N, P] quantity each party buys (0 for non-buyers)
+        supply: [N, P] quantity each party sells (0 for non-sellers)
+        edges: [N, P, P] bool, buyer i may trade with seller j (uncapacitated)
+
+    Returns:
+        [N, P, P] float32 flow from buyer i to seller j. Found with
+        Edmonds-Karp (breadth-first augmenting paths); every graph with a
+        path left is augmented once per iteration.
+    """
+    n, p = demand.shape
+    flow = np.zeros((n, p, p), dtype=np.float32)
+    demand = demand.astype(np.float32)  # residual source -> buyer capacity
+    supply = supply.astype(np.float32)  # residual seller -> sink capacity
+    is_seller = supply > 0
+
+    graphs = np.flatnonzero((demand > eps).any(axis=1) & (supply > eps).any(axis=1) & edges.any(axis=(1, 2)))
+    while graphs.size:
+        d, s, e, f, seller = demand[graphs], supply[graphs], edges[graphs], flow[graphs], is_seller[graphs]
+        rows = np.arange(graphs.size)
+
+        # Breadth-first search from the source; parent -1 marks a buyer fed by the source
+        reached = d > eps
+        parent = np.full(d.shape, -1)
+        frontier = reached
+        for _ in range(2 * p):
+            forward = frontier[:, :, None] & e            # buyer i -> seller j
+            backward = frontier[:, None, :] & (f > eps)   # seller j -> buyer i (undo matched flow)
+            to_seller = forward.any(axis=1) & ~reached
+            to_buyer = backward.any(axis=2) & ~reached
+            frontier = to_seller | to_buyer
+            if not frontier.any():
+                break
+            parent = np.where(to_seller, forward.argmax(axis=1), parent)
+            parent = np.where(to_buyer, backward.argmax(axis=2), parent)
+            reached = reached | frontier
+
+        sinks = reached & (s > eps)
+        found = sinks.any(axis=1)
+        if not found.any():
+            break
+        graphs = graphs[found]
+        d, s, f, seller, parent = d[found], s[found], f[found], seller[found], parent[found]
+        rows = np.arange(graphs.size)
+        end = sinks[found].argmax(axis=1)
+
+        # Bottleneck along each path, walking parents back to the source
+        bottleneck = s[rows, end]
+        node, walking = end, np.ones(graphs.size, dtype=bool)
+        for _ in range(2 * p):
+            up = parent[rows, node]
+            from_source = walking & (up < 0)
+            undo = walking & (up >= 0) & ~seller[rows, node]
+            bottleneck = np.where(from_source, np.minimum(bottleneck, d[rows, node]), bottleneck)
+            bottleneck = np.where(undo, np.minimum(bottleneck, f[rows, node, up]), bottleneck)
+            walking = walking & (up >= 0)
+            if not walking.any():
+                break
+            node = np.where(walking, up, node)
+
+        # Augment: same walk, applying the bottleneck
+        s[rows, end] -= bottleneck
+        node, walking = end, np.ones(graphs.size, dtype=bool)
+        for _ in range(2 * p):
+            up = parent[rows, node]
+            from_source = walking & (up < 0)
+            d[rows[from_source], node[from_source]] -= bottleneck[from_source]
+            into_seller = walking & (up >= 0) & seller[rows, node]
+            f[rows[into_seller], up[into_seller], node[into_seller]] += bottleneck[into_seller]
+            undo = walking & (up >= 0) & ~seller[rows, node]
+            f[rows[undo], node[undo], up[undo]] -= bottleneck[undo]
+            walking = walking & (up >= 0)
+            if not walking.any():
+                break
+            node = np.where(walking, up, node)
+
+        demand[graphs], supply[graphs], flow[graphs] = d, s, f
+    return flow
+
+
+@dataclass
+class Settlement:
+    """Settlement for a single problem."""
+    price: float
+    quantity: float
+    utilities: Dict[str, float]
+    pareto_optimal: bool
+    settled: bool
+
+
+@dataclass
+class SettlementBatch:
+    """
+    Settlements for B problems.
+
+    price, quantity, pareto_optimal, settled: [B]
+    utilities, participating: [B, P] (zero/False for padding parties)
+    """
+    price: np.ndarray
+    quantity: np.ndarray
+    utilities: np.ndarray
+    participating: np.ndarray
+    pareto_optimal: np.ndarray
+    settled: np.ndarray
+
+    def __len__(self) -> int:
+        return self.price.shape[0]
+
+    def targets(self, mask: np.ndarray) -> np.ndarray:
+        """
+        Ground-truth targets for the CommitmentModel: [B, 4] in [0, 1].
+
+        Layout: [optimal_prob, utility, price / 3, quantity / 500]
+        """
+        counts = np.maximum(mask.sum(axis=1), 1)
+        mean_utility = (self.utilities * mask).sum(axis=1) / counts
+        return np.stack([
+            self.pareto_optimal.astype(np.float32),
+            mean_utility,
+            np.clip(self.price / PRICE_SCALE, 0.0, 1.0),
+            np.clip(self.quantity / QUANTITY_SCALE, 0.0, 1.0),
+        ], axis=1).astype(np.float32)
+
+
+# ============================================================================
+# Nash Solver
+# ============================================================================
+
+class NashSolver:
+    """
+    Vectorized uniform-price settlement solver.
+
+    For every problem, all party reservation prices are candidate clearing
+    prices. The solver picks the interval of candidates that maximizes
+    matched volume and settles at its midpoint (the symmetric Nash
+    bargaining point between the marginal buyer and seller).
+
+    A settlement is Pareto optimal if no trade that benefits both sides is
+    left after its matching (see _pareto_optimal).
+    """
+
+    def __init__(self, latency_matrix: np.ndarray = REGION_LATENCY_MS):
+        self.latency_matrix = np.asarray(latency_matrix, dtype=np.float32)
+
+    def solve(self, parties: Sequence[Party]) -> Settlement:
+        """Solve a single problem. Convenience wrapper around solve_batch."""
+        batch = PartyBatch.from_parties([parties])
+        result = self.solve_batch(batch)
+        return Settlement(
+            price=float(result.price[0]),
+            quantity=float(result.quantity[0]),
+            utilities={
+                party.name: float(result.utilities[0, i])
+                for i, party in enumerate(parties)
+            },
+            pareto_optimal=bool(result.pareto_optimal[0]),
+            settled=bool(result.settled[0]),
+        )
+
+    def solve_batch(self, batch: PartyBatch) -> SettlementBatch:
+        """Solve every problem in `batch` at once."""
+        mask = batch.mask
+        compat = self._compatibility(batch)
+
+        # Candidate prices: every party's reservation prices, [B, 2P]
+        candidates = np.concatenate([batch.price_min, batch.price_max], axis=1)
+        candidate_mask = np.concatenate([mask, mask], axis=1)
+
+        volume, _, _, _ = self._clear(batch, compat, candidates)
+        volume = np.where(candidate_mask, volume, -1.0)
+
+        # Volume-maximizing interval of candidate prices
+        best_volume = volume.max(axis=1)
+        at_best = (volume >= best_volume[:, None] - 1e-6) & candidate_mask
+        low = np.where(at_best, candidates, np.inf).min(axis=1)
+        high = np.where(at_best, candidates, -np.inf).max(axis=1)
+        midpoint = (low + high) / 2.0
+
+        # Fall back to the lowest best candidate if the midpoint falls in a gap
+        mid_volume, _, _, _ = self._clear(batch, compat, midpoint[:, None])
+        price = np.where(mid_volume[:, 0] >= best_volume - 1e-6, midpoint, low)
+
+        quantity, buys, sells, flow = self._clear(batch, compat, price[:, None])
+        quantity, buys, sells, flow = quantity[:, 0], buys[:, 0], sells[:, 0], flow[:, 0]
+
+        settled = (quantity > 0) & np.isfinite(price)
+        price = np.where(settled, price, 0.0).astype(np.float32)
+        quantity = np.where(settled, quantity, 0.0).astype(np.float32)
+        flow = flow * settled[:, None, None]
+        bought, sold = flow.sum(axis=2), flow.sum(axis=1)
+
+        utilities = self._utilities(batch, price, buys, sells, bought, sold)
+        utilities *= settled[:, None]
+
+        return SettlementBatch(
+            price=price,
+            quantity=quantity,
+            utilities=utilities.astype(np.float32),
+            participating=((bought > 0) | (sold > 0)) & settled[:, None],
+            pareto_optimal=self._pareto_optimal(batch, compat, flow, bought, sold),
+            settled=settled,
+        )
+
+    def _compatibility(self, batch: PartyBatch) -> np.ndarray:
+        """[B, P, P] bool: parties i and j can reach each other within both latency limits."""
+        region = batch.region.astype(np.intp)
+        latency = self.latency_matrix[region[:, :, None], region[:, None, :]]
+        limit = np.minimum(batch.max_latency_ms[:, :, None], batch.max_latency_ms[:, None, :])
+        pair_mask = batch.mask[:, :, None] & batch.mask[:, None, :]
+        compat = (latency <= limit) & pair_mask
+        diag = np.arange(batch.max_parties)
+        compat[:, diag, diag] = False
+        return compat
+
+    def _sides(self, batch: PartyBatch, prices: np.ndarray):
+        """Which parties want to buy/sell at each of K prices: two [B, K, P] bool arrays."""
+        p = prices[:, :, None]
+        intent = batch.intent[:, None, :]
+        price_min = batch.price_min[:, None, :]
+        price_max = batch.price_max[:, None, :]
+        mask = batch.mask[:, None, :]
+
+        buys = (
+            ((intent == IntentType.BUY) & (p <= price_max))
+            | ((intent == IntentType.SWAP) & (p <= price_min))
+        )
+        sells = (
+            (((intent == IntentType.SELL) | (intent == IntentType.DEFER)) & (p >= price_min))
+            | ((intent == IntentType.SWAP) & (p >= price_max))
+        )
+        return buys & mask, sells & mask
+
+    def _clear(self, batch: PartyBatch, compat: np.ndarray, prices: np.ndarray):
+        """
+        Evaluate the market at [B, K] prices.
+
+        Returns volume, buys, sells, flow with shapes [B, K], [B, K, P],
+        [B, K, P], [B, K, P, P]; flow is the maximum matching between the
+        parties willing to trade at each price (buyer i -> seller j).
+        """
+        buys, sells = self._sides(batch, prices)
+        b, k, p = buys.shape
+        quantity = batch.quantity[:, None, :]
+        edges = compat[:, None] & buys[..., :, None] & sells[..., None, :]
+
+        flow = max_matching(
+            (buys * quantity).reshape(b * k, p),
+            (sells * quantity).reshape(b * k, p),
+            edges.reshape(b * k, p, p),
+        ).reshape(b, k, p, p)
+        volume = flow.sum(axis=(2, 3))
+        return volume, buys, sells, flow
+
+    def _pareto_optimal(self, batch: PartyBatch, compat: np.ndarray, flow: np.ndarray,
+                        bought: np.ndarray, sold: np.ndarray) -> np.ndarray:
+        """
+        [B] bool: the matching leaves no trade that benefits both sides.
+
+        Such a trade exists when a party with unfilled buy quantity reaches
+        a party with unsold quantity in the residual graph (a new trade on a
+        compatible pair, possibly moving matched quantity to another
+        counterparty) and the buyer's reservation price is above the
+        seller's, so both gain at a price in between.
+        """
+        intent, mask = batch.intent, batch.mask
+        is_swap = intent == IntentType.SWAP
+        can_buy = ((intent == IntentType.BUY) | is_swap) & mask
+        can_sell = ((intent == IntentType.SELL) | (intent == IntentType.DEFER) | is_swap) & mask
+        buy_reservation = np.where(is_swap, batch.price_min, batch.price_max)
+        sell_reservation = np.where(is_swap, batch.price_max, batch.price_min)
+
+        left = batch.quantity - bought - sold
+        wants_buy = can_buy & (left > 1e-3)
+        wants_sell = can_sell & (left > 1e-3)
+
+        # Residual graph: any compatible buyer -> seller, and seller -> buyer along matched flow
+        residual = (compat & can_buy[:, :, None] & can_sell[:, None, :]) | (flow > 1e-6).transpose(0, 2, 1)
+        reach = residual
+        for _ in range(batch.max_parties):
+            reach = reach | (np.matmul(reach.astype(np.float32), residual.astype(np.float32)) > 0)
+
+        gain = buy_reservation[:, :, None] > sell_reservation[:, None, :] + 1e-6
+        improvable = reach & gain & wants_buy[:, :, None] & wants_sell[:, None, :]
+        diag = np.arange(batch.max_parties)
+        improvable[:, diag, diag] = False
+        return ~improvable.any(axis=(1, 2))
+
+    def _utilities(self, batch, price, buys, sells, bought, sold) -> np.ndarray:
+        """Normalized surplus per party in [0, 1], scaled by the party's matched fill."""
+        p = price[:, None]
+        quantity = np.maximum(batch.quantity, 1e-9)
+        buy_fill = bought / quantity
+        sell_fill = sold / quantity
+
+        is_swap = batch.intent == IntentType.SWAP
+        buy_reservation = np.where(is_swap, batch.price_min, batch.price_max)
+        sell_reservation = np.where(is_swap, batch.price_max, batch.price_min)
+
+        buyer_utility = (buy_reservation - p) / np.maximum(buy_reservation, 1e-9) * buy_fill
+        seller_utility = (p - sell_reservation) / np.maximum(p, 1e-9) * sell_fill
+
+        utilities = np.where(buys, buyer_utility, 0.0) + np.where(sells, seller_utility, 0.0)
+        return np.clip(utilities, 0.0, 1.0)
+
+
+# ============================================================================
+# Synthetic Problems
+# ============================================================================
+
+def random_problems(
+    batch_size: int,
+    rng: Optional[np.random.Generator] = None,
+    min_parties: int = 2,
+    max_parties: int = MAX_PARTIES
+) -> PartyBatch:
+    """
+    Generate B random settlement problems with 2-6 parties each.
+
+    Party 0 is always a buyer and party 1 always a seller so every problem
+    has at least one potential trade.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if min_parties < 2 or max_parties < min_parties:
+        raise ValueError(f"Invalid party range [{min_parties}, {max_parties}]")
+
+    shape = (batch_size, max_parties)
+    counts = rng.integers(min_parties, max_parties + 1, size=batch_size)
+    mask = np.arange(max_parties)[None, :] < counts[:, None]
+
+    intent = rng.integers(0, len(IntentType), size=shape).astype(np.int8)
+    intent[:, 0] = IntentType.BUY
+    intent[:, 1] = IntentType.SELL
+
+    # Prices cluster around a per-problem market level (GPU $/hr)
+    market = rng.uniform(1.0, 2.5, size=(batch_size, 1))
+    center = market + rng.normal(0.0, 0.25, size=shape)
+    spread = rng.uniform(0.05, 0.4, size=shape)
+    price_min = np.clip(center - spread, 0.05, PRICE_SCALE)
+    price_max = np.clip(center + spread, 0.05, PRICE_SCALE)
+
+    batch = PartyBatch(
+        intent=intent,
+        price_min=price_min.astype(np.float32),
+        price_max=price_max.astype(np.float32),
+        quantity=rng.uniform(50.0, QUANTITY_SCALE, size=shape).astype(np.float32),
+        max_latency_ms=rng.uniform(20.0, LATENCY_SCALE, size=shape).astype(np.float32),
+        region=rng.integers(0, len(Region), size=shape).astype(np.int8),
+        time_horizon=rng.uniform(0.0, 1.0, size=shape).astype(np.float32),
+        mask=mask,
+    )
+
+    # Zero out padding parties
+    for field in ("intent", "price_min", "price_max", "quantity",
+                  "max_latency_ms", "region", "time_horizon"):
+        values = getattr(batch, field)
+        values[~mask] = 0
+    return batch
+
+
+# ============================================================================
+# Demo
+# ============================================================================
+
+if __name__ == "__main__":
+    parties = [
+        Party("chutes", IntentType.BUY, price_min=1.50, price_max=2.40, quantity=300, region=Region.US),
+        Party("nodexo", IntentType.SELL, price_min=1.40, price_max=2.00, quantity=500, region=Region.US),
+        Party("compute_horde", IntentType.DEFER, price_min=0.80, price_max=1.20, quantity=100, region=Region.EU),
+    ]
+
+    print("NASH Nash Equilibrium Solver - DEMO")
+    print("=" * 60)
+    print()
+    print(f"Parties: {[p.name for p in parties]}")
+    print(f"Buyers: {[p.name for p in parties if p.intent == IntentType.BUY]}")
+    print(f"Sellers: {[p.name for p in parties if p.intent == IntentType.SELL]}")
+    print(f"Deferrers: {[p.name for p in parties if p.intent == IntentType.DEFER]}")
+    print()
+
+    settlement = NashSolver().solve(parties)
+    if settlement.settled:
+        print("✓ Settlement found!")
+        print(f"  Price: ${settlement.price:.2f}/hr")
+        print(f"  Quantity: {settlement.quantity:.0f} GPU-hours")
+        print(f"  Pareto Optimal: {settlement.pareto_optimal}")
+        utilities = ", ".join(f"'{k}': {v:.2f}" for k, v in settlement.utilities.items())
+        print(f"  Utilities: {{{utilities}}}")
+    else:
+        print("✗ No settlement possible")
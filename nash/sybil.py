@@ -0,0 +1,208 @@
+"""
+NASH Sybil Detection - Near-duplicate miner responses in linear time.
+
+Sybil operators run several UIDs with the same model to multiply their
+PMU. Comparing every pair of 256-dim manifolds is O(n^2) per round; at
+4096 miners that is ~8M comparisons. Instead, each response gets a SimHash
+signature (signs of random projections) split into bands. Every pair of
+responses sharing a band bucket is verified with one cosine similarity,
+and verified pairs are merged into clusters. With 16-bit bands, random
+responses almost never share a bucket, so only a few thousand pairs are
+verified per band even at 4096 miners.
+
+Buckets larger than `max_bucket` (many miners with near-identical
+answers) are not compared exhaustively: each row is compared with its
+next max_bucket - 1 neighbours in a random order, which keeps the cost
+linear while chaining the bucket's members together.
+
+Cost per round: O(n * bits) projections, at most O(n * bands * max_bucket)
+verifications and a few vectorized label-propagation passes.
+
+Optimizations:
+- Fixed random hyperplanes from a seeded generator, projected in one matmul
+- Band keys packed into int64; in-bucket pairs found by sorting each band
+  and comparing rows at increasing offsets
+- Connected components by scatter-min label propagation, no Python loop over UIDs
+"""
+
+import torch
+from typing import Optional, Tuple
+
+
+# PMU assigned to every member of a sybil cluster (docs: "Minimum PMU for everyone")
+SYBIL_PMU = 0.1
+
+
+class SybilDetector:
+    """
+    SimHash/LSH clustering of (manifold, equilibrium) responses.
+
+    Args:
+        dim: Width of the feature vector (manifold_dim + 2)
+        bits: Signature length (random hyperplanes)
+        bands: Number of LSH bands; bits must divide evenly. More bands
+            raise recall for near (not exact) duplicates, more bits per
+            band shrink buckets
+        threshold: Cosine similarity at or above which two responses are
+            considered the same solution
+        max_bucket: Bucket size up to which all pairs are verified
+        seed: Seed for the hyperplanes (fixed so rounds are comparable)
+    """
+
+    def __init__(
+        self,
+        dim: int = 258,
+        bits: int = 128,
+        bands: int = 8,
+        threshold: float = 0.99,
+        max_bucket: int = 64,
+        seed: int = 0,
+        device: Optional[torch.device] = None,
+    ):
+        if bits % bands != 0:
+            raise ValueError(f"bits ({bits}) must be divisible by bands ({bands})")
+        if bits // bands > 62:
+            raise ValueError("At most 62 bits per band fit a signed int64 key")
+        if max_bucket < 2:
+            raise ValueError(f"max_bucket must be >= 2, got {max_bucket}")
+
+        self.dim = dim
+        self.bits = bits
+        self.bands = bands
+        self.threshold = threshold
+        self.max_bucket = max_bucket
+
+        generator = torch.Generator().manual_seed(seed)
+        self.planes = torch.randn(dim, bits, generator=generator)
+        # Orders rows inside oversized buckets
+        self._shuffle = torch.Generator().manual_seed(seed + 1)
+        self._weights = 2 ** torch.arange(bits // bands, dtype=torch.int64)
+        if device is not None:
+            self.planes = self.planes.to(device)
+            self._weights = self._weights.to(device)
+
+        # Counters
+        self.rounds = 0
+        self.clustered_uids = 0
+
+    @staticmethod
+    def features(manifolds: torch.Tensor, equilibria: torch.Tensor) -> torch.Tensor:
+        """[N, dim] unit vectors; manifold and equilibrium weighted equally."""
+        manifolds = torch.nn.functional.normalize(manifolds.float(), dim=1)
+        equilibria = torch.nn.functional.normalize(equilibria.float(), dim=1)
+        return torch.cat([manifolds, equilibria], dim=1) / (2 ** 0.5)
+
+    def signatures(self, features: torch.Tensor) -> torch.Tensor:
+        """[N, bands] int64 band keys."""
+        bits = (features @ self.planes.to(features.device)) > 0
+        bits = bits.view(features.shape[0], self.bands, -1).to(torch.int64)
+        return (bits * self._weights.to(features.device)).sum(dim=2)
+
+    def cluster(
+        self,
+        manifolds: torch.Tensor,
+        equilibria: torch.Tensor,
+        valid: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Cluster one round of responses.
+
+        Args:
+            manifolds: [N, manifold_dim]
+            equilibria: [N, 2]
+            valid: [N] bool; invalid rows are never clustered
+
+        Returns:
+            cluster_ids: [N] int64; the smallest member index of each cluster,
+                -1 for invalid rows
+            cluster_sizes: [N] int64 size of each row's cluster (0 if invalid)
+        """
+        n = manifolds.shape[0]
+        device = manifolds.device
+        cluster_ids = torch.full((n,), -1, dtype=torch.int64, device=device)
+        cluster_sizes = torch.zeros(n, dtype=torch.int64, device=device)
+        rows = valid.nonzero().flatten()
+        if rows.numel() == 0:
+            return cluster_ids, cluster_sizes
+
+        features = self.features(manifolds[rows], equilibria[rows])
+        keys = self.signatures(features)
+        m = rows.numel()
+
+        sources, targets = self._candidates(keys)
+
+        # Verify candidates exactly (one dot product per edge)
+        similarity = (features[sources] * features[targets]).sum(dim=1)
+        keep = similarity >= self.threshold
+        sources, targets = sources[keep], targets[keep]
+
+        labels = self._components(m, sources, targets)
+        sizes = torch.bincount(labels, minlength=m)[labels]
+
+        cluster_ids[rows] = rows[labels]
+        cluster_sizes[rows] = sizes
+
+        self.rounds += 1
+        self.clustered_uids += int((sizes > 1).sum())
+        return cluster_ids, cluster_sizes
+
+    def _candidates(self, keys: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Candidate edges: pairs of rows sharing a bucket in any band.
+
+        Rows are sorted by band key (randomly within a bucket), so rows d
+        apart in that order share a bucket only if the whole stretch between
+        them does; offsets grow until no pair shares one or max_bucket - 1
+        is reached.
+        """
+        m = keys.shape[0]
+        sources, targets = [], []
+        for band in range(self.bands):
+            shuffled = torch.randperm(m, generator=self._shuffle).to(keys.device)
+            order = shuffled[torch.argsort(keys[shuffled, band], stable=True)]
+            sorted_keys = keys[order, band]
+            for offset in range(1, min(self.max_bucket, m)):
+                same = sorted_keys[offset:] == sorted_keys[:-offset]
+                if not same.any():
+                    break
+                sources.append(order[:-offset][same])
+                targets.append(order[offset:][same])
+
+        if not sources:
+            empty = torch.empty(0, dtype=torch.int64, device=keys.device)
+            return empty, empty
+        return torch.cat(sources), torch.cat(targets)
+
+    @staticmethod
+    def _components(n: int, sources: torch.Tensor, targets: torch.Tensor) -> torch.Tensor:
+        """Connected components as the minimum node index per component."""
+        labels = torch.arange(n, device=sources.device)
+        if sources.numel() == 0:
+            return labels
+
+        edges_a = torch.cat([sources, targets])
+        edges_b = torch.cat([targets, sources])
+        while True:
+            # Pull the smallest neighbour label, then jump pointers
+            pulled = labels.scatter_reduce(0, edges_a, labels[edges_b], reduce="amin")
+            pulled = pulled[pulled]
+            if torch.equal(pulled, labels):
+                return labels
+            labels = pulled
+
+    @staticmethod
+    def pmu(cluster_sizes: torch.Tensor) -> torch.Tensor:
+        """[N] PMU multipliers: SYBIL_PMU for clustered responses, 1.0 otherwise."""
+        pmu = torch.ones(cluster_sizes.shape[0], device=cluster_sizes.device)
+        return torch.where(cluster_sizes > 1, torch.full_like(pmu, SYBIL_PMU), pmu)
+
+    def stats(self) -> dict:
+        """Counters for monitoring."""
+        return {
+            "rounds": self.rounds,
+            "clustered_uids": self.clustered_uids,
+            "bits": self.bits,
+            "bands": self.bands,
+            "threshold": self.threshold,
+            "max_bucket": self.max_bucket,
+        }
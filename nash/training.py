@@ -0,0 +1,283 @@
+"""
+NASH Background Training - Off-the-hot-path CommitmentModel training.
+
+Validation rounds only push (commitments, targets) rows into a bounded
+replay buffer. A background thread trains a private copy of the model in
+mini-batches, periodically publishes eval weights to the scorer and
+checkpoints asynchronously.
+
+Optimizations:
+- Preallocated ring buffer, vectorized writes with wraparound
+- Mini-batches large enough for BatchNorm to be meaningful
+- Replay ratio caps optimizer steps per collected sample
+- Checkpoint I/O on its own worker thread
+"""
+
+import bittensor as bt
+import torch
+import torch.nn as nn
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+import copy
+import os
+import threading
+
+
+class ReplayBuffer:
+    """
+    Fixed-capacity ring of (inputs, targets) rows.
+
+    Storage is preallocated on the CPU; once full, the oldest rows are
+    overwritten. Safe to use from the event loop and the trainer thread.
+
+    `unique_sampled` counts distinct rows ever drawn by sample(); a row
+    counts again only after it has been overwritten by a new one.
+    """
+
+    def __init__(self, capacity: int = 100_000, input_dim: int = 32, target_dim: int = 4):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+
+        self.capacity = capacity
+        self._inputs = torch.empty(capacity, input_dim)
+        self._targets = torch.empty(capacity, target_dim)
+        self._drawn = torch.zeros(capacity, dtype=torch.bool)
+        self._head = 0
+        self._size = 0
+        self.total_added = 0
+        self.unique_sampled = 0
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, inputs: torch.Tensor, targets: torch.Tensor):
+        """Append a [B, input_dim] / [B, target_dim] batch."""
+        inputs = inputs.detach().reshape(-1, self._inputs.shape[1]).cpu()
+        targets = targets.detach().reshape(-1, self._targets.shape[1]).cpu()
+        rows = inputs.shape[0]
+
+        # Only the newest `capacity` rows can survive the write
+        if rows > self.capacity:
+            inputs, targets = inputs[-self.capacity:], targets[-self.capacity:]
+
+        with self._lock:
+            index = (self._head + torch.arange(inputs.shape[0])) % self.capacity
+            self._inputs[index] = inputs
+            self._targets[index] = targets
+            self._drawn[index] = False
+            self._head = (self._head + inputs.shape[0]) % self.capacity
+            self._size = min(self._size + inputs.shape[0], self.capacity)
+            self.total_added += rows
+            self._not_empty.notify_all()
+
+    def sample(
+        self,
+        batch_size: int,
+        generator: Optional[torch.Generator] = None
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Draw a uniform random mini-batch (with replacement)."""
+        with self._lock:
+            if self._size == 0:
+                raise ValueError("Cannot sample from an empty replay buffer")
+            index = torch.randint(0, self._size, (batch_size,), generator=generator)
+            self.unique_sampled += int((~self._drawn[index.unique()]).sum())
+            self._drawn[index] = True
+            return self._inputs[index], self._targets[index]
+
+    def wait_for(self, total_added: int, timeout: float) -> bool:
+        """Block until at least `total_added` rows have ever been added."""
+        with self._not_empty:
+            return self._not_empty.wait_for(lambda: self.total_added >= total_added, timeout)
+
+
+class BackgroundTrainer:
+    """
+    Trains a private copy of a model from a ReplayBuffer on a daemon thread.
+
+    Every `publish_every` steps, a detached copy of the weights is handed to
+    `on_update(state_dict, samples_seen)`; the consumer swaps them into its
+    eval model. `samples_seen` counts distinct replay rows trained on (plus
+    the count a resumed checkpoint started from), not mini-batch draws.
+
+    Every `checkpoint_every` steps, the weights are saved to
+    `checkpoint_path` on a separate I/O thread (write-then-rename), along
+    with `state_fn()` under 'training_state' if given, so a restart can tell
+    a finished model from a partial run.
+    """
+
+    def __init__(
+        self,
+        model: nn.Module,
+        buffer: ReplayBuffer,
+        on_update: Callable[[Dict[str, torch.Tensor], int], None],
+        batch_size: int = 256,
+        lr: float = 0.001,
+        replay_ratio: float = 4.0,
+        min_samples: int = 512,
+        publish_every: int = 50,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 500,
+        device: Optional[torch.device] = None,
+        samples_seen: int = 0,
+        state_fn: Optional[Callable[[], dict]] = None,
+    ):
+        self.model = copy.deepcopy(model)
+        if device is not None:
+            self.model.to(device)
+        self.device = device or next(self.model.parameters()).device
+
+        self.buffer = buffer
+        self.on_update = on_update
+        self.batch_size = batch_size
+        self.replay_ratio = replay_ratio
+        self.min_samples = min_samples
+        self.publish_every = publish_every
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.state_fn = state_fn
+
+        self.lr = lr
+        self.optimizer = torch.optim.Adam(self.model.parameters(), lr=lr)
+        self.criterion = nn.MSELoss()
+
+        self.steps = 0
+        self.samples_seen = samples_seen
+        self.last_loss: Optional[float] = None
+
+        # Externally deployed weights, applied by the training thread between steps
+        self._pending_weights: Optional[Dict[str, torch.Tensor]] = None
+        self._pending_lock = threading.Lock()
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nash-checkpoint")
+
+    def start(self):
+        """Start the training thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="nash-trainer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop training, write a final checkpoint and flush pending ones.
+
+        If the training thread outlives `timeout`, the I/O executor is left
+        running so a checkpoint it submits late is still written.
+        """
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                self._thread = thread
+                bt.logging.warning(f"Trainer did not stop within {timeout}s; skipping final checkpoint")
+                return
+            if self.checkpoint_path and self.steps:
+                self._checkpoint()
+        self._io.shutdown(wait=True)
+
+    def load_weights(self, state_dict: Dict[str, torch.Tensor]):
+        """
+        Continue training from externally deployed weights.
+
+        Thread-safe; the training thread applies them before its next step
+        and resets the optimizer, whose moments belong to the old weights.
+        """
+        with self._pending_lock:
+            self._pending_weights = {k: v.detach().clone() for k, v in state_dict.items()}
+
+    def has_pending_weights(self) -> bool:
+        """True while loaded weights are waiting for the training thread."""
+        with self._pending_lock:
+            return self._pending_weights is not None
+
+    def _apply_pending_weights(self):
+        with self._pending_lock:
+            state_dict, self._pending_weights = self._pending_weights, None
+        if state_dict is None:
+            return
+        self.model.load_state_dict(state_dict)
+        self.optimizer = torch.optim.Adam(self.model.parameters(), lr=self.lr)
+
+    def _allowed_steps(self) -> int:
+        """Optimizer steps permitted by the replay ratio for the data collected so far."""
+        if self.buffer.total_added < self.min_samples:
+            return 0
+        return int(self.replay_ratio * self.buffer.total_added / self.batch_size)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._apply_pending_weights()
+            if self.steps >= self._allowed_steps():
+                # Wait for enough new rows to earn at least one more step
+                needed = max(
+                    self.min_samples,
+                    int((self.steps + 1) * self.batch_size / self.replay_ratio),
+                )
+                self.buffer.wait_for(needed, timeout=0.5)
+                continue
+
+            try:
+                self._step()
+            except Exception as e:
+                bt.logging.error(f"Background training step failed: {e}")
+                self._stop.wait(1.0)
+                continue
+
+            if self.steps % self.publish_every == 0:
+                self._publish()
+            if self.checkpoint_path and self.steps % self.checkpoint_every == 0:
+                self._checkpoint()
+
+    def _step(self):
+        drawn = self.buffer.unique_sampled
+        inputs, targets = self.buffer.sample(self.batch_size)
+        inputs = inputs.to(self.device, non_blocking=True)
+        targets = targets.to(self.device, non_blocking=True)
+
+        self.model.train()
+        self.optimizer.zero_grad()
+        loss = self.criterion(self.model(inputs), targets)
+        loss.backward()
+        self.optimizer.step()
+
+        self.steps += 1
+        self.samples_seen += self.buffer.unique_sampled - drawn
+        self.last_loss = loss.item()
+
+    def _snapshot(self) -> Dict[str, torch.Tensor]:
+        return {k: v.detach().clone() for k, v in self.model.state_dict().items()}
+
+    def _publish(self):
+        try:
+            self.on_update(self._snapshot(), self.samples_seen)
+        except Exception as e:
+            bt.logging.error(f"Failed to publish trained weights: {e}")
+
+    def _checkpoint(self):
+        state = {
+            'model_state_dict': {k: v.cpu() for k, v in self._snapshot().items()},
+            'steps': self.steps,
+            'samples_seen': self.samples_seen,
+        }
+        if self.state_fn is not None:
+            state['training_state'] = self.state_fn()
+        self._io.submit(_save_checkpoint, state, self.checkpoint_path)
+
+
+def _save_checkpoint(state: dict, path: str):
+    """Write a checkpoint atomically so readers never see a partial file."""
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        torch.save(state, tmp_path)
+        os.replace(tmp_path, path)
+        bt.logging.debug(f"Saved checkpoint to {path} (step {state['steps']})")
+    except Exception as e:
+        bt.logging.error(f"Failed to save checkpoint to {path}: {e}")
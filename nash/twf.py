@@ -0,0 +1,277 @@
+"""
+NASH Time-Weighted Fidelity - Per-UID reputation state for the validator.
+
+TWF is a rolling average over each miner's last 1000 challenges:
+
+    fidelity = 0.5 * accuracy + 0.2 * uptime + 0.3 * latency
+    TWF      = 0.5 + fidelity                       (0.5 - 1.5x)
+
+raised to the miner's stratum floor and multiplied by any outstanding
+fidelity slash, which recovers linearly over 200-800 challenges depending
+on stratum (see docs/incentive_mechanism.md).
+
+All state lives in preallocated NumPy arrays indexed by UID - no
+per-miner Python objects - so a round over 4096+ UIDs is a handful of
+vectorized operations.
+
+Optimizations:
+- Ring buffers [3, n_uids, window] with per-UID heads; O(1) per round
+- Running sums updated by (new - old), periodically resynced
+- Optional persistence: every array is a .npy memmap that survives restarts
+"""
+
+import bittensor as bt
+import numpy as np
+from typing import Dict, Optional, Sequence
+import os
+
+
+WINDOW = 1000
+
+# Fidelity components: (accuracy, uptime, latency)
+ACCURACY, UPTIME, LATENCY = 0, 1, 2
+COMPONENT_WEIGHTS = np.array([0.5, 0.2, 0.3], dtype=np.float64)
+
+TWF_MIN = 0.5
+TWF_MAX = 1.5
+
+# Latency score: 1.0 up to the target, linear down to 0.0 at the window
+LATENCY_TARGET_MS = 50.0
+LATENCY_WINDOW_MS = 200.0
+
+# Strata, lowest first
+BRONZE, SILVER, GOLD, PLATINUM = 0, 1, 2, 3
+STRATUM_NAMES = ("bronze", "silver", "gold", "platinum")
+STRATUM_FLOORS = np.array([0.7, 1.0, 1.2, 1.3], dtype=np.float32)
+STRATUM_RECOVERY = np.array([800, 500, 300, 200], dtype=np.float32)  # challenges to recover from a slash
+
+# Fidelity slash tiers: quality below threshold -> TWF multiplier
+SLASH_TIERS = ((0.3, 0.6), (0.5, 0.8))
+
+
+def latency_score(latency_ms: np.ndarray) -> np.ndarray:
+    """Map response latency to [0, 1]; NaN (no response) scores 0."""
+    span = LATENCY_WINDOW_MS - LATENCY_TARGET_MS
+    score = 1.0 - (np.asarray(latency_ms, dtype=np.float64) - LATENCY_TARGET_MS) / span
+    return np.nan_to_num(np.clip(score, 0.0, 1.0), nan=0.0)
+
+
+class TWFStore:
+    """
+    Array-backed TWF state for up to `capacity` UIDs.
+
+    Args:
+        capacity: Number of UIDs the arrays are sized for
+        window: Challenges kept per UID
+        path: Directory for memory-mapped persistence (None keeps state in RAM)
+        resync_every: Rounds between exact recomputations of the running sums
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        window: int = WINDOW,
+        path: Optional[str] = None,
+        resync_every: int = WINDOW,
+    ):
+        if capacity < 1 or window < 1:
+            raise ValueError("capacity and window must be >= 1")
+
+        self.capacity = capacity
+        self.window = window
+        self.path = path
+        self.resync_every = resync_every
+        self._rounds_since_resync = 0
+
+        self.history = self._array("history", (3, capacity, window), np.float32)
+        self.sums = self._array("sums", (3, capacity), np.float64)
+        self.head = self._array("head", (capacity,), np.int64)
+        self.count = self._array("count", (capacity,), np.int64)
+        self.slash = self._array("slash", (capacity,), np.float32, fill=1.0)
+        self.recovery = self._array("recovery", (capacity,), np.float32)
+        self.stratum = self._array("stratum", (capacity,), np.int8)
+
+        # Running sums may have drifted (or been mid-write) before a restart
+        if path is not None:
+            self.resync()
+
+    def _array(self, name: str, shape: tuple, dtype, fill: float = 0.0) -> np.ndarray:
+        """Allocate a zero-initialised array, memory-mapped under self.path if set."""
+        if self.path is None:
+            return np.full(shape, fill, dtype=dtype)
+
+        os.makedirs(self.path, exist_ok=True)
+        file = os.path.join(self.path, f"{name}.npy")
+        if os.path.exists(file):
+            array = np.load(file, mmap_mode="r+")
+            if array.shape == shape and array.dtype == dtype:
+                return array
+            bt.logging.warning(
+                f"TWF state {file} has shape {array.shape} {array.dtype}, expected {shape} "
+                f"{np.dtype(dtype)}; starting fresh"
+            )
+            del array
+
+        array = np.lib.format.open_memmap(file, mode="w+", dtype=dtype, shape=shape)
+        array[...] = fill
+        return array
+
+    @property
+    def accuracy(self) -> np.ndarray:
+        """[capacity, window] accuracy ring buffer."""
+        return self.history[ACCURACY]
+
+    @property
+    def uptime(self) -> np.ndarray:
+        """[capacity, window] uptime ring buffer."""
+        return self.history[UPTIME]
+
+    @property
+    def latency(self) -> np.ndarray:
+        """[capacity, window] latency-score ring buffer."""
+        return self.history[LATENCY]
+
+    def _uids(self, uids: Sequence[int]) -> np.ndarray:
+        uids = np.asarray(uids, dtype=np.int64).reshape(-1)
+        if uids.size and (uids.min() < 0 or uids.max() >= self.capacity):
+            raise ValueError(f"UIDs must be in [0, {self.capacity}), got {uids.min()}..{uids.max()}")
+        return uids
+
+    def record(
+        self,
+        uids: Sequence[int],
+        quality: np.ndarray,
+        responded: np.ndarray,
+        latency_ms: Optional[np.ndarray] = None
+    ):
+        """
+        Append one challenge for each of `uids` (which must be unique).
+
+        Args:
+            quality: [N] quality scores in [0, 1] (accuracy component)
+            responded: [N] bool, whether a valid response arrived
+            latency_ms: [N] response latency; None counts every response
+                as within the latency target
+        """
+        uids = self._uids(uids)
+        if uids.size == 0:
+            return
+
+        responded = np.asarray(responded, dtype=bool).reshape(-1)
+        new = np.empty((3, uids.size), dtype=np.float32)
+        new[ACCURACY] = np.clip(np.asarray(quality, dtype=np.float32).reshape(-1), 0.0, 1.0) * responded
+        new[UPTIME] = responded
+        new[LATENCY] = responded if latency_ms is None else latency_score(latency_ms) * responded
+
+        cols = self.head[uids]
+        old = self.history[:, uids, cols]
+        self.history[:, uids, cols] = new
+        self.sums[:, uids] += new.astype(np.float64) - old
+        self.head[uids] = (cols + 1) % self.window
+        self.count[uids] += 1
+
+        # Each challenge recovers part of any outstanding slash
+        self.slash[uids] = np.minimum(self.slash[uids] + self.recovery[uids], 1.0)
+        self.recovery[uids] = np.where(self.slash[uids] >= 1.0, 0.0, self.recovery[uids])
+
+        self._rounds_since_resync += 1
+        if self._rounds_since_resync >= self.resync_every:
+            self.resync()
+
+    def apply_fidelity_slash(self, uids: Sequence[int], quality: np.ndarray):
+        """
+        Tiered TWF decay for poor proposals (quality < 0.3: x0.6, < 0.5: x0.8).
+
+        A tier sets the slash multiplier to at most its factor; repeated poor
+        rounds do not compound below the worst tier. The multiplier then
+        recovers linearly over the stratum's recovery period, and only a
+        deeper slash restarts that recovery.
+        """
+        uids = self._uids(uids)
+        quality = np.asarray(quality, dtype=np.float32).reshape(-1)
+
+        factor = np.ones_like(quality)
+        for threshold, multiplier in reversed(SLASH_TIERS):
+            factor = np.where(quality < threshold, multiplier, factor)
+
+        hit = factor < 1.0
+        if not hit.any():
+            return
+        uids, factor = uids[hit], factor[hit]
+        deeper = factor < self.slash[uids]
+        if not deeper.any():
+            return
+        uids, factor = uids[deeper], factor[deeper]
+        self.slash[uids] = factor
+        self.recovery[uids] = (1.0 - factor) / STRATUM_RECOVERY[self.stratum[uids]]
+
+    def update_strata(self, stake: Optional[np.ndarray] = None):
+        """
+        Recompute every UID's stratum from challenge count, windowed accuracy
+        and (if given) stake rank.
+        """
+        accuracy = self.fidelity_components()[ACCURACY]
+        stratum = np.full(self.capacity, BRONZE, dtype=np.int8)
+        stratum[(self.count >= 1000) & (accuracy > 0.80)] = SILVER
+
+        if stake is not None:
+            stake = np.asarray(stake, dtype=np.float64).reshape(-1)[:self.capacity]
+            percentile = np.zeros(self.capacity)
+            if stake.size:
+                # Fraction of UIDs with strictly more stake
+                ranks = np.argsort(np.argsort(-stake, kind="stable"), kind="stable")
+                percentile[:stake.size] = ranks / stake.size
+            veteran = self.count >= 5000
+            stratum[veteran & (percentile < 0.10) & (accuracy > 0.95)] = GOLD
+            stratum[veteran & (percentile < 0.01)] = PLATINUM
+
+        self.stratum[:] = stratum
+
+    def fidelity_components(self, uids: Optional[Sequence[int]] = None) -> np.ndarray:
+        """[3, N] windowed means of (accuracy, uptime, latency)."""
+        index = slice(None) if uids is None else self._uids(uids)
+        filled = np.minimum(self.count[index], self.window)
+        return self.sums[:, index] / np.maximum(filled, 1)
+
+    def twf(self, uids: Optional[Sequence[int]] = None) -> np.ndarray:
+        """[N] TWF multipliers in [TWF_MIN, TWF_MAX]."""
+        index = slice(None) if uids is None else self._uids(uids)
+        fidelity = COMPONENT_WEIGHTS @ self.fidelity_components(uids)
+        raw = TWF_MIN + (TWF_MAX - TWF_MIN) * fidelity
+        floored = np.maximum(raw, STRATUM_FLOORS[self.stratum[index]])
+        return np.clip(floored * self.slash[index], TWF_MIN, TWF_MAX).astype(np.float32)
+
+    def reset(self, uids: Sequence[int]):
+        """Clear all state for UIDs that were re-registered to a new hotkey."""
+        uids = self._uids(uids)
+        self.history[:, uids, :] = 0.0
+        self.sums[:, uids] = 0.0
+        self.head[uids] = 0
+        self.count[uids] = 0
+        self.slash[uids] = 1.0
+        self.recovery[uids] = 0.0
+        self.stratum[uids] = BRONZE
+
+    def resync(self):
+        """Recompute running sums exactly from the ring buffers."""
+        self.sums[...] = self.history.sum(axis=2, dtype=np.float64)
+        self._rounds_since_resync = 0
+
+    def flush(self):
+        """Write memory-mapped state to disk (no-op in RAM)."""
+        if self.path is None:
+            return
+        for array in (self.history, self.sums, self.head, self.count,
+                      self.slash, self.recovery, self.stratum):
+            array.flush()
+
+    def stats(self) -> Dict[str, object]:
+        """Aggregate view for monitoring."""
+        active = self.count > 0
+        twf = self.twf()[active]
+        return {
+            "active_uids": int(active.sum()),
+            "mean_twf": float(twf.mean()) if twf.size else None,
+            "slashed_uids": int((self.slash < 1.0).sum()),
+            "strata": {name: int((self.stratum[active] == i).sum()) for i, name in enumerate(STRATUM_NAMES)},
+        }
@@ -1,5 +1,3 @@
-
-```python
 """
 NASH Validator - Updated with Commitment Model Training Pipeline
 
@@ -14,13 +12,27 @@ Instead, they learn to estimate it via a model trained on synthetic data.
 
 import bittensor as bt
 from nash.protocol import NashSynapse
+from nash.axons import AxonCache
+from nash.pipeline import (
+    DEFAULT_COMMIT_EVERY,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_ROUND_INTERVAL,
+    RoundPipeline,
+)
+from nash.sybil import SybilDetector
+from nash.training import ReplayBuffer, BackgroundTrainer
+from nash.challenges import ChallengeBatch, ChallengeFactory
+from nash.checkpoint import Checkpoint, CheckpointWatcher, load_checkpoint
+from nash.precision import apply_precision, calibrate_precision, resolve_precision
 import torch
 import torch.nn as nn
 from typing import List, Optional, Tuple
+import asyncio
 import time
-import random
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import os
+import threading
 
 
 # ============================================================================
@@ -28,13 +40,30 @@ import os
 # ============================================================================
 
 try:
-    from nash.solver import NashSolver, Party, IntentType, Region
+    import numpy as np
+    from nash.solver import NashSolver, Party, IntentType, Region, PartyBatch, random_problems
 except ImportError:
     # Fallback if solver not available
+    np = None
     NashSolver = None
     Party = None
     IntentType = None
     Region = None
+    PartyBatch = None
+    random_problems = None
+
+try:
+    from nash.twf import TWFStore
+except ImportError:
+    # Fallback if numpy not available: scores are used without TWF
+    TWFStore = None
+
+try:
+    from nash.reveals import RevealConsumer, SegmentLog
+except ImportError:
+    # Fallback if numpy not available: no reveal ingestion
+    RevealConsumer = None
+    SegmentLog = None
 
 
 # ============================================================================
@@ -58,6 +87,25 @@ class TrainingState:
     model_ready: bool = False
 
 
+@dataclass
+class ValidationRound:
+    """State carried by one round through prepare -> query -> score."""
+    uids: List[int]
+    axons: List
+    challenge: torch.FloatTensor
+    commitments: torch.Tensor
+    synapse: NashSynapse
+    started: float
+    responses: Optional[List] = None
+    scores: Optional[torch.Tensor] = None
+    valid: Optional[torch.Tensor] = None
+    manifolds: Optional[torch.Tensor] = None
+    equilibria: Optional[torch.Tensor] = None
+    latencies: Optional[torch.Tensor] = None
+    cluster_ids: Optional[torch.Tensor] = None
+    challenge_id: int = 0  # id of the first trade; trades are numbered consecutively
+
+
 # ============================================================================
 # Commitment Model (Estimates Optimality from Commitments)
 # ============================================================================
@@ -90,24 +138,27 @@ class CommitmentModel(nn.Module):
             nn.Linear(hidden_dim, 4),  # [optimal_prob, utility, price, quantity]
             nn.Sigmoid()
         )
+        # Inputs are cast to this dtype (set to bfloat16 by nash.precision)
+        self.compute_dtype = torch.float32
     
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return self.network(x)
+        return self.network(x.to(self.compute_dtype)).float()
     
     def estimate_optimality(self, commitments: torch.Tensor) -> dict:
         """
-        Estimate optimality from commitment vector.
+        Estimate optimality from [T, 32] commitment vectors (averaged over
+        the T trades of a round).
         
         Returns:
             dict with keys: is_optimal, utility, price, quantity
         """
         with torch.no_grad():
-            output = self.forward(commitments)
+            output = self.forward(commitments).mean(dim=0)
             return {
-                'is_optimal_prob': output[0, 0].item(),
-                'utility': output[0, 1].item(),
-                'price': output[0, 2].item() * 3.0,  # de-normalize
-                'quantity': output[0, 3].item() * 500.0  # de-normalize
+                'is_optimal_prob': output[0].item(),
+                'utility': output[1].item(),
+                'price': output[2].item() * 3.0,  # de-normalize
+                'quantity': output[3].item() * 500.0  # de-normalize
             }
 
 
@@ -122,6 +173,8 @@ class FidelityScorer(nn.Module):
     """
     def __init__(self, intent_dim: int = 10, manifold_dim: int = 256):
         super().__init__()
+        self.intent_dim = intent_dim
+        self.manifold_dim = manifold_dim
         self.scorer = nn.Sequential(
             nn.Linear(intent_dim + manifold_dim + 2, 64),
             nn.ReLU(),
@@ -130,6 +183,8 @@ class FidelityScorer(nn.Module):
             nn.Linear(32, 1),
             nn.Sigmoid(),
         )
+        # Inputs are cast to this dtype (set to bfloat16 by nash.precision)
+        self.compute_dtype = torch.float32
     
     def forward(self, intent: torch.FloatTensor, manifold: torch.FloatTensor,
                 equilibrium: torch.FloatTensor) -> torch.FloatTensor:
@@ -141,7 +196,50 @@ class FidelityScorer(nn.Module):
         if combined.shape[0] < 268:
             combined = torch.cat([combined, torch.zeros(268 - combined.shape[0])])
         
-        return self.scorer(combined.unsqueeze(0))
+        return self.scorer(combined.unsqueeze(0).to(self.compute_dtype)).float()
+    
+    def score_rows(self, intents: torch.FloatTensor, manifolds: torch.FloatTensor,
+                   equilibria: torch.FloatTensor) -> torch.FloatTensor:
+        """Score [B, intent_dim] intents with their own [B, manifold_dim] / [B, 2] responses -> [B]."""
+        combined = torch.cat([intents, manifolds, equilibria], dim=1)
+        return self.scorer(combined.to(self.compute_dtype)).float().squeeze(1)
+    
+    def score_batch(self, intent: torch.FloatTensor, manifolds: torch.FloatTensor,
+                    equilibria: torch.FloatTensor) -> torch.FloatTensor:
+        """
+        Score B responses to the same T trades in a single pass.
+        
+        Manifolds are zero-padded to manifold_dim, so the equilibrium always
+        occupies the last two inputs. forward() concatenates before padding
+        instead, which moves a short manifold's equilibrium into manifold
+        inputs; the two agree for full-width (256) manifolds.
+        
+        Args:
+            intent: [T, *] challenge intents, each flattened and padded/truncated to intent_dim
+            manifolds: [B, T, manifold_dim] (or [B, manifold_dim] for T=1) zero-padded manifolds
+            equilibria: [B, T, 2] (or [B, 2]) equilibrium points
+        
+        Returns:
+            [B] tensor of fidelity scores, averaged over trades
+        """
+        if manifolds.dim() == 2:
+            manifolds, equilibria = manifolds.unsqueeze(1), equilibria.unsqueeze(1)
+        batch_size, trades = manifolds.shape[:2]
+        
+        intents = intent.reshape(trades, -1)[:, :self.intent_dim]
+        if intents.shape[1] < self.intent_dim:
+            intents = torch.cat([
+                intents,
+                intents.new_zeros(trades, self.intent_dim - intents.shape[1])
+            ], dim=1)
+        
+        combined = torch.cat([
+            intents.unsqueeze(0).expand(batch_size, -1, -1),
+            manifolds,
+            equilibria,
+        ], dim=2)
+        
+        return self.scorer(combined.to(self.compute_dtype)).float().squeeze(2).mean(dim=1)
 
 
 # ============================================================================
@@ -168,91 +266,227 @@ class NashValidator(bt.Neuron):
     Instead, learn to estimate it.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        precision: str = "fp32",
+        twf_path: Optional[str] = None,
+        reveal_path: Optional[str] = None,
+        challenge_seed: Optional[int] = None,
+    ):
         super().__init__()
         
         # Training state
         self.training_state = TrainingState(mode="training")
+        # samples_collected is bumped by rounds and by the reveal consumer thread
+        self._samples_lock = threading.Lock()
         
         # Commitment model (the key new component)
         self.commitment_model = CommitmentModel(input_dim=32, hidden_dim=64).to(self.device)
+        # Serializes swaps from the trainer and from deployed checkpoints
+        self._model_lock = threading.Lock()
         
         # Original fidelity scorer (kept for comparison)
         self.scorer = FidelityScorer(intent_dim=10, manifold_dim=256).to(self.device)
         self.scorer.eval()
         
-        # Try to load pre-trained model
+        # Try to load pre-trained model; a deployed mmap checkpoint wins over
+        # the trainer's own torch.save checkpoint
         model_path = os.path.join(os.path.dirname(__file__), '..', 'models', 'validator_model.pt')
-        if os.path.exists(model_path):
-            self._load_model(model_path)
-            self.training_state.mode = "production"
-            bt.logging.info("Loaded pre-trained commitment model - PRODUCTION MODE")
+        deploy_path = os.path.join(os.path.dirname(model_path), 'validator_model.safetensors')
+        resumed_samples = 0
+        deployed = os.path.exists(deploy_path) and self._load_model(deploy_path) is not None
+        checkpoint = self._load_model(model_path) if not deployed and os.path.exists(model_path) else None
+        if deployed:
+            self._enter_production()
+            bt.logging.info("Loaded deployed commitment model - PRODUCTION MODE")
+        elif checkpoint is not None:
+            # Trainer checkpoints record how far training got; files without a
+            # training_state are pre-trained models and count as finished
+            saved_state = checkpoint.get('training_state', {'model_ready': True})
+            self.training_state.samples_collected = int(saved_state.get('samples_collected', 0))
+            resumed_samples = int(checkpoint.get('samples_seen', 0))
+            if saved_state.get('model_ready'):
+                self._enter_production()
+                bt.logging.info("Loaded pre-trained commitment model - PRODUCTION MODE")
+            else:
+                bt.logging.info(f"Resuming commitment model training at {resumed_samples} samples - TRAINING MODE")
         else:
             bt.logging.info("No pre-trained model found - TRAINING MODE")
         
         # Training parameters
         self.training_samples_target = 10000
-        self.optimizer = torch.optim.Adam(self.commitment_model.parameters(), lr=0.001)
-        self.criterion = nn.MSELoss()
+        self.training_batch_size = 32
+        
+        # Background training: rounds only fill the replay buffer, a separate
+        # thread trains in mini-batches and swaps eval weights into the scorer
+        self.replay_buffer = ReplayBuffer(capacity=100_000, input_dim=32, target_dim=4)
+        self.trainer = BackgroundTrainer(
+            self.commitment_model,
+            self.replay_buffer,
+            on_update=self._swap_commitment_model,
+            batch_size=256,
+            lr=0.001,
+            checkpoint_path=model_path,
+            samples_seen=resumed_samples,
+            state_fn=lambda: asdict(self.training_state),
+        )
+        
+        # Hot reload: weights deployed to deploy_path replace the scoring model
+        # live (and become the trainer's starting point)
+        self.checkpoint_watcher = CheckpointWatcher(deploy_path, self._reload_commitment_model, device=self.device)
+        
+        # Axon references, patched incrementally whenever the metagraph block moves
+        self.axon_cache = AxonCache()
+        
+        # Challenge generation: pregenerated off the round's hot path
+        self.challenges = ChallengeFactory(self.device, seed=challenge_seed, use_solver=NashSolver is not None)
+        
+        # Multi-party trades sent per synapse (scores average over them)
+        self.trades_per_round = 1
+        
+        # Compact response encoding requested from miners ("fp16", "int8" or None)
+        self.wire_format: Optional[str] = None
+        
+        # Streaming rounds: score responses in micro-batches as they arrive
+        # and finalize the round when the query deadline passes
+        self.streaming = True
+        self.query_timeout = 5.0
+        self.stream_batch_size = 32
+        self.last_round_latencies: Optional[torch.Tensor] = None
         
-        # Cache for metagraph axon references
-        self._axon_cache: Optional[List] = None
-        self._axon_cache_time: float = 0
-        self._axon_cache_ttl: float = 60
+        # Set by run_pipeline()
+        self.pipeline: Optional[RoundPipeline] = None
         
-        # Challenge generation
-        self._challenge_buffer = torch.empty(10, device=self.device)
+        # LSH near-duplicate detection across miner responses (PMU collapse)
+        self.sybil = SybilDetector(dim=self.scorer.manifold_dim + 2, device=self.device)
+        
+        # Time-Weighted Fidelity: per-UID reputation, persisted next to the model
+        if twf_path is None:
+            twf_path = os.path.join(os.path.dirname(model_path), 'twf')
+        self.twf = TWFStore(capacity=4096, path=twf_path) if TWFStore is not None else None
+        
+        # Post-settlement reveals: every challenge's commitments are logged under
+        # a challenge id; reveals joined against them feed the replay buffer,
+        # so the background trainer keeps refining the commitment model
+        self._next_challenge_id = time.time_ns()
+        self.reveal_log: Optional[SegmentLog] = None
+        self.reveal_consumer: Optional[RevealConsumer] = None
+        if SegmentLog is not None:
+            if reveal_path is None:
+                reveal_path = os.path.join(os.path.dirname(model_path), 'reveals')
+            self.reveal_log = SegmentLog(os.path.join(reveal_path, 'log'))
+            self.reveal_consumer = RevealConsumer(
+                self.reveal_log,
+                checkpoint_path=os.path.join(reveal_path, 'consumer.npz'),
+                on_samples=self._ingest_reveals,
+            )
+        
+        # Ground-truth solver for synthetic challenges
+        self.nash_solver = NashSolver() if NashSolver is not None else None
+        self._problem_rng = np.random.default_rng() if np is not None else None
+        
+        # Reduced precision for scoring models (training always stays fp32);
+        # calibrated on challenges, which the factory fills inline until started
+        self.precision = resolve_precision(precision, self.device)
+        self.scorer_precision = self.precision
+        self._precision_report: dict = {}
+        if self.precision != "fp32":
+            self._calibrate_precision()
+        
+        # Background threads start last: the trainer and watcher swap models
+        # in with self.precision, and nothing else may replace them meanwhile
+        self.trainer.start()
+        self.checkpoint_watcher.start(skip_current=True)
+        self.challenges.start()
+        if self.reveal_consumer is not None:
+            self.reveal_consumer.start()
         
         bt.logging.info(f"Validator initialized on device: {self.device}")
     
-    def _load_model(self, path: str):
-        """Load pre-trained commitment model"""
+    def _load_model(self, path: str) -> Optional[dict]:
+        """
+        Load commitment model weights from `path`.
+        
+        Returns the checkpoint's metadata (safetensors) or the checkpoint
+        dict (torch.save), or None if loading failed.
+        """
         try:
-            checkpoint = torch.load(path, map_location=self.device)
-            self.commitment_model.load_state_dict(checkpoint['model_state_dict'])
+            if path.endswith(".safetensors"):
+                loaded = load_checkpoint(path, self.device)
+                state_dict, checkpoint = loaded.tensors, dict(loaded.metadata)
+            else:
+                checkpoint = torch.load(path, map_location=self.device)
+                state_dict = checkpoint['model_state_dict']
+            self.commitment_model.load_state_dict(state_dict, assign=True)
             self.commitment_model.eval()
-            self.training_state.model_ready = True
             bt.logging.info(f"Loaded model from {path}")
+            return checkpoint
         except Exception as e:
             bt.logging.warning(f"Failed to load model: {e}")
+            return None
+    
+    def _enter_production(self):
+        self.training_state.model_ready = True
+        self.training_state.mode = "production"
     
-    def _generate_challenge(self, batch_size: int = 1) -> Tuple[torch.Tensor, List[Party]]:
+    def _calibrate_precision(self, samples: int = 256):
         """
-        Generate a challenge for miners.
+        Convert the scoring models to self.precision, checking drift on
+        `samples` synthetic challenges from _generate_challenge.
         
-        In training mode: generate synthetic with known answer
-        In production mode: use real subnet intents
+        The scorer is checked row by row: every challenge intent is paired
+        with its own (random) response, so drift is measured across the
+        whole intent distribution rather than against a single intent.
         """
-        # For now: always generate synthetic
-        # TODO: integrate with real subnet intents in production
+        batch = self._generate_challenge(samples)
+        intents, commitments = batch.intents, batch.commitments
+        
+        requested = self.precision
+        with self._model_lock:
+            self.commitment_model.eval()
+            self.commitment_model, self.precision, commitment_report = calibrate_precision(
+                self.commitment_model, requested, (commitments,)
+            )
         
-        if batch_size == 1:
-            torch.randn(10, device=self.device, out=self._challenge_buffer)
-            return self._challenge_buffer.unsqueeze(0), []
+        manifolds = torch.randn(samples, self.scorer.manifold_dim, device=self.device)
+        equilibria = torch.randn(samples, 2, device=self.device)
+        self.scorer, self.scorer_precision, scorer_report = calibrate_precision(
+            self.scorer, requested, (intents, manifolds, equilibria),
+            forward=lambda m: m.score_rows,
+        )
         
-        return torch.randn(batch_size, 10, device=self.device), []
+        self._precision_report = {
+            "commitment_model": commitment_report,
+            "scorer": scorer_report,
+        }
     
-    def _commitments_from_intent(self, intent: torch.Tensor) -> torch.Tensor:
+    def _generate_challenge(self, trades: int = 1) -> ChallengeBatch:
         """
-        Convert intent tensor to commitment vector.
+        Dequeue `trades` challenges for miners.
         
-        This simulates what validators see in production.
-        """
-        # Simplified: extract features from intent
-        # In production: receive actual commitments from subnets
+        In training mode: synthetic with known answer
+        In production mode: use real subnet intents
         
-        features = [
-            intent[0, 0].item() if intent.dim() > 1 else intent[0].item(),  # price
-            abs(intent[0, 1].item()) if intent.dim() > 1 else abs(intent[1].item()),  # quantity
-            0.5,  # latency
-            0,  # region (US)
-            1.0 if random.random() > 0.5 else 0.0,  # buyer
-            1.0 if random.random() > 0.5 else 0.0,  # seller
-            0.0,  # deferrer
-            0.5,  # time_horizon
-        ] * 4  # Repeat for 4 parties
+        Returns flat intents, padded party tensors and the commitment
+        vectors validators see for them (see ChallengeFactory).
+        """
+        # For now: always synthetic
+        # TODO: integrate with real subnet intents in production
+        return self.challenges.take(trades)
+    
+    def _ground_truth_batch(self, batch_size: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Solve a batch of synthetic problems for training.
         
-        return torch.tensor(features[:32], dtype=torch.float32, device=self.device).unsqueeze(0)
+        Returns:
+            commitments: [B, 32] commitment vectors
+            targets: [B, 4] optimal outputs [optimal_prob, utility, price, quantity]
+        """
+        problems = random_problems(batch_size, self._problem_rng)
+        settlements = self.nash_solver.solve_batch(problems)
+        commitments = torch.from_numpy(problems.commitments()).to(self.device)
+        targets = torch.from_numpy(settlements.targets(problems.mask)).to(self.device)
+        return commitments, targets
     
     def _estimate_optimality(self, commitments: torch.Tensor) -> dict:
         """
@@ -268,192 +502,510 @@ class NashValidator(bt.Neuron):
     
     def _train_on_sample(self, commitments: torch.Tensor, optimal_output: torch.Tensor):
         """
-        Train the commitment model on a synthetic sample.
+        Queue synthetic samples for the background trainer.
         
-        Called during training mode to improve the model.
+        Called during training mode (round thread) and for matched reveals
+        (reveal consumer thread). Only copies rows into the replay buffer,
+        so it never blocks the validation round on an optimizer step.
         """
-        if self.training_state.samples_collected >= self.training_samples_target:
-            return
+        if optimal_output.dim() == 1:
+            optimal_output = optimal_output.unsqueeze(0)
+        if commitments.dim() == 1:
+            commitments = commitments.unsqueeze(0)
         
-        self.commitment_model.train()
-        self.optimizer.zero_grad()
+        self.replay_buffer.add(commitments, optimal_output)
+        with self._samples_lock:
+            self.training_state.samples_collected += commitments.shape[0]
+    
+    def record_reveal(self, challenge_id: int, outcome: torch.Tensor):
+        """
+        Log the revealed settlement outcome of challenge `challenge_id`.
+        
+        Called by the settlement integration once a trade clears, with the
+        `challenge_id` carried on the NashSynapse that posed it (trade t of
+        a synapse is challenge_id + t). Thread-safe.
         
-        output = self.commitment_model(commitments)
-        loss = self.criterion(output, optimal_output.unsqueeze(0))
+        `outcome` holds [optimal_prob, utility, price, quantity] normalized
+        like the commitment model's output (price / 3, quantity / 500);
+        [T, 4] rows reveal consecutive ids starting at challenge_id.
+        """
+        if self.reveal_log is None:
+            return
+        rows = outcome.detach().reshape(-1, 4).cpu().float().numpy()
+        self.reveal_log.append_reveals(np.arange(challenge_id, challenge_id + rows.shape[0]), rows)
+    
+    def _ingest_reveals(self, commitments: np.ndarray, targets: np.ndarray):
+        """Matched (commitments, revealed outcome) rows from the reveal consumer thread."""
+        self._train_on_sample(torch.from_numpy(commitments), torch.from_numpy(targets))
+    
+    def _reload_commitment_model(self, checkpoint: Checkpoint):
+        """Install a deployed checkpoint (watcher thread) and resume training from it."""
+        state_dict = dict(checkpoint.tensors)
+        with self._model_lock:
+            # Queued before the swap, so a publish racing with this reload sees
+            # pending weights and is dropped instead of overwriting them
+            self.trainer.load_weights(state_dict)
+            self._install_commitment_model(state_dict)
+        self._enter_production()
+    
+    def _install_commitment_model(self, state_dict: dict):
+        """
+        Build a scoring model from `state_dict` and swap it in.
         
-        loss.backward()
-        self.optimizer.step()
+        The new model is fully built before a single reference assignment,
+        so in-flight scoring keeps the old one.
+        """
+        model = CommitmentModel(input_dim=32, hidden_dim=64).to(self.device)
+        model.load_state_dict(state_dict, assign=True)
+        model.eval()
+        self.commitment_model = apply_precision(model, self.precision)
+    
+    def _swap_commitment_model(self, state_dict: dict, samples_seen: int):
+        """
+        Install freshly trained weights into the scoring model.
         
-        self.training_state.samples_collected += 1
+        Called from the trainer thread. Weights published while a deployed
+        checkpoint is still queued for the trainer were trained before it
+        and are dropped.
+        """
+        with self._model_lock:
+            if self.trainer.has_pending_weights():
+                return
+            self._install_commitment_model(state_dict)
         
         # Check if ready to switch to production
-        if self.training_state.samples_collected >= self.training_samples_target:
-            self.training_state.model_ready = True
-            self.commitment_model.eval()
-            bt.logging.info(f"Training complete! Collected {self.training_state.samples_collected} samples")
+        if not self.training_state.model_ready and samples_seen >= self.training_samples_target:
+            self._enter_production()
+            bt.logging.info(
+                f"Training complete! Trained on {samples_seen} samples "
+                f"({self.training_state.samples_collected} collected)"
+            )
     
-   The file is 469 lines total. Here's the rest (lines 301-469):
-
-```python
-    def _validate_response(
+    def _stack_responses(
         self,
-        manifold: Optional[torch.FloatTensor],
-        equilibrium: Optional[torch.FloatTensor]
-    ) -> bool:
-        """Validate a miner's response before scoring."""
-        if manifold is None or equilibrium is None:
-            return False
+        responses: List,
+        trades: int = 1
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Stack a round of responses into padded tensors with a validity mask.
+        
+        Returns:
+            manifolds: [N, trades, manifold_dim] zero-padded/truncated manifolds
+            equilibria: [N, trades, 2] equilibrium points
+            valid: [N] bool mask (shape checks and a single isfinite pass)
+        """
+        n = len(responses)
+        manifold_dim = self.scorer.manifold_dim
+        manifolds = torch.zeros(n, trades, manifold_dim, device=self.device)
+        equilibria = torch.zeros(n, trades, 2, device=self.device)
+        valid = torch.zeros(n, dtype=torch.bool, device=self.device)
+        
+        # Shape checks only touch metadata, so this loop never syncs the device
+        rows, manifold_rows, eq_rows = [], [], []
+        for i, response in enumerate(responses):
+            try:
+                manifold, equilibrium = response
+            except Exception:
+                continue
+            if manifold is None or equilibrium is None:
+                continue
+            if manifold.numel() == 0 or manifold.numel() % trades or equilibrium.numel() != 2 * trades:
+                continue
+            
+            # One manifold row per trade
+            manifold_rows_i = manifold.reshape(trades, -1)[:, :manifold_dim]
+            if manifold_rows_i.shape[1] < manifold_dim:
+                manifold_rows_i = torch.cat([
+                    manifold_rows_i,
+                    manifold_rows_i.new_zeros(trades, manifold_dim - manifold_rows_i.shape[1])
+                ], dim=1)
+            rows.append(i)
+            manifold_rows.append(manifold_rows_i)
+            eq_rows.append(equilibrium.reshape(trades, 2))
         
-        if manifold.numel() == 0 or equilibrium.numel() != 2:
-            return False
+        if not rows:
+            return manifolds, equilibria, valid
         
-        if torch.isnan(manifold).any() or torch.isinf(manifold).any():
-            return False
-        if torch.isnan(equilibrium).any() or torch.isinf(equilibrium).any():
-            return False
+        index = torch.tensor(rows, dtype=torch.long, device=self.device)
+        manifolds[index] = torch.stack(manifold_rows).to(self.device, torch.float32)
+        equilibria[index] = torch.stack(eq_rows).to(self.device, torch.float32)
+        valid[index] = True
         
-        return True
+        # One isfinite pass over the whole round replaces per-response isnan/isinf checks
+        finite = torch.isfinite(torch.cat([manifolds, equilibria], dim=2)).flatten(1).all(dim=1)
+        valid &= finite
+        
+        # Zero out invalid rows so NaN/Inf never reach the scorer
+        manifolds[~valid] = 0.0
+        equilibria[~valid] = 0.0
+        
+        return manifolds, equilibria, valid
     
-    def _calculate_score(
+    def _score_batch(
         self,
         challenge: torch.FloatTensor,
-        manifold: torch.FloatTensor,
-        equilibrium: torch.FloatTensor,
+        manifolds: torch.Tensor,
+        equilibria: torch.Tensor,
+        valid: torch.Tensor,
         commitments: torch.Tensor
-    ) -> float:
+    ) -> torch.Tensor:
         """
-        Calculate score for a miner's response.
+        Score a whole round in one model call. Invalid rows score 0.
         
-        In TRAINING mode: compare to ground truth (from solver)
-        In PRODUCTION mode: compare to model's estimate
+        Training mode scores with the fidelity scorer, production mode with
+        the commitment model's estimate (shared by every response).
         """
+        scores = torch.zeros(valid.shape[0], device=self.device)
         
         if self.training_state.mode == "training" and NashSolver is not None:
-            # Training: use solver to get ground truth
-            # For now, use the fidelity scorer as proxy
             with torch.no_grad():
-                score_tensor = self.scorer(challenge.to(self.device), 
-                                          manifold.to(self.device), 
-                                          equilibrium.to(self.device))
-                return score_tensor.item()
+                batch_scores = self.scorer.score_batch(
+                    challenge.to(self.device), manifolds, equilibria
+                )
+            scores = torch.where(valid, batch_scores, scores)
         else:
-            # Production: use trained model
+            # Commitments are shared by every response, so estimate once per round
             estimate = self._estimate_optimality(commitments)
-            
-            # Score based on how close miner is to estimate
-            # This is simplified - real version would compare actual settlement
-            base_score = estimate['is_optimal_prob']
-            
-            # Bonus for fast response
-            return min(1.0, base_score * 1.2)
+            base_score = min(1.0, estimate['is_optimal_prob'] * 1.2)
+            scores = valid.float() * base_score
+        
+        return scores
+    
+    async def _query_axon(
+        self,
+        index: int,
+        axon,
+        synapse: NashSynapse
+    ) -> Tuple[int, object, float]:
+        """Query a single miner; returns (index, deserialized response, latency in ms)."""
+        start = time.perf_counter()
+        try:
+            response = await self.dendrite.call(
+                target_axon=axon,
+                synapse=synapse.copy(),
+                timeout=self.query_timeout,
+                deserialize=True
+            )
+        except Exception as e:
+            bt.logging.debug(f"Query to axon {index} failed: {e}")
+            response = None
+        return index, response, (time.perf_counter() - start) * 1000
+    
+    async def _query_and_score_streaming(self, state: ValidationRound) -> ValidationRound:
+        """
+        Query all miners concurrently and score responses as they complete.
+        
+        Responses are scored in micro-batches of up to stream_batch_size
+        while the rest are still in flight. Once query_timeout elapses,
+        outstanding queries are cancelled and score 0.
+        
+        Fills state.scores, state.valid, state.manifolds, state.equilibria
+        and state.latencies ([N] ms, NaN if no response).
+        """
+        n = len(state.axons)
+        state.scores = torch.zeros(n, device=self.device)
+        state.valid = torch.zeros(n, dtype=torch.bool, device=self.device)
+        trades = state.challenge.shape[0]
+        state.manifolds = torch.zeros(n, trades, self.scorer.manifold_dim, device=self.device)
+        state.equilibria = torch.zeros(n, trades, 2, device=self.device)
+        state.latencies = torch.full((n,), float("nan"))
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.query_timeout
+        pending = {
+            asyncio.ensure_future(self._query_axon(i, axon, state.synapse))
+            for i, axon in enumerate(state.axons)
+        }
+        arrived: List[Tuple[int, object]] = []
+        
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    index, response, latency_ms = task.result()
+                    state.latencies[index] = latency_ms
+                    arrived.append((index, response))
+                
+                # Score a full micro-batch now, or whatever is left once nothing is in flight
+                if len(arrived) >= self.stream_batch_size or (arrived and not pending):
+                    self._score_arrivals(arrived, state)
+                    arrived = []
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if arrived:
+            self._score_arrivals(arrived, state)
+        if pending:
+            bt.logging.debug(f"{len(pending)}/{n} miners missed the {self.query_timeout}s deadline")
+        
+        return state
+    
+    def _score_arrivals(self, arrived: List[Tuple[int, object]], state: ValidationRound):
+        """Score a micro-batch of (index, response) pairs into the round tensors."""
+        index = torch.tensor([i for i, _ in arrived], dtype=torch.long, device=self.device)
+        manifolds, equilibria, batch_valid = self._stack_responses(
+            [r for _, r in arrived], trades=state.challenge.shape[0]
+        )
+        state.scores[index] = self._score_batch(
+            state.challenge, manifolds, equilibria, batch_valid, state.commitments
+        )
+        state.valid[index] = batch_valid
+        state.manifolds[index] = manifolds
+        state.equilibria[index] = equilibria
+    
+    def _prepare_round(self) -> Optional[ValidationRound]:
+        """Stage 1: pick axons and build the challenge (no network I/O)."""
+        axons = self._get_axon_references()
+        if not axons:
+            bt.logging.warning("No valid axons found")
+            return None
+        
+        # Challenges and the commitments we see for them (as in production)
+        challenge = self._generate_challenge(self.trades_per_round)
+        
+        # Trade ids: the first travels on the synapse so settlements can
+        # report reveals under it
+        challenge_id = self._next_challenge_id
+        self._next_challenge_id += len(challenge)
+        
+        # Flat intents keep single-party miners working; the party tensor is
+        # only attached when some trade really has several parties
+        synapse = NashSynapse(raw_intent=challenge.intents, wire_format=self.wire_format, challenge_id=challenge_id)
+        if bool((challenge.party_mask.sum(dim=1) > 1).any()):
+            synapse.set_parties(challenge.parties, challenge.party_mask)
+        
+        # Log the commitments so later reveals can be joined against them
+        if self.reveal_log is not None:
+            self.reveal_log.append_commitments(
+                np.arange(challenge_id, challenge_id + len(challenge)),
+                challenge.commitments.cpu().numpy(),
+            )
+        
+        return ValidationRound(
+            uids=self.axon_cache.uids,
+            axons=axons,
+            challenge=challenge.intents,
+            commitments=challenge.commitments,
+            synapse=synapse,
+            started=time.perf_counter(),
+            challenge_id=challenge_id,
+        )
+    
+    async def _query_round(self, state: ValidationRound) -> ValidationRound:
+        """Stage 2: query miners (streaming mode also scores as responses arrive)."""
+        if self.streaming:
+            state = await self._query_and_score_streaming(state)
+            self.last_round_latencies = state.latencies
+        else:
+            state.responses = await self.dendrite(
+                axons=state.axons,
+                synapse=state.synapse,
+                deserialize=True,
+                timeout=self.query_timeout
+            )
+        return state
+    
+    def _score_round(self, state: ValidationRound) -> Tuple[List[int], torch.Tensor]:
+        """Stage 3: score responses into an unnormalized [len(uids)] vector."""
+        if state.scores is None:
+            # Process responses: stack, validate and score the whole round at once
+            state.manifolds, state.equilibria, state.valid = self._stack_responses(
+                state.responses, trades=state.challenge.shape[0]
+            )
+            state.scores = self._score_batch(
+                state.challenge, state.manifolds, state.equilibria, state.valid, state.commitments
+            )
+        
+        scores = torch.zeros(len(state.uids), device=self.device)
+        n = min(len(state.uids), state.scores.shape[0])
+        scores[:n] = state.scores[:n]
+        valid_count = int(state.valid.sum())
+        
+        # Training mode: learn commitments -> optimal from solver ground truth
+        if self.training_state.mode == "training" and self.nash_solver is not None:
+            train_commitments, train_targets = self._ground_truth_batch(self.training_batch_size)
+            self._train_on_sample(train_commitments, train_targets)
+        
+        # Handle insufficient responses
+        if valid_count < 1:
+            scores = scores * 0.5
+        
+        # S = Q x PMU x TWF; TWF tracks quality before the sybil collapse
+        twf = self._update_twf(state, scores) if self.twf is not None else None
+        
+        # Near-duplicate responses from different UIDs collapse their PMU
+        pmu = self._sybil_pmu(state)
+        scores[:n] = scores[:n] * pmu[:n]
+        if twf is not None:
+            scores = scores * twf
+        
+        elapsed = time.perf_counter() - state.started
+        bt.logging.info(
+            f"Validation round ({self.training_state.mode}) completed in {elapsed*1000:.1f}ms, "
+            f"valid: {valid_count}/{len(state.uids)}"
+        )
+        return state.uids, scores
+    
+    def _sybil_pmu(self, state: ValidationRound) -> torch.Tensor:
+        """Cluster this round's responses and return [N] PMU multipliers."""
+        # The first trade suffices: copies of one model agree on every trade
+        state.cluster_ids, cluster_sizes = self.sybil.cluster(
+            state.manifolds[:, 0], state.equilibria[:, 0], state.valid
+        )
+        clustered = int((cluster_sizes > 1).sum())
+        if clustered:
+            bt.logging.info(f"Sybil detection: {clustered} responses in duplicate clusters")
+        return SybilDetector.pmu(cluster_sizes)
+    
+    def _update_twf(self, state: ValidationRound, scores: torch.Tensor) -> torch.Tensor:
+        """Record this round in the TWF store and return [len(uids)] multipliers."""
+        n = len(state.uids)
+        uids = np.asarray(state.uids, dtype=np.int64)
+        quality = scores.detach().cpu().numpy()
+        responded = np.zeros(n, dtype=bool)
+        m = min(n, state.valid.shape[0])
+        responded[:m] = state.valid[:m].cpu().numpy()
+        latency_ms = None
+        if state.latencies is not None:
+            latency_ms = np.full(n, np.nan)
+            latency_ms[:m] = state.latencies[:m].numpy()
+        
+        self.twf.record(uids, quality, responded, latency_ms)
+        self.twf.apply_fidelity_slash(uids[responded], quality[responded])
+        return torch.from_numpy(self.twf.twf(uids)).to(self.device)
+    
+    def _set_weights(self, uids: List[int], scores: torch.Tensor):
+        """Stage 4: normalize and publish weights."""
+        scores = torch.relu(scores)
+        if scores.sum() > 0:
+            scores = scores / scores.sum()
+        
+        self.subtensor.set_weights(
+            netuid=self.config.netuid,
+            wallet=self.wallet,
+            uids=uids,
+            weights=scores.cpu().numpy().tolist()
+        )
+        
+        # Strata move slowly, so refresh them (and persist state) per weight update
+        if self.twf is not None:
+            stake = getattr(self.metagraph, 'S', None)
+            self.twf.update_strata(np.asarray(stake) if stake is not None else None)
+            self.twf.flush()
+        if self.reveal_log is not None:
+            self.reveal_log.flush()
     
     async def forward(self):
         """
         Validator loop: Challenge -> Score -> Set Weights.
         
-        Handles both training and production modes.
+        Handles both training and production modes. Runs one round end to
+        end; see run_pipeline() for overlapping rounds.
         """
-        start_time = time.perf_counter()
-        
         try:
-            # Get axon references
-            axons = self._get_axon_references()
-            if not axons:
-                bt.logging.warning("No valid axons found")
+            state = self._prepare_round()
+            if state is None:
                 return
             
-            miner_uids = self.metagraph.uids.tolist()
-            
-            # Generate challenge
-            challenge_intent, _ = self._generate_challenge()
-            
-            # Get commitments (what we see in production)
-            commitments = self._commitments_from_intent(challenge_intent)
-            
-            # Query miners
-            synapse = NashSynapse(raw_intent=challenge_intent)
-            
             try:
-                dendrite_responses = await self.dendrite(
-                    axons=axons,
-                    synapse=synapse,
-                    deserialize=True,
-                    timeout=5.0
-                )
+                state = await self._query_round(state)
             except Exception as e:
                 bt.logging.error(f"Error querying dendrite: {e}")
                 return
             
-            # Process responses
-            scores = torch.zeros(len(miner_uids), device=self.device)
-            valid_count = 0
-            
-            for i, response in enumerate(dendrite_responses):
-                try:
-                    manifold, equilibrium = response
-                    
-                    if not self._validate_response(manifold, equilibrium):
-                        continue
-                    
-                    score = self._calculate_score(
-                        challenge_intent,
-                        manifold,
-                        equilibrium,
-                        commitments
-                    )
-                    
-                    scores[i] = score
-                    valid_count += 1
-                    
-                except Exception as e:
-                    bt.logging.warning(f"Error processing response {i}: {e}")
-                    continue
-            
-            # Handle insufficient responses
-            if valid_count < 1:
-                scores = scores * 0.5
-            
-            # Normalize
-            scores = torch.relu(scores)
-            if scores.sum() > 0:
-                scores = scores / scores.sum()
-            
-            # Set weights
-            elapsed = time.perf_counter() - start_time
-            bt.logging.info(
-                f"Validation round ({self.training_state.mode}) completed in {elapsed*1000:.1f}ms, "
-                f"valid: {valid_count}/{len(miner_uids)}"
-            )
-            
-            self.subtensor.set_weights(
-                netuid=self.config.netuid,
-                wallet=self.wallet,
-                uids=miner_uids,
-                weights=scores.cpu().numpy().tolist()
-            )
+            uids, scores = self._score_round(state)
+            self._set_weights(uids, scores)
             
         except Exception as e:
             bt.logging.error(f"Error in validator forward: {e}")
             import traceback
             bt.logging.debug(traceback.format_exc())
     
-    def _get_axon_references(self) -> List:
-        """Get cached or fresh axon references."""
-        current_time = time.time()
-        
-        if (self._axon_cache is not None and 
-            current_time - self._axon_cache_time < self._axon_cache_ttl):
-            return self._axon_cache
+    async def run_pipeline(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        commit_every: int = DEFAULT_COMMIT_EVERY,
+        round_interval: float = DEFAULT_ROUND_INTERVAL,
+        num_rounds: Optional[int] = None
+    ):
+        """
+        Run validation rounds through a RoundPipeline.
         
+        Up to `concurrency` rounds query the network at once while earlier
+        rounds are scored; scores are averaged per UID and weights are set
+        every `commit_every` rounds. The defaults are RoundPipeline's (see
+        nash.pipeline): the neuron's original cadence.
+        """
+        self.pipeline = RoundPipeline(
+            prepare=self._prepare_round,
+            query=self._query_round,
+            score=self._score_round,
+            commit=self._set_weights,
+            concurrency=concurrency,
+            queue_size=queue_size,
+            commit_every=commit_every,
+            round_interval=round_interval,
+        )
+        await self.pipeline.run(num_rounds)
+    
+    def _get_axon_references(self) -> List:
+        """Get axon references, syncing the cache if the metagraph has moved on."""
         try:
-            uids = self.metagraph.uids
-            axons = [self.metagraph.axons[uid] for uid in uids]
-            self._axon_cache = axons
-            self._axon_cache_time = current_time
-            return axons
+            reregistered = self.axon_cache.sync(self.metagraph)
+            # A new hotkey on a UID is a new miner: drop the old reputation
+            if reregistered and self.twf is not None:
+                self.twf.reset(reregistered)
         except Exception as e:
             bt.logging.error(f"Error getting axon references: {e}")
-            return self._axon_cache or []
+        return self.axon_cache.axons
+    
+    def shutdown(self):
+        """Stop the background threads (joining the trainer) and flush state to disk."""
+        self.trainer.stop()
+        self.checkpoint_watcher.stop()
+        self.challenges.stop()
+        if self.reveal_consumer is not None:
+            self.reveal_consumer.stop()
+        if self.reveal_log is not None:
+            self.reveal_log.close()
+        if self.twf is not None:
+            self.twf.flush()
+    
+    def __exit__(self, *exc):
+        self.shutdown()
+        return super().__exit__(*exc)
+    
+    def get_scorer_info(self) -> dict:
+        """Return scoring model information for debugging."""
+        return {
+            "mode": self.training_state.mode,
+            "model_ready": self.training_state.model_ready,
+            "samples_collected": self.training_state.samples_collected,
+            "trainer_steps": self.trainer.steps,
+            "checkpoint_reloads": self.checkpoint_watcher.reloads,
+            "device": str(self.device),
+            "precision": self.precision,
+            "scorer_precision": self.scorer_precision,
+            "precision_drift": self._precision_report,
+            "streaming": self.streaming,
+            "pipeline": self.pipeline.stats() if self.pipeline is not None else None,
+            "twf": self.twf.stats() if self.twf is not None else None,
+            "reveals": self.reveal_consumer.stats() if self.reveal_consumer is not None else None,
+            "sybil": self.sybil.stats(),
+            "axons": self.axon_cache.stats(),
+            "challenges": self.challenges.stats(),
+            "last_round_latency_ms": (
+                self.last_round_latencies.nanmedian().item()
+                if self.last_round_latencies is not None else None
+            ),
+        }
 
 
 # ============================================================================
@@ -467,9 +1019,6 @@ if __name__ == "__main__":
         with NashValidator() as validator:
             bt.logging.info(f"Validator running in {validator.training_state.mode} mode")
             
-            while True:
-                await validator.forward()
-                await asyncio.sleep(10)
+            await validator.run_pipeline()
     
     asyncio.run(run_validator())
-```
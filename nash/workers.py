@@ -0,0 +1,410 @@
+"""
+NASH Inference Workers - Multi-process miner inference on shared weights.
+
+One Python process runs every encode+solve pass on a single core. The
+InferencePool starts N worker processes that all map the same encoder and
+solver weights from shared memory (torch.multiprocessing shares tensor
+storage by handle, nothing is copied per worker), and moves requests
+through a fixed set of shared-memory slots:
+
+    front-end: copy intent rows into slot k, put k on the request queue
+    worker:    read slot k, run the models, write outputs into slot k,
+               put k on the response queue
+    front-end: copy the outputs out of slot k and release it
+
+Only slot indices cross the queues; tensors are never pickled. A second
+encoder for packed multi-party rows can be served next to the flat one:
+each slot records which encoder its rows are for, and which model copy it
+was submitted against. The worker loop lives in nash._worker, which does
+not import bittensor.
+
+Optimizations:
+- One model copy in shared memory for all workers (two while a hot
+  reload is being staged); a reload waits until no request still runs on
+  the copy it overwrites
+- Preallocated input/output slots, sized for a full batch
+- One intra-op thread per worker so N workers use N cores without
+  oversubscription
+
+Workers that die are respawned, and the slot they were serving is failed
+back to its caller instead of leaking. INT8 models are rejected: dynamic
+quantization packs weights outside the shareable parameters, so workers
+would never see hot-reloaded weights.
+"""
+
+import bittensor as bt
+import torch
+import torch.multiprocessing as mp
+import torch.nn as nn
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+import collections
+import copy
+import queue
+import threading
+import time
+
+from nash._worker import INTENT as _INTENT, PARTY as _PARTY, worker_main
+
+
+def _has_packed_params(module: Optional[nn.Module]) -> bool:
+    """True for dynamically quantized modules, whose weights are not parameters."""
+    if module is None:
+        return False
+    return any(hasattr(submodule, "_packed_params") for submodule in module.modules())
+
+
+@dataclass
+class _Pending:
+    """Front-end state of one in-flight slot."""
+    done: threading.Event = field(default_factory=threading.Event)
+    error: Optional[str] = None
+    abandoned: bool = False
+
+
+class InferencePool:
+    """
+    N inference processes fed through shared-memory slots.
+
+    `run(intent)` is blocking and thread-safe: call it from an executor
+    with as many threads as there are workers. Batches larger than
+    `slot_rows` are split across slots (and so across workers). Rows
+    `party_dim` wide go to `party_encoder` instead of `encoder`.
+
+    Args:
+        encoder, solver: fp32 or bf16 models to serve (CPU); shared, not
+            copied per worker
+        workers: Number of worker processes
+        slot_rows: Rows per slot, normally the miner's max batch size
+        slots: Shared request slots; requests beyond this wait for a free one
+        intent_dim, manifold_dim: Slot widths
+        timeout: Default seconds run() waits for free slots and results
+            before giving up, when the caller passes no timeout
+        threads_per_worker: torch intra-op threads in each worker
+        party_encoder: Optional encoder for packed multi-party rows
+        party_dim: Width of those rows
+
+    Raises:
+        ValueError: For INT8 (dynamically quantized) models.
+    """
+
+    def __init__(
+        self,
+        encoder: nn.Module,
+        solver: nn.Module,
+        workers: int = 4,
+        slot_rows: int = 64,
+        slots: Optional[int] = None,
+        intent_dim: int = 10,
+        manifold_dim: int = 256,
+        timeout: float = 5.0,
+        threads_per_worker: int = 1,
+        party_encoder: Optional[nn.Module] = None,
+        party_dim: int = 0,
+    ):
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if slot_rows < 1:
+            raise ValueError(f"slot_rows must be >= 1, got {slot_rows}")
+        if party_encoder is not None and party_dim < 1:
+            raise ValueError(f"party_dim must be >= 1 with a party_encoder, got {party_dim}")
+        if any(_has_packed_params(module) for module in (encoder, solver, party_encoder)):
+            raise ValueError("INT8 models keep packed weights outside shared memory; run them in-process")
+
+        self.workers = workers
+        self.slot_rows = slot_rows
+        self.num_slots = slots or 4 * workers
+        self.intent_dim = intent_dim
+        self.party_dim = party_dim if party_encoder is not None else 0
+        self.timeout = timeout
+        self.threads_per_worker = threads_per_worker
+
+        # Spawned (not forked) workers: the miner process already runs threads
+        self._ctx = mp.get_context("spawn")
+
+        # Double-buffered shared models: requests run on the copy that was
+        # active when they were submitted (recorded per slot in _versions)
+        self._models = [self._share(encoder, solver, party_encoder), self._share(encoder, solver, party_encoder)]
+        self._active = 0
+
+        width = max(intent_dim, self.party_dim)
+        self._intents = torch.zeros(self.num_slots, slot_rows, width).share_memory_()
+        self._manifolds = torch.zeros(self.num_slots, slot_rows, manifold_dim).share_memory_()
+        self._equilibria = torch.zeros(self.num_slots, slot_rows, 2).share_memory_()
+        self._rows = torch.zeros(self.num_slots, dtype=torch.int32).share_memory_()
+        self._kinds = torch.zeros(self.num_slots, dtype=torch.int8).share_memory_()
+        self._versions = torch.zeros(self.num_slots, dtype=torch.int8).share_memory_()
+        # Slot each worker is serving, -1 when idle
+        self._current = torch.full((workers,), -1, dtype=torch.int32).share_memory_()
+
+        self._requests = self._ctx.Queue()
+        self._responses = self._ctx.Queue()
+        self._free: "queue.Queue[int]" = queue.Queue()
+        for slot in range(self.num_slots):
+            self._free.put(slot)
+        self._pending: Dict[int, _Pending] = {}
+        self._lock = threading.Lock()
+        # Slots held per model copy; a reload waits for its copy to drain
+        self._in_use = [0, 0]
+        self._drained = threading.Condition(self._lock)
+        self._reload_lock = threading.Lock()
+
+        self._processes: List = []
+        self._listener: Optional[threading.Thread] = None
+        self._closed = False
+        self._respawn_lock = threading.Lock()
+
+        self.dispatched = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.reloads = 0
+        self.respawns = 0
+
+    @staticmethod
+    def _share(*modules: Optional[nn.Module]) -> Tuple[Optional[nn.Module], ...]:
+        return tuple(
+            None if module is None else copy.deepcopy(module).cpu().eval().share_memory()
+            for module in modules
+        )
+
+    def start(self):
+        """Start the worker processes and the response listener (idempotent)."""
+        if self._processes:
+            return
+        self._closed = False
+        self._processes = [self._spawn(worker_id) for worker_id in range(self.workers)]
+
+        self._listener = threading.Thread(target=self._listen, name="nash-infer-listener", daemon=True)
+        self._listener.start()
+        bt.logging.info(f"Started {self.workers} inference workers ({self.num_slots} slots)")
+
+    def _spawn(self, worker_id: int):
+        process = self._ctx.Process(
+            target=worker_main,
+            args=(
+                worker_id, self._models, (self.intent_dim, self.party_dim),
+                self._intents, self._manifolds, self._equilibria, self._rows, self._kinds,
+                self._versions, self._current, self._requests, self._responses, self.threads_per_worker,
+            ),
+            name=f"nash-infer-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        return process
+
+    def _check_workers(self):
+        """Respawn dead workers and fail the slot each one was serving."""
+        with self._respawn_lock:
+            if self._closed:
+                return
+            for worker_id, process in enumerate(self._processes):
+                if process.is_alive():
+                    continue
+                slot = int(self._current[worker_id])
+                self._current[worker_id] = -1
+                if slot >= 0:
+                    self._finish(slot, f"worker {worker_id} exited with code {process.exitcode}")
+                bt.logging.warning(f"Inference worker {worker_id} died (exit code {process.exitcode}), respawning")
+                self._processes[worker_id] = self._spawn(worker_id)
+                self.respawns += 1
+
+    def stop(self, timeout: float = 5.0):
+        with self._respawn_lock:
+            self._closed = True
+        for _ in self._processes:
+            self._requests.put(None)
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+        self._responses.put((None, None))
+        if self._listener is not None:
+            self._listener.join(timeout)
+
+    def _listen(self):
+        while True:
+            slot, error = self._responses.get()
+            if slot is None:
+                break
+            self._finish(slot, error)
+
+    def _finish(self, slot: int, error: Optional[str]):
+        """Hand a slot's result to its caller, or free it if the caller gave up."""
+        with self._lock:
+            pending = self._pending.get(slot)
+            if pending is None or pending.done.is_set():
+                return
+            if pending.abandoned:
+                # The caller gave up; the slot is safe to reuse only now
+                self._free_locked(slot)
+                return
+            pending.error = error
+            pending.done.set()
+
+    def _abandon(self, slot: int, pending: _Pending) -> bool:
+        """Give up on a slot; returns False if its result already arrived."""
+        with self._lock:
+            if pending.done.is_set():
+                return False
+            pending.abandoned = True
+            return True
+
+    def update_weights(self, encoder: nn.Module, solver: nn.Module, party_encoder: Optional[nn.Module] = None):
+        """
+        Load new weights into the standby model copy, then switch new
+        requests to it. Requests already running finish on the previous copy.
+
+        The standby copy is only overwritten once no request submitted
+        against it (before the previous reload) is still in flight.
+
+        Raises:
+            TimeoutError: If those requests do not finish within `timeout`.
+        """
+        with self._reload_lock:
+            standby = 1 - self._active
+            with self._drained:
+                drained = self._drained.wait_for(lambda: self._in_use[standby] == 0, timeout=self.timeout)
+            if not drained:
+                raise TimeoutError(f"Requests on the standby model still running after {self.timeout}s")
+
+            # New requests go to the active copy, so nothing reads standby while it loads
+            target_encoder, target_solver, target_party = self._models[standby]
+            target_encoder.load_state_dict(encoder.state_dict())
+            target_solver.load_state_dict(solver.state_dict())
+            if party_encoder is not None and target_party is not None:
+                target_party.load_state_dict(party_encoder.state_dict())
+            with self._lock:
+                self._active = standby
+            self.reloads += 1
+
+    def _acquire(self, deadline: float) -> int:
+        """
+        Take a free slot, waiting until `deadline` (time.monotonic()). While
+        waiting, dead workers are respawned so their slots come back.
+        """
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+        while True:
+            self._check_workers()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.timeouts += 1
+                raise TimeoutError("No free inference slot before the deadline")
+            try:
+                return self._free.get(timeout=min(remaining, 0.5))
+            except queue.Empty:
+                continue
+
+    def _submit(self, chunk: torch.Tensor, kind: int, deadline: float) -> Tuple[int, _Pending]:
+        slot = self._acquire(deadline)
+        n, width = chunk.shape
+        self._intents[slot, :n, :width] = chunk
+        self._rows[slot] = n
+        self._kinds[slot] = kind
+        pending = _Pending()
+        with self._lock:
+            self._versions[slot] = self._active
+            self._in_use[self._active] += 1
+            self._pending[slot] = pending
+        self._requests.put(slot)
+        self.dispatched += 1
+        return slot, pending
+
+    def _collect(self, slot: int, pending: _Pending, deadline: float) -> Tuple[torch.Tensor, torch.Tensor]:
+        if not pending.done.wait(max(deadline - time.monotonic(), 0.0)):
+            # A dead worker's slot is failed (and the worker replaced) here
+            self._check_workers()
+            if self._abandon(slot, pending):
+                self.timeouts += 1
+                raise TimeoutError(f"Inference slot {slot} missed its deadline")
+
+        n = int(self._rows[slot])
+        try:
+            if pending.error is not None:
+                self.errors += 1
+                raise RuntimeError(pending.error)
+            return self._manifolds[slot, :n].clone(), self._equilibria[slot, :n].clone()
+        finally:
+            self._release(slot)
+
+    def _release(self, slot: int):
+        with self._lock:
+            self._free_locked(slot)
+
+    def _free_locked(self, slot: int):
+        """Return a slot to the free list (caller holds _lock)."""
+        del self._pending[slot]
+        self._in_use[int(self._versions[slot])] -= 1
+        self._drained.notify_all()
+        self._free.put(slot)
+
+    def run(self, intent: torch.Tensor, timeout: Optional[float] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Run a [B, intent_dim] (or [B, party_dim]) batch on the workers;
+        returns ([B, manifold_dim], [B, 2]).
+
+        `timeout` is the caller's remaining budget in seconds (default: the
+        pool's timeout); waiting for slots and results both count against it.
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        device = intent.device
+        width = intent.shape[-1]
+        if width == self.intent_dim:
+            kind = _INTENT
+        elif width == self.party_dim:
+            kind = _PARTY
+        else:
+            raise ValueError(f"Rows must be {self.intent_dim} or {self.party_dim} wide, got {width}")
+        intent = intent.detach().reshape(-1, width).float().cpu()
+
+        # Chunks are dispatched before waiting, so they run on different workers.
+        # A call holding every slot collects its oldest chunk before taking
+        # another, or a batch larger than the pool would wait on itself.
+        submitted: Deque[Tuple[int, _Pending]] = collections.deque()
+        results = []
+        errors = []
+
+        def collect_oldest():
+            slot, pending = submitted.popleft()
+            try:
+                results.append(self._collect(slot, pending, deadline))
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            for chunk in intent.split(self.slot_rows):
+                if len(submitted) == self.num_slots:
+                    collect_oldest()
+                if errors:
+                    break
+                submitted.append(self._submit(chunk, kind, deadline))
+        except Exception:
+            # Chunks already dispatched release their slots when they complete
+            for slot, pending in submitted:
+                if not self._abandon(slot, pending):
+                    self._release(slot)
+            raise
+        while submitted:
+            collect_oldest()
+        if errors:
+            raise errors[0]
+
+        manifold = torch.cat([m for m, _ in results])
+        equilibrium = torch.cat([e for _, e in results])
+        return manifold.to(device), equilibrium.to(device)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "alive": sum(p.is_alive() for p in self._processes),
+            "slots": self.num_slots,
+            "in_flight": self.num_slots - self._free.qsize(),
+            "dispatched": self.dispatched,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "reloads": self.reloads,
+            "respawns": self.respawns,
+        }
@@ -0,0 +1,29 @@
+"""NASH Neurons - Miner and Validator entry points."""
+
+import importlib
+import typing
+
+# Public names -> defining module, imported on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "NashMiner": "neurons.miner",
+    "NashValidator": "neurons.validator",
+}
+
+__all__ = ["NashMiner", "NashValidator"]
+
+if typing.TYPE_CHECKING:
+    from neurons.miner import NashMiner
+    from neurons.validator import NashValidator
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
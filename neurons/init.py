@@ -1,12 +0,0 @@
-**neurons/__init__.py**
-
-```python
-"""NASH Neurons - Miner and Validator entry points."""
-
-from neurons.miner import NashMiner
-from neurons.validator import NashValidator
-
-__all__ = ["NashMiner", "NashValidator"]
-```
-
----
@@ -1,6 +1,3 @@
-**neurons/miner.py**
-
-```python
 """
 NASH Miner Neuron - Entry point for running the miner.
 
@@ -11,6 +8,12 @@ import bittensor as bt
 from nash.protocol import NashSynapse
 from nash.miner import NashMiner as CoreMiner
 import asyncio
+import os
+
+
+# Warm-start snapshot: written on the first start, reused after restarts
+SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), '..', 'models', 'miner_snapshot.pt')
+CHECKPOINT_PATH = os.path.join(os.path.dirname(__file__), '..', 'models', 'miner_model.safetensors')
 
 
 class NashMiner(CoreMiner):
@@ -27,7 +30,7 @@ async def main():
     """Main entry point for the miner."""
     bt.logging.info("Starting NASH Miner...")
     
-    with NashMiner() as miner:
+    with NashMiner(snapshot_path=SNAPSHOT_PATH, checkpoint_path=CHECKPOINT_PATH) as miner:
         bt.logging.info(f"Miner model info: {miner.get_model_info()}")
         
         while True:
@@ -38,6 +41,3 @@ async def main():
 if __name__ == "__main__":
     import asyncio
     asyncio.run(main())
-```
-
----
@@ -1,6 +1,3 @@
-**neurons/validator.py**
-
-```python
 """
 NASH Validator Neuron - Entry point for running the validator.
 
@@ -30,15 +27,10 @@ async def main():
     with NashValidator() as validator:
         bt.logging.info(f"Validator scorer info: {validator.get_scorer_info()}")
         
-        while True:
-            bt.logging.info("Running validation round...")
-            await validator.forward()
-            await asyncio.sleep(10)
+        bt.logging.info("Running pipelined validation rounds...")
+        await validator.run_pipeline()
 
 
 if __name__ == "__main__":
     import asyncio
     asyncio.run(run_validator())
-```
-
----
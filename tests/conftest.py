@@ -0,0 +1,11 @@
+"""
+Use the benchmark stand-ins for bittensor when the real package is missing,
+so the neuron modules import under plain pytest.
+"""
+
+import importlib.util
+
+if importlib.util.find_spec("bittensor") is None:
+    from benchmarks import stubs
+
+    stubs.install()
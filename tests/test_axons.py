@@ -0,0 +1,60 @@
+"""
+AxonCache incremental syncs against a hand-built metagraph.
+
+    python -m pytest tests/test_axons.py
+"""
+
+from types import SimpleNamespace
+
+import torch
+
+from nash.axons import AxonCache
+
+
+def metagraph(block: int, hotkeys, endpoints=None):
+    endpoints = endpoints or [f"10.0.0.{uid}:8091" for uid in range(len(hotkeys))]
+    return SimpleNamespace(
+        block=block,
+        uids=torch.arange(len(hotkeys)),
+        hotkeys=list(hotkeys),
+        axons=list(endpoints),
+    )
+
+
+def test_first_sync_builds_index():
+    cache = AxonCache()
+    assert cache.sync(metagraph(1, ["a", "b", "c"])) == []
+
+    assert len(cache) == 3
+    assert cache.axons[2] == "10.0.0.2:8091"
+    assert cache.uid_to_index.tolist() == [0, 1, 2]
+
+
+def test_same_block_is_a_no_op():
+    cache = AxonCache()
+    cache.sync(metagraph(1, ["a", "b"]))
+    cache.sync(metagraph(1, ["x", "y"]))
+
+    assert cache.hotkeys == ["a", "b"] and cache.syncs == 1
+
+
+def test_changed_rows_are_patched_and_reregistrations_reported():
+    cache = AxonCache()
+    cache.sync(metagraph(1, ["a", "b", "c"]))
+    endpoints = ["10.0.0.0:8091", "10.0.0.9:9000", "10.0.0.2:8091"]
+    reregistered = cache.sync(metagraph(2, ["a", "b", "z"], endpoints))
+
+    assert reregistered == [2]
+    assert cache.axons[1] == "10.0.0.9:9000"
+    # Only the moved endpoint and the new hotkey were touched
+    assert cache.stats()["patched_uids"] == 3 + 2
+
+
+def test_grown_subnet_rebuilds_index():
+    cache = AxonCache()
+    cache.sync(metagraph(1, ["a", "b"]))
+    reregistered = cache.sync(metagraph(2, ["a", "q", "c"]))
+
+    assert reregistered == [1]
+    assert len(cache) == 3
+    assert cache.uid_to_index.tolist() == [0, 1, 2]
@@ -0,0 +1,120 @@
+"""
+RequestBatcher coalescing, width grouping and deadline hand-off.
+
+    python -m pytest tests/test_batching.py
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+from nash.batching import RequestBatcher
+
+
+class RecordingInfer:
+    """infer_fn that echoes each row's first feature and records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, batch, timeout=None):
+        self.calls.append((batch.shape, timeout))
+        first = batch[:, :1]
+        return first.expand(-1, 4).clone(), first.expand(-1, 2).clone()
+
+
+def intent(value: float, rows: int = 1, width: int = 8):
+    return torch.full((rows, width), value)
+
+
+def test_concurrent_requests_share_one_pass():
+    infer = RecordingInfer()
+
+    async def main():
+        batcher = RequestBatcher(infer, max_batch_size=64, window_seconds=0.01)
+        results = await asyncio.gather(*(batcher.submit(intent(i, rows=i + 1)) for i in range(4)))
+        return batcher, results
+
+    batcher, results = asyncio.run(main())
+
+    assert infer.calls == [(torch.Size([10, 8]), None)]
+    assert batcher.batches_run == 1 and batcher.requests_served == 4
+    # Each caller gets exactly its own rows back
+    for i, (manifold, equilibrium) in enumerate(results):
+        assert manifold.shape == (i + 1, 4) and equilibrium.shape == (i + 1, 2)
+        assert (manifold == i).all()
+
+
+def test_full_batch_flushes_before_window():
+    infer = RecordingInfer()
+
+    async def main():
+        batcher = RequestBatcher(infer, max_batch_size=2, window_seconds=60.0)
+        return await asyncio.wait_for(asyncio.gather(batcher.submit(intent(1)), batcher.submit(intent(2))), 5.0)
+
+    asyncio.run(main())
+    assert len(infer.calls) == 1
+
+
+def test_widths_are_batched_separately():
+    infer = RecordingInfer()
+
+    async def main():
+        batcher = RequestBatcher(infer, window_seconds=0.01)
+        return await asyncio.gather(
+            batcher.submit(intent(1, width=8)),
+            batcher.submit(intent(2, width=5)),
+            batcher.submit(intent(3, width=8)),
+        )
+
+    results = asyncio.run(main())
+
+    assert sorted(shape for shape, _ in infer.calls) == [torch.Size([1, 5]), torch.Size([2, 8])]
+    assert [manifold[0, 0].item() for manifold, _ in results] == [1, 2, 3]
+
+
+def test_timeout_reaches_infer_fn_only_when_every_caller_has_one():
+    infer = RecordingInfer()
+
+    async def main():
+        batcher = RequestBatcher(infer, window_seconds=0.01)
+        await asyncio.gather(batcher.submit(intent(1), timeout=5.0), batcher.submit(intent(2), timeout=1.0))
+        await asyncio.gather(batcher.submit(intent(1), timeout=5.0), batcher.submit(intent(2)))
+
+    asyncio.run(main())
+
+    (_, with_deadlines), (_, without) = infer.calls
+    # The latest deadline wins, less the time spent in the window
+    assert 4.0 < with_deadlines <= 5.0
+    assert without is None
+
+
+def test_cancelled_callers_are_dropped_from_executor_batches():
+    infer = RecordingInfer()
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            batcher = RequestBatcher(infer, window_seconds=0.01, executor=executor)
+            kept = asyncio.ensure_future(batcher.submit(intent(1)))
+            dropped = asyncio.ensure_future(batcher.submit(intent(2, rows=3)))
+            await asyncio.sleep(0)
+            dropped.cancel()
+            return await kept
+
+    manifold, _ = asyncio.run(main())
+
+    assert infer.calls == [(torch.Size([1, 8]), None)]
+    assert (manifold == 1).all()
+
+
+def test_inference_errors_reach_every_caller():
+    def broken(batch, timeout=None):
+        raise RuntimeError("boom")
+
+    async def main():
+        batcher = RequestBatcher(broken, window_seconds=0.01)
+        return await asyncio.gather(batcher.submit(intent(1)), batcher.submit(intent(2)), return_exceptions=True)
+
+    errors = asyncio.run(main())
+    assert all(isinstance(error, RuntimeError) for error in errors)
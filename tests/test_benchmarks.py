@@ -0,0 +1,36 @@
+"""
+Smoke tests for the benchmark harness under the bittensor stand-ins.
+
+    python -m pytest tests/test_benchmarks.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.run import compare
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_run_writes_results(tmp_path):
+    output = tmp_path / "results.json"
+    subprocess.run(
+        [sys.executable, "-m", "benchmarks.run", "--requests", "10", "--rounds", "1",
+         "--concurrency", "1", "8", "--miners", "256", "--output", str(output)],
+        cwd=ROOT, check=True, capture_output=True, timeout=600,
+    )
+    results = json.loads(output.read_text())
+    assert set(results["suites"]) == {"miner", "validator"}
+    assert results["suites"]["miner"]["c8"]["throughput_rps"] > 0
+    assert results["suites"]["validator"]["n256"]["p50_ms"] > 0
+
+
+def test_compare_flags_regressions_in_the_bad_direction():
+    baseline = {"suites": {"miner": {"c1": {"p50_ms": 10.0, "throughput_rps": 100.0}}}}
+    slower = {"suites": {"miner": {"c1": {"p50_ms": 12.0, "throughput_rps": 120.0}}}}
+
+    changes = {c["metric"]: c["regressed"] for c in compare(slower, baseline, tolerance=0.15)}
+    assert changes == {"miner.c1.p50_ms": True, "miner.c1.throughput_rps": False}
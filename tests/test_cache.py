@@ -0,0 +1,91 @@
+"""
+EquilibriumCache exact hits, TTL expiry and tolerance search.
+
+    python -m pytest tests/test_cache.py
+"""
+
+import torch
+
+import nash.cache
+from nash.cache import EquilibriumCache
+
+
+class Clock:
+    """Stands in for time.monotonic inside nash.cache."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def make_cache(monkeypatch, **kwargs) -> tuple:
+    clock = Clock()
+    monkeypatch.setattr(nash.cache, "time", clock)
+    return EquilibriumCache(capacity=16, ttl_seconds=30.0, **kwargs), clock
+
+
+def answer(value: float):
+    return torch.full((1, 256), value), torch.full((1, 2), value)
+
+
+def test_exact_hit(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    intent = torch.randn(1, 10)
+    cache.put(intent, {"a": 1}, *answer(1.0))
+
+    manifold, _ = cache.get(intent.clone(), {"a": 1})
+    assert manifold[0, 0] == 1.0
+    # Another context is another key
+    assert cache.get(intent, {"a": 2}) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_expire(monkeypatch):
+    cache, clock = make_cache(monkeypatch)
+    intent = torch.randn(1, 10)
+    cache.put(intent, None, *answer(1.0))
+
+    clock.now += 31
+    assert cache.get(intent) is None
+    assert cache.expirations == 1 and len(cache) == 0
+
+
+def test_near_hit_skips_expired_closer_entry(monkeypatch):
+    cache, clock = make_cache(monkeypatch, tolerance=0.1)
+    intent = torch.zeros(1, 10)
+    cache.put(intent + 0.01, None, *answer(1.0))
+    clock.now += 20
+    cache.put(intent + 0.05, None, *answer(2.0))
+    # The closer entry has expired, the further one is still live
+    clock.now += 15
+
+    manifold, _ = cache.get(intent)
+    assert manifold[0, 0] == 2.0
+    assert cache.near_hits == 1
+
+
+def test_party_rows_search_their_own_width(monkeypatch):
+    cache, _ = make_cache(monkeypatch, intent_dim=54)
+    flat, packed = torch.zeros(1, 10), torch.zeros(1, 54)
+    cache.put(flat, None, *answer(1.0))
+    cache.put(packed, None, *answer(2.0))
+
+    manifold, _ = cache.get(packed + 0.001, tolerance=0.01)
+    assert manifold[0, 0] == 2.0
+    manifold, _ = cache.get(flat + 0.001, tolerance=0.01)
+    assert manifold[0, 0] == 1.0
+
+
+def test_peek_leaves_counters_alone(monkeypatch):
+    cache, clock = make_cache(monkeypatch)
+    intent = torch.zeros(1, 10)
+    cache.put(intent, None, *answer(1.0))
+
+    assert cache.peek(intent + 0.01, None, tolerance=0.05) is not None
+    assert cache.peek(intent + 1.0, None, tolerance=0.05) is None
+    clock.now += 31
+    assert cache.peek(intent, None, tolerance=0.05) is None
+    assert (cache.hits, cache.near_hits, cache.misses, cache.expirations) == (0, 0, 0, 0)
+    assert len(cache) == 1
@@ -0,0 +1,56 @@
+"""
+LatencyHistogram / MinerMetrics accounting and Prometheus output.
+
+    python -m pytest tests/test_metrics.py
+"""
+
+import threading
+
+from nash.metrics import LatencyHistogram, MinerMetrics
+
+
+WRITERS = 4
+OBSERVATIONS = 20_000
+
+
+def test_concurrent_observes_are_all_counted():
+    histogram = LatencyHistogram()
+
+    def write():
+        for _ in range(OBSERVATIONS):
+            histogram.observe(0.003)
+
+    threads = [threading.Thread(target=write) for _ in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counts, total, count = histogram.snapshot()
+    assert count == sum(counts) == WRITERS * OBSERVATIONS
+    assert abs(total - 0.003 * count) < 1e-6 * count
+
+
+def test_quantiles_fall_in_their_bucket():
+    histogram = LatencyHistogram(buckets=(0.001, 0.01, 0.1))
+    for _ in range(90):
+        histogram.observe(0.0005)
+    for _ in range(10):
+        histogram.observe(0.05)
+
+    assert 0.0 < histogram.quantile(0.5) <= 0.001
+    assert 0.01 < histogram.quantile(0.99) <= 0.1
+
+
+def test_summary_and_prometheus_text():
+    metrics = MinerMetrics()
+    metrics.observe("total", 0.02)
+    metrics.increment("requests", 3)
+
+    summary = metrics.summary()
+    assert list(summary["stages"]) == ["total"]
+    assert summary["counters"]["requests"] == 3
+
+    text = metrics.render_prometheus()
+    assert 'nash_miner_stage_seconds_count{stage="total"} 1' in text
+    assert "nash_miner_requests_total 3" in text
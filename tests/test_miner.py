@@ -0,0 +1,50 @@
+"""
+NashMiner deadline fallbacks and session warm starts.
+
+    python -m pytest tests/test_miner.py
+"""
+
+import asyncio
+
+import pytest
+import torch
+
+from nash.miner import NashMiner
+from nash.protocol import MAX_PARTIES, PARTY_FEATURES, NashSynapse
+
+
+@pytest.fixture(scope="module")
+def miner():
+    torch.manual_seed(0)
+    return NashMiner(enable_batching=False, metrics_port=None)
+
+
+def party_synapse(parties: torch.Tensor, timeout=None) -> NashSynapse:
+    synapse = NashSynapse(context={"trader": "a"})
+    synapse.set_parties(parties)
+    synapse.timeout = timeout
+    return synapse
+
+
+def test_party_deadline_falls_back_to_nearby_cached_trade(miner):
+    parties = torch.rand(1, 3, PARTY_FEATURES)
+    answered = asyncio.run(miner.forward(party_synapse(parties)))
+    stats = miner._cache.stats()
+
+    # Slightly revised trade with no time left: answered from the cache
+    revised = parties + 0.01
+    fallback = asyncio.run(miner.forward(party_synapse(revised, timeout=1e-9)))
+    assert miner.metrics.counters["fallbacks"] == 1
+    assert torch.equal(fallback.equilibrium_point, answered.equilibrium_point)
+    # Only the forward's own exact lookup counts; the fallback probe does not
+    assert miner._cache.stats()["misses"] == stats["misses"] + 1
+    assert miner._cache.stats()["near_hits"] == stats["near_hits"]
+
+
+def test_flat_deadline_without_cache_uses_heuristic(miner):
+    intent = torch.tensor([[2.0, 4.0, 6.0, 8.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]])
+    synapse = NashSynapse(raw_intent=intent)
+    synapse.timeout = 1e-9
+    response = asyncio.run(miner.forward(synapse))
+    # Midpoint of the (price, quantity) pairs present in the intent
+    assert torch.allclose(response.equilibrium_point, torch.tensor([[4.0, 6.0]]))
@@ -0,0 +1,74 @@
+"""
+Variable-party trades: packing, padding invariance and the miner's party path.
+
+    python -m pytest tests/test_parties.py
+"""
+
+import asyncio
+
+import pytest
+import torch
+
+from nash.miner import NashMiner
+from nash.models import PACKED_PARTY_DIM, MultiPartyEncoder, PackedPartyEncoder, pack_parties
+from nash.protocol import MAX_PARTIES, PARTY_FEATURES, NashSynapse
+
+
+TRADES = 4
+
+
+def trades(seed: int = 0):
+    """TRADES trades of 1..TRADES parties, zero-padded to MAX_PARTIES."""
+    generator = torch.Generator().manual_seed(seed)
+    parties = torch.rand(TRADES, MAX_PARTIES, PARTY_FEATURES, generator=generator) + 0.1
+    mask = torch.arange(MAX_PARTIES).unsqueeze(0) < torch.arange(1, TRADES + 1).unsqueeze(1)
+    return parties * mask.unsqueeze(-1), mask
+
+
+def test_padding_does_not_change_packed_rows():
+    parties, mask = trades()
+    # The same trades sent with only as many party slots as the largest needs
+    narrow = pack_parties(parties[:, :TRADES], mask[:, :TRADES])
+    wide = pack_parties(parties, mask)
+
+    assert wide.shape == (TRADES, PACKED_PARTY_DIM)
+    assert torch.equal(narrow, wide)
+
+
+def test_packed_encoder_matches_masked_encoder():
+    torch.manual_seed(0)
+    encoder = MultiPartyEncoder().eval()
+    parties, mask = trades()
+    with torch.no_grad():
+        direct = encoder(parties, mask)
+        packed = PackedPartyEncoder(encoder)(pack_parties(parties, mask))
+        # Each trade encodes the same alone as in the batch
+        alone = encoder(parties[1:2, :2], mask[1:2, :2])
+
+    assert torch.allclose(direct, packed, atol=1e-6)
+    assert torch.allclose(direct[1:2], alone, atol=1e-5)
+
+
+def test_set_parties_infers_mask_and_caps_parties():
+    parties, mask = trades()
+    synapse = NashSynapse()
+    synapse.set_parties(parties)
+    assert torch.equal(synapse.party_mask, mask)
+    assert synapse.num_trades == TRADES
+
+    with pytest.raises(ValueError):
+        NashSynapse().set_parties(torch.rand(1, MAX_PARTIES + 1, PARTY_FEATURES))
+
+
+def test_miner_answers_every_trade():
+    torch.manual_seed(0)
+    miner = NashMiner(enable_batching=False, metrics_port=None)
+    parties, mask = trades()
+    synapse = NashSynapse()
+    synapse.set_parties(parties, mask)
+    response = asyncio.run(miner.forward(synapse))
+
+    with torch.no_grad():
+        expected = miner.solver(miner.party_encoder(parties, mask))
+    assert response.equilibrium_point.shape == (TRADES, 2)
+    assert torch.allclose(response.equilibrium_point, expected, atol=1e-4)
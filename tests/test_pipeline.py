@@ -0,0 +1,55 @@
+"""
+RoundPipeline stages and ScoreAggregator means.
+
+    python -m pytest tests/test_pipeline.py
+"""
+
+import asyncio
+
+import torch
+
+from nash.pipeline import RoundPipeline, ScoreAggregator
+
+
+def test_aggregator_means_over_changing_uids():
+    aggregator = ScoreAggregator(initial_size=2)
+    aggregator.add(torch.tensor([0, 1]), torch.tensor([1.0, 3.0]))
+    # UID 5 grows the storage; UID 1 sits this round out
+    aggregator.add(torch.tensor([0, 5]), torch.tensor([3.0, 4.0]))
+
+    uids, means = aggregator.flush()
+    assert uids == [0, 1, 5]
+    assert torch.equal(means, torch.tensor([2.0, 3.0, 4.0]))
+    assert aggregator.flush()[0] == []
+
+
+def test_pipeline_commits_every_n_rounds():
+    commits = []
+
+    async def query(state):
+        await asyncio.sleep(0)
+        return state
+
+    def score(state):
+        if state == 3:
+            raise ValueError("bad round")
+        return [0, 1], torch.tensor([float(state), 1.0])
+
+    prepared = iter(range(10))
+    pipeline = RoundPipeline(
+        prepare=lambda: next(prepared),
+        query=query,
+        score=score,
+        commit=lambda uids, scores: commits.append((uids, scores)),
+        concurrency=2,
+        commit_every=2,
+        round_interval=0.0,
+    )
+    asyncio.run(pipeline.run(num_rounds=5))
+
+    stats = pipeline.stats()
+    assert stats["rounds_started"] == 5
+    assert stats["rounds_scored"] == 4 and stats["rounds_failed"] == 1
+    # Rounds 0+1 and 2+4 are averaged into one commit each
+    assert stats["commits"] == 2
+    assert [scores[0].item() for _, scores in commits] == [0.5, 3.0]
@@ -0,0 +1,83 @@
+"""
+Compact wire encoding and synapse validation.
+
+    python -m pytest tests/test_protocol.py
+"""
+
+import warnings
+
+import pytest
+import torch
+
+from nash.protocol import MAX_PARTIES, PARTY_FEATURES, NashSynapse
+
+
+TRADES = 5
+MANIFOLD_DIM = 256
+
+
+def round_trip(manifold, equilibrium, wire_format):
+    sender = NashSynapse()
+    sender.encode_compact(manifold, equilibrium, wire_format)
+    receiver = NashSynapse(compact_payload=sender.compact_payload, wire_format=wire_format)
+    return receiver.deserialize()
+
+
+def test_fp16_round_trip():
+    manifold = torch.randn(TRADES, MANIFOLD_DIM, generator=torch.Generator().manual_seed(0))
+    equilibrium = torch.rand(TRADES, 2)
+    decoded, eq = round_trip(manifold, equilibrium, "fp16")
+
+    assert decoded.shape == (TRADES, MANIFOLD_DIM) and decoded.dtype == torch.float32
+    assert torch.allclose(decoded, manifold, atol=1e-2)
+    # Equilibria travel as fp32
+    assert torch.equal(eq, equilibrium)
+
+
+def test_int8_scales_per_row():
+    manifold = torch.randn(TRADES, MANIFOLD_DIM, generator=torch.Generator().manual_seed(1))
+    # One trade a thousand times larger must not flatten the others
+    manifold[0] *= 1000
+    decoded, _ = round_trip(manifold, torch.rand(TRADES, 2), "int8")
+
+    row_max = manifold.abs().amax(dim=1, keepdim=True)
+    assert ((decoded - manifold).abs() <= row_max / 127).all()
+
+
+def test_single_trade_round_trip():
+    manifold, equilibrium = torch.randn(MANIFOLD_DIM), torch.rand(2)
+    decoded, eq = round_trip(manifold, equilibrium, "int8")
+    assert decoded.shape == (1, MANIFOLD_DIM) and eq.shape == (1, 2)
+
+
+def test_decode_does_not_warn():
+    sender = NashSynapse()
+    sender.encode_compact(torch.randn(TRADES, MANIFOLD_DIM), torch.rand(TRADES, 2), "fp16")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        manifold, eq = NashSynapse(compact_payload=sender.compact_payload).deserialize()
+    # The returned tensors are ordinary writable tensors
+    manifold.add_(1)
+    eq.add_(1)
+
+
+def test_decode_rejects_truncated_payload():
+    sender = NashSynapse()
+    sender.encode_compact(torch.randn(TRADES, MANIFOLD_DIM), torch.rand(TRADES, 2), "fp16")
+    sender.compact_payload = sender.compact_payload[:-8]
+    with pytest.raises(ValueError):
+        sender.deserialize()
+
+
+def test_validate_party_synapse_without_intent():
+    synapse = NashSynapse()
+    synapse.set_parties(torch.randn(TRADES, MAX_PARTIES, PARTY_FEATURES))
+    assert synapse.raw_intent is None
+    assert synapse.validate()
+
+
+def test_validate_rejects_empty_party_tensor():
+    synapse = NashSynapse()
+    synapse.set_parties(torch.randn(0, MAX_PARTIES, PARTY_FEATURES))
+    assert not synapse.validate()
+    assert not NashSynapse().validate()
@@ -0,0 +1,53 @@
+"""
+RevealConsumer joins and delivery.
+
+    python -m pytest tests/test_reveals.py
+"""
+
+import numpy as np
+
+from nash.reveals import COMMITMENT_DIM, TARGET_DIM, RevealConsumer, SegmentLog
+
+
+def rows(count: int, width: int, seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).random((count, width), dtype=np.float32)
+
+
+def test_failed_delivery_is_retried(tmp_path):
+    log = SegmentLog(str(tmp_path / "log"))
+    commitments, targets = rows(8, COMMITMENT_DIM, 0), rows(8, TARGET_DIM, 1)
+    log.append_commitments(np.arange(8), commitments)
+    log.flush()
+
+    delivered = []
+    failures = [RuntimeError("trainer busy")]
+
+    def on_samples(batch_commitments, batch_targets):
+        if failures:
+            raise failures.pop()
+        delivered.append((batch_commitments, batch_targets))
+
+    consumer = RevealConsumer(log, str(tmp_path / "consumer.npz"), on_samples, batch_size=4)
+    # Commitments from an earlier poll wait in the join table
+    consumer.poll()
+    assert consumer.stats()["pending_commitments"] == 8
+
+    log.append_reveals(np.arange(8), targets)
+    log.flush()
+    offset = consumer.offset
+    try:
+        consumer.poll()
+    except RuntimeError:
+        pass
+    # Nothing consumed: the joined commitments are still pending
+    assert consumer.offset == offset
+    assert consumer.stats()["pending_commitments"] == 8
+
+    consumer.poll()
+    got_commitments = np.concatenate([c for c, _ in delivered])
+    got_targets = np.concatenate([t for _, t in delivered])
+    assert np.array_equal(got_commitments, commitments)
+    assert np.array_equal(got_targets, targets)
+    assert consumer.stats()["matched"] == 8
+    assert consumer.stats()["pending_commitments"] == 0
+    log.close()
@@ -0,0 +1,73 @@
+"""
+Whole-round scoring: response stacking and the batched fidelity scorer.
+
+    python -m pytest tests/test_scoring.py
+"""
+
+import pytest
+import torch
+
+from nash.validator import FidelityScorer, NashValidator
+
+
+MANIFOLD_DIM = 256
+
+
+@pytest.fixture(scope="module")
+def validator(tmp_path_factory):
+    path = tmp_path_factory.mktemp("scoring")
+    validator = NashValidator(twf_path=str(path / "twf"), reveal_path=str(path / "reveals"), challenge_seed=0)
+    yield validator
+    validator.shutdown()
+
+
+def test_score_batch_matches_per_response_forward():
+    torch.manual_seed(0)
+    scorer = FidelityScorer().eval()
+    intent = torch.randn(1, 10)
+    manifolds, equilibria = torch.randn(6, MANIFOLD_DIM), torch.rand(6, 2)
+
+    with torch.no_grad():
+        batched = scorer.score_batch(intent, manifolds, equilibria)
+        single = torch.cat([scorer(intent, m, e) for m, e in zip(manifolds, equilibria)]).squeeze(1)
+    assert torch.allclose(batched, single, atol=1e-6)
+
+
+def test_score_batch_averages_trades():
+    torch.manual_seed(0)
+    scorer = FidelityScorer().eval()
+    intents = torch.randn(3, 10)
+    manifolds, equilibria = torch.randn(4, 3, MANIFOLD_DIM), torch.rand(4, 3, 2)
+
+    with torch.no_grad():
+        batched = scorer.score_batch(intents, manifolds, equilibria)
+        per_trade = torch.stack([
+            scorer.score_batch(intents[t:t + 1], manifolds[:, t], equilibria[:, t]) for t in range(3)
+        ], dim=1)
+    assert torch.allclose(batched, per_trade.mean(dim=1), atol=1e-6)
+
+
+def test_stack_responses_masks_malformed_rows(validator):
+    good = (torch.randn(2, MANIFOLD_DIM), torch.rand(2, 2))
+    short = (torch.randn(2, 100), torch.rand(2, 2))
+    nan = (torch.full((2, MANIFOLD_DIM), float("nan")), torch.rand(2, 2))
+    wrong_trades = (torch.randn(MANIFOLD_DIM), torch.rand(2))
+    responses = [good, None, short, nan, wrong_trades, (None, None)]
+
+    manifolds, equilibria, valid = validator._stack_responses(responses, trades=2)
+
+    assert valid.tolist() == [True, False, True, False, False, False]
+    # Short manifolds are zero-padded per trade; invalid rows are zeroed
+    assert torch.equal(manifolds[2, :, :100], short[0]) and not manifolds[2, :, 100:].any()
+    assert torch.isfinite(manifolds).all() and not manifolds[3].any()
+    assert torch.equal(equilibria[0], good[1])
+
+
+def test_invalid_responses_score_zero(validator):
+    challenge = torch.randn(1, 10)
+    responses = [(torch.randn(MANIFOLD_DIM), torch.rand(2)), None, (torch.randn(MANIFOLD_DIM), torch.rand(2))]
+    manifolds, equilibria, valid = validator._stack_responses(responses)
+    scores = validator._score_batch(challenge, manifolds, equilibria, valid, torch.rand(32))
+
+    assert scores[1] == 0.0
+    assert (scores[valid] > 0).all()
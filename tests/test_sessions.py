@@ -0,0 +1,109 @@
+"""
+Session warm starts: PiecewiseAffineModel against a cold encoder + solver solve.
+
+    python -m pytest tests/test_sessions.py
+"""
+
+import asyncio
+
+import pytest
+import torch
+import torch.nn as nn
+
+from nash.miner import NashMiner
+from nash.models import EquilibriumSolver, IntentEncoder
+from nash.protocol import NashSynapse
+from nash.sessions import PiecewiseAffineModel, SessionStore, session_key
+
+
+@pytest.fixture(scope="module")
+def networks():
+    torch.manual_seed(0)
+    return IntentEncoder().eval(), EquilibriumSolver().eval()
+
+
+def cold_solve(networks, intent):
+    encoder, solver = networks
+    with torch.no_grad():
+        manifold = encoder(intent.unsqueeze(0))
+        return manifold[0], solver(manifold)[0]
+
+
+def test_linearize_matches_cold_solve(networks):
+    intent = torch.randn(10)
+    state = PiecewiseAffineModel(*networks).linearize(intent)
+    manifold, equilibrium = cold_solve(networks, intent)
+
+    assert torch.allclose(state.manifold, manifold, atol=1e-5)
+    assert torch.allclose(state.equilibrium, equilibrium, atol=1e-5)
+
+
+def test_refine_inside_region_matches_cold_solve(networks):
+    model = PiecewiseAffineModel(*networks)
+    intent = torch.randn(10)
+    state = model.linearize(intent)
+
+    revised = intent + 1e-4 * torch.randn(10)
+    refined = model.refine(state, revised)
+    assert refined is not None
+    manifold, equilibrium = cold_solve(networks, revised)
+    assert torch.allclose(refined[0], manifold, atol=1e-5)
+    assert torch.allclose(refined[1], equilibrium, atol=1e-5)
+
+
+def test_refine_across_region_boundary_declines(networks):
+    model = PiecewiseAffineModel(*networks)
+    intent = torch.randn(10)
+    state = model.linearize(intent)
+
+    assert model.refine(state, -intent) is None
+
+
+def test_non_affine_layers_are_rejected():
+    encoder = nn.Sequential(nn.Linear(10, 8), nn.Tanh(), nn.Linear(8, 256))
+    with pytest.raises(ValueError):
+        PiecewiseAffineModel(encoder, EquilibriumSolver())
+
+
+def test_store_drops_stale_generations_and_evicts_lru(networks):
+    state = PiecewiseAffineModel(*networks).linearize(torch.randn(10))
+    store = SessionStore(capacity=2)
+    store.put("a", state)
+    store.put("b", state)
+    store.get("a", 0)
+    store.put("c", state)
+
+    assert store.get("b", 0) is None and store.evictions == 1
+    assert store.get("a", 1) is None
+    assert len(store) == 1
+
+
+def test_session_key_prefers_session_id():
+    assert session_key({"agent_id": 7, "session_id": "s"}) == ("session_id", "s")
+    assert session_key({"agent_id": 7}) == ("agent_id", "7")
+    assert session_key({"trader": "a"}) is None
+    assert session_key(None) is None
+
+
+def test_miner_warm_starts_revised_session_intent():
+    torch.manual_seed(0)
+    miner = NashMiner(enable_batching=False, metrics_port=None)
+    intent = torch.randn(1, 10)
+    # Far enough to miss the exact cache (1e-3 quantization), close enough to stay in region
+    revised = intent + 1e-2
+
+    async def main():
+        await miner.forward(NashSynapse(raw_intent=intent, context={"session_id": "s"}))
+        # Linearization runs on the session thread after the first answer
+        for _ in range(200):
+            if len(miner._sessions):
+                break
+            await asyncio.sleep(0.01)
+        return await miner.forward(NashSynapse(raw_intent=revised, context={"session_id": "s"}))
+
+    response = asyncio.run(main())
+
+    assert miner._sessions.stats()["hits"] == 1
+    with torch.no_grad():
+        expected = miner.solver(miner.encoder(revised))
+    assert torch.allclose(response.equilibrium_point, expected, atol=1e-5)
@@ -0,0 +1,40 @@
+"""
+Smoke test for the in-process subnet simulation.
+
+    python -m pytest tests/test_simulate.py
+"""
+
+import asyncio
+
+from benchmarks.simulate import simulate
+
+
+MINERS = 20
+VALIDATORS = 2
+ROUNDS = 2
+
+
+def test_small_subnet_runs_end_to_end():
+    results = asyncio.run(simulate(
+        miners=MINERS,
+        validators=VALIDATORS,
+        rounds=ROUNDS,
+        slow=0.2,
+        malicious=0.1,
+        sybil=0.2,
+        drop_rate=0.0,
+        latency_ms=1.0,
+        slow_ms=5000.0,
+        query_timeout=0.5,
+        concurrency=2,
+    ))
+
+    assert results["config"]["profiles"] == {"honest": 10, "slow": 4, "malicious": 2, "sybil": 4}
+    assert results["transport"]["queries"] == VALIDATORS * ROUNDS * MINERS
+    for validator in results["validators"]:
+        assert validator["pipeline"]["rounds_scored"] == ROUNDS
+        assert validator["weight_commits"] >= 1
+        share = validator["emission_share"]
+        assert abs(sum(share.values()) - 1.0) < 1e-4
+        # Slow miners never answer inside the deadline
+        assert share["slow"] == 0.0
@@ -0,0 +1,87 @@
+"""
+Streaming as-completed scoring against a dendrite with per-miner delays.
+
+    python -m pytest tests/test_streaming.py
+"""
+
+import asyncio
+
+import pytest
+import torch
+
+from nash.protocol import NashSynapse
+from nash.validator import NashValidator, ValidationRound
+
+
+MANIFOLD_DIM = 256
+# Seconds each miner takes to answer; the last two miss the deadline
+DELAYS = [0.0, 0.01, 0.02, 0.03, 0.04, 5.0, 5.0]
+QUERY_TIMEOUT = 0.5
+
+
+class DelayedDendrite:
+    """Answers axon i after DELAYS[i] seconds with a fixed random response."""
+
+    def __init__(self):
+        generator = torch.Generator().manual_seed(0)
+        self.responses = [
+            (torch.randn(MANIFOLD_DIM, generator=generator), torch.rand(2, generator=generator))
+            for _ in DELAYS
+        ]
+        self.cancelled = 0
+
+    async def call(self, target_axon, synapse, timeout, deserialize=True):
+        try:
+            await asyncio.sleep(DELAYS[target_axon])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self.responses[target_axon]
+
+
+@pytest.fixture(scope="module")
+def validator(tmp_path_factory):
+    path = tmp_path_factory.mktemp("streaming")
+    validator = NashValidator(twf_path=str(path / "twf"), reveal_path=str(path / "reveals"), challenge_seed=0)
+    validator.query_timeout = QUERY_TIMEOUT
+    validator.stream_batch_size = 2
+    yield validator
+    validator.shutdown()
+
+
+def round_state(challenge):
+    return ValidationRound(
+        uids=list(range(len(DELAYS))),
+        axons=list(range(len(DELAYS))),
+        challenge=challenge,
+        commitments=torch.rand(32),
+        synapse=NashSynapse(raw_intent=challenge),
+        started=0.0,
+    )
+
+
+def test_streaming_matches_whole_round_scoring(validator, monkeypatch):
+    dendrite = DelayedDendrite()
+    monkeypatch.setattr(validator, "dendrite", dendrite)
+    batches = []
+    score_arrivals = validator._score_arrivals
+    monkeypatch.setattr(
+        validator, "_score_arrivals",
+        lambda arrived, state: (batches.append(len(arrived)), score_arrivals(arrived, state))
+    )
+    challenge = torch.randn(1, 10)
+
+    state = asyncio.run(validator._query_and_score_streaming(round_state(challenge)))
+
+    # On-time responses were scored in micro-batches of at most stream_batch_size
+    assert sum(batches) == 5 and max(batches) <= 2
+    # Late miners were cancelled at the deadline and score 0 with no latency
+    assert dendrite.cancelled == 2
+    assert state.valid.tolist() == [True] * 5 + [False] * 2
+    assert torch.isnan(state.latencies[5:]).all() and not torch.isnan(state.latencies[:5]).any()
+
+    on_time = dendrite.responses[:5] + [None, None]
+    manifolds, equilibria, valid = validator._stack_responses(on_time)
+    expected = validator._score_batch(challenge, manifolds, equilibria, valid, state.commitments)
+    assert torch.allclose(state.scores, expected, atol=1e-6)
+    assert torch.equal(state.manifolds, manifolds)
@@ -0,0 +1,65 @@
+"""
+Recall of SybilDetector on a full-size round with planted duplicates.
+
+    python -m pytest tests/test_sybil.py
+"""
+
+import torch
+
+from nash.sybil import SYBIL_PMU, SybilDetector
+
+
+MINERS = 4096
+PLANTED = 200
+
+
+def planted_round(noise: float, seed: int = 0):
+    """4096 random responses; the last PLANTED rows are noisy copies of the first PLANTED."""
+    generator = torch.Generator().manual_seed(seed)
+    manifolds = torch.randn(MINERS, 256, generator=generator)
+    equilibria = torch.rand(MINERS, 2, generator=generator) + 0.5
+    copies = slice(MINERS - PLANTED, MINERS)
+    manifolds[copies] = manifolds[:PLANTED] * (1 + noise * torch.randn(PLANTED, 256, generator=generator))
+    equilibria[copies] = equilibria[:PLANTED] * (1 + noise * torch.randn(PLANTED, 2, generator=generator))
+    return manifolds, equilibria, torch.ones(MINERS, dtype=torch.bool)
+
+
+def test_recall_exact_duplicates():
+    manifolds, equilibria, valid = planted_round(noise=0.0)
+    cluster_ids, cluster_sizes = SybilDetector().cluster(manifolds, equilibria, valid)
+
+    found = (cluster_ids[:PLANTED] == cluster_ids[-PLANTED:]).sum().item()
+    assert found == PLANTED
+    # Random responses stay singletons
+    assert (cluster_sizes[PLANTED:MINERS - PLANTED] == 1).all()
+
+
+def test_recall_near_duplicates():
+    manifolds, equilibria, valid = planted_round(noise=0.02)
+    detector = SybilDetector()
+    cluster_ids, cluster_sizes = detector.cluster(manifolds, equilibria, valid)
+
+    found = (cluster_ids[:PLANTED] == cluster_ids[-PLANTED:]).sum().item()
+    assert found >= 0.95 * PLANTED
+    assert (cluster_sizes[PLANTED:MINERS - PLANTED] == 1).all()
+    assert (SybilDetector.pmu(cluster_sizes)[-PLANTED:] == SYBIL_PMU).float().mean() >= 0.95
+
+
+def test_oversized_bucket_is_still_one_cluster():
+    # Every response is the same answer: one bucket far above max_bucket
+    manifolds = torch.ones(MINERS, 256)
+    equilibria = torch.ones(MINERS, 2)
+    valid = torch.ones(MINERS, dtype=torch.bool)
+    cluster_ids, cluster_sizes = SybilDetector(max_bucket=16).cluster(manifolds, equilibria, valid)
+
+    assert (cluster_ids == 0).all()
+    assert (cluster_sizes == MINERS).all()
+
+
+def test_invalid_rows_are_never_clustered():
+    manifolds, equilibria, valid = planted_round(noise=0.0)
+    valid[-PLANTED:] = False
+    cluster_ids, cluster_sizes = SybilDetector().cluster(manifolds, equilibria, valid)
+
+    assert (cluster_ids[-PLANTED:] == -1).all()
+    assert (cluster_sizes[:PLANTED] == 1).all()
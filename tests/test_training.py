@@ -0,0 +1,34 @@
+"""
+BackgroundTrainer shutdown.
+
+    python -m pytest tests/test_training.py
+"""
+
+import time
+
+import torch
+from torch import nn
+
+from nash.training import BackgroundTrainer, ReplayBuffer
+
+
+def test_stop_writes_final_checkpoint(tmp_path):
+    buffer = ReplayBuffer(capacity=1024, input_dim=8, target_dim=2)
+    buffer.add(torch.randn(512, 8), torch.randn(512, 2))
+    path = tmp_path / "model.pt"
+    trainer = BackgroundTrainer(
+        nn.Linear(8, 2), buffer, on_update=lambda state, seen: None,
+        batch_size=64, min_samples=64, checkpoint_path=str(path), checkpoint_every=10_000,
+    )
+    trainer.start()
+    deadline = time.monotonic() + 10
+    while trainer.steps == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    trainer.stop()
+    assert trainer.steps > 0
+
+    # checkpoint_every was never reached, so this is the final checkpoint
+    saved = torch.load(path)
+    assert saved["steps"] == trainer.steps
+    # A second stop is a no-op
+    trainer.stop()
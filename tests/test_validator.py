@@ -0,0 +1,24 @@
+"""
+NashValidator construction with reduced-precision scoring.
+
+    python -m pytest tests/test_validator.py
+"""
+
+from nash.validator import NashValidator
+
+
+def test_reduced_precision_starts_threads_after_calibration(tmp_path):
+    validator = NashValidator(
+        precision="bf16",
+        twf_path=str(tmp_path / "twf"),
+        reveal_path=str(tmp_path / "reveals"),
+        challenge_seed=0,
+    )
+    try:
+        info = validator.get_scorer_info()
+        assert info["precision"] in ("bf16", "fp32")
+        assert validator.trainer._thread.is_alive()
+        # A reload installs through self.precision, which is set by now
+        validator._install_commitment_model(validator.trainer.model.state_dict())
+    finally:
+        validator.shutdown()
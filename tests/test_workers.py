@@ -0,0 +1,93 @@
+"""
+InferencePool: spawned workers, deadlines and hot reloads.
+
+    python -m pytest tests/test_workers.py
+"""
+
+import time
+
+import pytest
+import torch
+
+from nash.models import PACKED_PARTY_DIM, EquilibriumSolver, IntentEncoder, MultiPartyEncoder, PackedPartyEncoder
+from nash.workers import InferencePool
+
+
+def make_models(seed: int):
+    torch.manual_seed(seed)
+    return IntentEncoder().eval(), EquilibriumSolver().eval(), PackedPartyEncoder(MultiPartyEncoder()).eval()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    encoder, solver, party_encoder = make_models(0)
+    pool = InferencePool(
+        encoder, solver, workers=2, slot_rows=8,
+        party_encoder=party_encoder, party_dim=PACKED_PARTY_DIM, timeout=30.0,
+    )
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+def reference(encoder, solver, intent):
+    with torch.no_grad():
+        manifold = encoder(intent)
+        return manifold, solver(manifold)
+
+
+def test_workers_match_in_process(pool):
+    encoder, solver, party_encoder = make_models(0)
+    # 20 rows span three slots, so both workers serve part of the batch
+    intent = torch.randn(20, 10)
+    manifold, equilibrium = pool.run(intent)
+    expected_manifold, expected_equilibrium = reference(encoder, solver, intent)
+    assert torch.allclose(manifold, expected_manifold, atol=1e-5)
+    assert torch.allclose(equilibrium, expected_equilibrium, atol=1e-5)
+
+    packed = torch.rand(3, PACKED_PARTY_DIM)
+    manifold, _ = pool.run(packed)
+    assert torch.allclose(manifold, reference(party_encoder, solver, packed)[0], atol=1e-5)
+    assert pool.stats()["alive"] == 2
+
+
+def test_reloads_switch_models(pool):
+    intent = torch.randn(4, 10)
+    for seed in (1, 2):
+        encoder, solver, party_encoder = make_models(seed)
+        pool.update_weights(encoder, solver, party_encoder)
+        _, equilibrium = pool.run(intent)
+        assert torch.allclose(equilibrium, reference(encoder, solver, intent)[1], atol=1e-5)
+
+
+def test_batch_larger_than_every_slot(pool):
+    rows = 2 * pool.num_slots * pool.slot_rows
+    _, equilibrium = pool.run(torch.randn(rows, 10))
+    assert equilibrium.shape == (rows, 2)
+
+
+def test_caller_deadline_bounds_the_wait():
+    # Never started, so no result ever arrives
+    encoder, solver, _ = make_models(0)
+    idle = InferencePool(encoder, solver, workers=1, timeout=30.0)
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        idle.run(torch.randn(4, 10), timeout=0.05)
+    assert time.monotonic() - start < 5.0
+    assert idle.stats()["timeouts"] == 1
+
+
+def test_reload_waits_for_requests_on_the_standby_copy():
+    encoder, solver, _ = make_models(0)
+    idle = InferencePool(encoder, solver, workers=1, timeout=0.2)
+    # In flight on copy 0 (nothing serves it, so it stays there)
+    slot, _ = idle._submit(torch.randn(2, 10), 0, time.monotonic() + 1.0)
+
+    idle.update_weights(*make_models(1)[:2])
+    # The next reload would overwrite copy 0 under that request
+    with pytest.raises(TimeoutError):
+        idle.update_weights(*make_models(2)[:2])
+
+    idle._release(slot)
+    idle.update_weights(*make_models(2)[:2])
+    assert idle.reloads == 2